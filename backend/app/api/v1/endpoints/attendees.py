@@ -2,24 +2,37 @@
 Attendee endpoints for the API.
 """
 
+import math
 from typing import List, Annotated, Optional
-from fastapi import APIRouter, Depends, HTTPException, Path, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.db.database import get_read_db, lane_session
+from app.db.lanes import DatabaseBusyError, write_lane
 from app.services.attendee import AttendeeService
 from app.services.exceptions import (
     AttendeeNotFoundError,
     AttendeeAlreadyRegisteredError,
+    AttendeeAlreadyWaitlistedError,
+    AttendeeWaitlistedError,
     EventNotFoundError,
-    EventCapacityExceededError
+    EventCapacityExceededError,
+    InvalidQueueTicketError,
+    QueueTicketNotAdmittedError,
+    QueueTicketRequiredError
 )
+from app.services.waiting_room import QUEUE_TICKET_HEADER, waiting_rooms
 from app.schemas.attendee import (
     AttendeeBase,
-    AttendeeResponse
+    AttendeeResponse,
+    BulkRegistrationRequest,
+    BulkRegistrationResponse
 )
 
 from app.schemas.base import PaginationParams, SuccessResponse, PaginatedResponse
+from app.schemas.fields import parse_fields, project
+from app.schemas.waitlist import WaitlistEntryResponse
 
 router = APIRouter()
 
@@ -28,28 +41,52 @@ router = APIRouter()
 async def get_event_attendees(
     event_id: Annotated[int, Path(description="Event ID")],
     pagination: PaginationParams = Depends(),
-    db: AsyncSession = Depends(get_db)
+    fields: Annotated[
+        Optional[str],
+        Query(description="Comma-separated fields to return, e.g. id,name")
+    ] = None,
+    db: AsyncSession = Depends(get_read_db)
 ) -> PaginatedResponse[AttendeeResponse]:
     """
     Get all attendees for a specific event.
 
+    With ``fields`` only those fields are read and returned.
+
     Args:
         event_id: Event ID
         pagination: Pagination parameters
+        fields: Comma-separated fields to return
         db: Database session
 
     Returns:
         PaginatedResponse[AttendeeResponse]: Paginated list of attendees
 
     Raises:
-        HTTPException: If event not found
+        HTTPException: If event not found or ``fields`` names an unknown field
     """
+    try:
+        selected = parse_fields(fields, AttendeeResponse)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
     
     service = AttendeeService(db)
     
     try:
-        attendees, total = await service.get_event_attendees(event_id, pagination)
+        attendees, total = await service.get_event_attendees(event_id, pagination, selected)
         
+        if selected:
+            return JSONResponse(
+                content=PaginatedResponse.create(
+                    data=[project(attendee, selected) for attendee in attendees],
+                    page=pagination.page,
+                    size=pagination.size,
+                    total=total,
+                    message="Attendees retrieved successfully"
+                ).model_dump(mode="json")
+            )
         return PaginatedResponse.create(
             data=[AttendeeResponse.model_validate(attendee) for attendee in attendees],
             page=pagination.page,
@@ -69,45 +106,95 @@ async def get_event_attendees(
         )
 
 
-@router.post("/", response_model=SuccessResponse[AttendeeResponse], status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    response_model=SuccessResponse[AttendeeResponse],
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "model": SuccessResponse[WaitlistEntryResponse],
+            "description": "Event is full; the registrant was added to its waitlist"
+        }
+    }
+)
 async def register_attendee(
     event_id: Annotated[int, Path(description="Event ID")],
     attendee_data: AttendeeBase,
-    db: AsyncSession = Depends(get_db)
+    queue_ticket: Annotated[Optional[str], Header(alias=QUEUE_TICKET_HEADER)] = None
 ) -> SuccessResponse[AttendeeResponse]:
     """
     Register a new attendee for an event.
     
+    If the event's waiting room is active, an admitted queue ticket must be
+    sent in the ``X-Queue-Ticket`` header. The ticket is checked before a
+    database slot is taken, so queued clients never contend for the event.
+    
+    If the event is full the registrant joins its waitlist and the API
+    answers ``202`` with the waitlist entry instead of rejecting them.
+    
     Args:
         event_id: Event ID
         attendee_data: Attendee registration data
-        db: Database session
+        queue_ticket: Waiting room ticket
         
     Returns:
         SuccessResponse[AttendeeResponse]: Registered attendee
         
     Raises:
-        HTTPException: If validation fails, event not found, or capacity exceeded
+        HTTPException: If validation fails, event not found, capacity exceeded
+            or the queue ticket is missing, invalid or not yet admitted
     """
-    service = AttendeeService(db)
-    
     try:
-        attendee = await service.register_attendee(event_id, attendee_data)
+        queue_claim = await waiting_rooms.admit(event_id, queue_ticket)
+        async with lane_session(write_lane) as db:
+            await waiting_rooms.claim(db, event_id, queue_claim)
+            attendee = await AttendeeService(db).register_attendee(event_id, attendee_data)
         return SuccessResponse(
             data=AttendeeResponse.model_validate(attendee),
             message="Attendee registered successfully"
         )
+    except DatabaseBusyError:
+        raise
+    except QueueTicketRequiredError as e:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail=str(e)
+        )
+    except InvalidQueueTicketError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    except QueueTicketNotAdmittedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
     except EventNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
+    except AttendeeWaitlistedError as e:
+        entry = WaitlistEntryResponse(
+            id=e.entry.id,
+            name=e.entry.name,
+            email=e.entry.email,
+            event_id=e.entry.event_id,
+            position=e.position,
+            created_at=e.entry.created_at
+        )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=SuccessResponse(data=entry, message=str(e)).model_dump(mode="json")
+        )
     except EventCapacityExceededError as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
-    except AttendeeAlreadyRegisteredError as e:
+    except (AttendeeAlreadyRegisteredError, AttendeeAlreadyWaitlistedError) as e:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
@@ -117,3 +204,118 @@ async def register_attendee(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
         )
+
+
+@router.post("/bulk", response_model=SuccessResponse[BulkRegistrationResponse])
+async def register_attendees_bulk(
+    event_id: Annotated[int, Path(description="Event ID")],
+    request: BulkRegistrationRequest,
+    queue_ticket: Annotated[Optional[str], Header(alias=QUEUE_TICKET_HEADER)] = None
+) -> SuccessResponse[BulkRegistrationResponse]:
+    """
+    Register many attendees for an event in one request.
+    
+    Attendees are registered in request order while seats last; the rest
+    are waitlisted. Duplicates (already registered, already waitlisted or
+    repeated in the request) are reported per attendee without failing
+    the batch. The whole batch uses one queue ticket when the event's
+    waiting room is active.
+    
+    Args:
+        event_id: Event ID
+        request: Attendees to register
+        queue_ticket: Waiting room ticket
+        
+    Returns:
+        SuccessResponse[BulkRegistrationResponse]: Outcome per attendee
+        
+    Raises:
+        HTTPException: If event not found or the queue ticket is missing,
+            invalid or not yet admitted
+    """
+    try:
+        queue_claim = await waiting_rooms.admit(event_id, queue_ticket)
+        async with lane_session(write_lane) as db:
+            await waiting_rooms.claim(db, event_id, queue_claim)
+            results = await AttendeeService(db).register_attendees_bulk(event_id, request.attendees)
+        registered = sum(1 for result in results if result.status == "registered")
+        waitlisted = sum(1 for result in results if result.status == "waitlisted")
+        return SuccessResponse(
+            data=BulkRegistrationResponse(
+                registered=registered,
+                waitlisted=waitlisted,
+                rejected=len(results) - registered - waitlisted,
+                results=results
+            ),
+            message=f"Registered {registered} of {len(results)} attendees"
+        )
+    except DatabaseBusyError:
+        raise
+    except QueueTicketRequiredError as e:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail=str(e)
+        )
+    except InvalidQueueTicketError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    except QueueTicketNotAdmittedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+    except EventNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.delete("/{attendee_id}", response_model=SuccessResponse[None])
+async def cancel_registration(
+    event_id: Annotated[int, Path(description="Event ID")],
+    attendee_id: Annotated[int, Path(description="Attendee ID")]
+) -> SuccessResponse[None]:
+    """
+    Cancel an attendee's registration.
+    
+    The freed seat is given to the next registrant on the event's
+    waitlist, if any.
+    
+    Args:
+        event_id: Event ID
+        attendee_id: Attendee ID
+        
+    Returns:
+        SuccessResponse[None]: Confirmation message
+        
+    Raises:
+        HTTPException: If the attendee is not registered for the event
+    """
+    try:
+        async with lane_session(write_lane) as db:
+            promoted = await AttendeeService(db).cancel_registration(event_id, attendee_id)
+        message = "Registration cancelled"
+        if promoted:
+            message += f"; promoted {len(promoted)} attendee from the waitlist"
+        return SuccessResponse(message=message)
+    except DatabaseBusyError:
+        raise
+    except AttendeeNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
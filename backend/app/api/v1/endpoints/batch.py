@@ -0,0 +1,152 @@
+"""
+Batch endpoint for running several API requests in one round trip.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from fastapi import APIRouter, Request
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.schemas.batch import BatchRequest, BatchResponse, BatchSubRequest, BatchSubResponse
+from app.schemas.base import SuccessResponse
+
+logger = get_logger(__name__)
+
+router = APIRouter()
+
+# Outer request headers that describe the batch itself rather than each request
+ENVELOPE_HEADERS = {b"content-length", b"content-type", b"transfer-encoding", b"idempotency-key", b"x-request-id"}
+
+
+def _sub_scope(request: Request, sub: BatchSubRequest, body: bytes) -> Dict[str, Any]:
+    path, _, query = sub.path.partition("?")
+    path = f"{settings.API_PREFIX}/{settings.API_VERSION}{path}"
+
+    headers: List[Tuple[bytes, bytes]] = [
+        (name, value) for name, value in request.scope["headers"] if name not in ENVELOPE_HEADERS
+    ]
+    extra = {name.lower().encode("latin-1"): value.encode("latin-1") for name, value in sub.headers.items()}
+    headers = [(name, value) for name, value in headers if name not in extra] + list(extra.items())
+    if body:
+        headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+
+    scope = {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": sub.method,
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": headers,
+    }
+    if "state" in request.scope:
+        scope["state"] = dict(request.scope["state"])
+    return scope
+
+
+async def _call(request: Request, sub: BatchSubRequest) -> BatchSubResponse:
+    """Run one request through the whole application and capture its response."""
+    body = json.dumps(sub.body).encode() if sub.body is not None else b""
+    scope = _sub_scope(request, sub, body)
+    response_complete = asyncio.Event()
+    request_sent = False
+    status: Optional[int] = None
+    headers: Dict[str, str] = {}
+    chunks: List[bytes] = []
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Nothing more to read; the client "disconnects" once the response is done
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            for name, value in message.get("headers", []):
+                if name.lower() != b"content-length":
+                    headers[name.decode("latin-1")] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                response_complete.set()
+
+    try:
+        await request.app(scope, receive, send)
+    except Exception as e:
+        # The error middleware has already sent a 500 if it could
+        logger.error(f"Batch request {sub.method} {sub.path} failed: {e}")
+        if status is None:
+            status, chunks = 500, []
+    finally:
+        response_complete.set()
+
+    content = b"".join(chunks)
+    decoded: Optional[Any] = None
+    if content:
+        if headers.get("content-type", "").startswith("application/json"):
+            decoded = json.loads(content)
+        else:
+            decoded = content.decode("utf-8", errors="replace")
+    return BatchSubResponse(status=status, headers=headers, body=decoded)
+
+
+async def _run(request: Request, sub: BatchSubRequest) -> BatchSubResponse:
+    """Run one request, following a trailing-slash redirect within the API."""
+    response = await _call(request, sub)
+    location = response.headers.get("location")
+    if response.status in (307, 308) and location:
+        target = urlsplit(location)
+        prefix = f"{settings.API_PREFIX}/{settings.API_VERSION}"
+        if target.path.startswith(prefix + "/"):
+            path = target.path[len(prefix):] + (f"?{target.query}" if target.query else "")
+            response = await _call(request, sub.model_copy(update={"path": path}))
+    return response
+
+
+@router.post("/", response_model=SuccessResponse[BatchResponse])
+async def run_batch(batch: BatchRequest, request: Request) -> SuccessResponse[BatchResponse]:
+    """
+    Run several API requests concurrently and return all their responses.
+
+    Each request goes through the full middleware stack, so rate limits,
+    waiting rooms and idempotency keys apply to it exactly as if it had
+    been sent on its own. At most ``BATCH_MAX_CONCURRENCY`` of a batch's
+    requests run at once; concurrent event lookups among them share one
+    query and identical reads share one call. A failing request does not
+    fail the batch: its status is reported in its own response.
+
+    Args:
+        batch: Requests to run
+        request: The incoming batch request
+
+    Returns:
+        SuccessResponse[BatchResponse]: One response per request, in order
+    """
+    slots = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
+
+    async def run_one(sub: BatchSubRequest) -> BatchSubResponse:
+        async with slots:
+            return await _run(request, sub)
+
+    responses = await asyncio.gather(*(run_one(sub) for sub in batch.requests))
+    metrics.increment("batch.requests")
+    metrics.increment("batch.sub_requests", len(responses))
+    return SuccessResponse(
+        data=BatchResponse(responses=responses),
+        message="Batch completed"
+    )
@@ -2,66 +2,178 @@
 Event endpoints for the API.
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.core.config import settings
+from app.db.database import get_read_db, get_write_db, lane_session
+from app.db.lanes import DatabaseBusyError, read_lane
+from app.models.event import Event
+from app.services.capacity_feed import capacity_broadcaster
+from app.services.catalog import event_catalog
 from app.services.event import EventService
 from app.services.exceptions import (
     EventAlreadyExistsError,
     EventValidationError
 )
 from app.schemas.event import (
+    EventBatchResponse,
     EventCreate,
     EventResponse
 )
 from app.schemas.base import SuccessResponse
+from app.schemas.fields import parse_fields, project
 
 router = APIRouter()
 
 
 @router.get("/", response_model=SuccessResponse[List[EventResponse]])
 async def get_events(
-    db: AsyncSession = Depends(get_db)
+    fields: Annotated[
+        Optional[str],
+        Query(description="Comma-separated fields to return, e.g. id,name,available_spots")
+    ] = None
 ) -> SuccessResponse[List[EventResponse]]:
     """
     Get all upcoming events.
     
+    Served from the in-memory event catalog when it is enabled, so the
+    request does not touch the database. With ``fields`` only those
+    fields are returned, and only the columns they need are read.
+    
     Args:
-        db: Database session
-        
+        fields: Comma-separated fields to return
+    
     Returns:
         SuccessResponse[List[EventResponse]]: List of events
+        
+    Raises:
+        HTTPException: If ``fields`` names an unknown field
     """
-    service = EventService(db)
+    try:
+        selected = parse_fields(fields, EventResponse)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
     
     try:
-        events = await service.get_upcoming_events()
+        if settings.CATALOG_ENABLED:
+            events = event_catalog.get_upcoming_events()
+        else:
+            async with lane_session(read_lane) as db:
+                events = await EventService(db).get_upcoming_events(selected)
         
-        # Convert events to response format
-        event_responses = []
-        for event in events:
-            event_dict = {
-                "id": event.id,
-                "name": event.name,
-                "location": event.location,
-                "start_time": event.start_time,
-                "end_time": event.end_time,
-                "max_capacity": event.max_capacity,
-                "current_attendees": event.current_attendees,
-                "created_at": event.created_at,
-                "updated_at": event.updated_at,
-                "is_full": event.is_full,
-                "available_spots": event.available_spots,
-                "capacity_percentage": event.capacity_percentage
-            }
-            event_responses.append(EventResponse(**event_dict))
+        if selected:
+            return JSONResponse(
+                content=SuccessResponse(
+                    data=[project(event, selected, Event) for event in events],
+                    message="Events retrieved successfully"
+                ).model_dump(mode="json")
+            )
+        return SuccessResponse(
+            data=[EventResponse.model_validate(event) for event in events],
+            message="Events retrieved successfully"
+        )
+    except DatabaseBusyError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {"text/event-stream": {}}}}
+)
+async def stream_capacity(
+    event_ids: Annotated[
+        Optional[List[int]],
+        Query(description="Only report these events, e.g. ?event_ids=1&event_ids=2")
+    ] = None,
+    last_event_id: Annotated[Optional[str], Header(alias="Last-Event-ID")] = None
+) -> StreamingResponse:
+    """
+    Stream live capacity changes as Server-Sent Events.
+    
+    Sends a ``snapshot`` of the upcoming events' capacity first, then a
+    ``capacity`` message whenever any of them change. Every connection
+    shares one broadcaster fed by the event catalog, so open streams cost
+    no queries.
+    
+    Args:
+        event_ids: Only report these events
+        last_event_id: ID of the last message received before reconnecting
         
+    Returns:
+        StreamingResponse: ``text/event-stream`` response
+        
+    Raises:
+        HTTPException: If the feed is disabled or has too many subscribers
+    """
+    if not settings.CAPACITY_FEED_ENABLED:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Capacity feed is disabled"
+        )
+    if capacity_broadcaster.is_full():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many capacity feed subscribers",
+            headers={"Retry-After": str(settings.LOAD_SHED_RETRY_AFTER_SECONDS)}
+        )
+    
+    return StreamingResponse(
+        capacity_broadcaster.stream(event_ids, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/batch", response_model=SuccessResponse[EventBatchResponse])
+async def get_events_batch(
+    ids: Annotated[List[int], Query(min_length=1, description="Event IDs, e.g. ?ids=1&ids=2")],
+    db: AsyncSession = Depends(get_read_db)
+) -> SuccessResponse[EventBatchResponse]:
+    """
+    Get several events by ID in one request.
+    
+    Lookups from concurrent requests are batched into a single query.
+    
+    Args:
+        ids: Event IDs
+        db: Database session
+        
+    Returns:
+        SuccessResponse[EventBatchResponse]: Events found in request order
+        and the IDs that have no event
+        
+    Raises:
+        HTTPException: If too many IDs are requested
+    """
+    if len(ids) > settings.EVENT_BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {settings.EVENT_BATCH_MAX_IDS} event IDs can be requested at once"
+        )
+    
+    try:
+        events, missing = await EventService(db).get_events(ids)
         return SuccessResponse(
-            data=event_responses,
+            data=EventBatchResponse(
+                events=[EventResponse.model_validate(event) for event in events],
+                missing=missing
+            ),
             message="Events retrieved successfully"
         )
+    except DatabaseBusyError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -72,7 +184,7 @@ async def get_events(
 @router.post("/", response_model=SuccessResponse[EventResponse], status_code=status.HTTP_201_CREATED)
 async def create_event(
     event_data: EventCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_write_db)
 ) -> SuccessResponse[EventResponse]:
     """
     Create a new event.
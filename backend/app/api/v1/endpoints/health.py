@@ -0,0 +1,67 @@
+"""
+Liveness and readiness endpoints for load balancers and orchestrators.
+"""
+
+from datetime import datetime, timezone
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.schemas.base import HealthCheck
+from app.services.catalog import event_catalog
+from app.services.warmup import READY, warmup
+
+router = APIRouter()
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@router.get("/live", response_model=HealthCheck)
+async def liveness() -> HealthCheck:
+    """
+    Report that the process is up and serving requests.
+
+    Never touches the database, so a slow or unavailable database does
+    not get a healthy worker restarted.
+
+    Returns:
+        HealthCheck: Always ``alive``
+    """
+    return HealthCheck(
+        status="alive",
+        version=settings.API_VERSION,
+        timestamp=_timestamp(),
+        database="unchecked",
+        dependencies={"warmup": warmup.status}
+    )
+
+
+@router.get("/ready", response_model=HealthCheck, responses={503: {"model": HealthCheck}})
+async def readiness() -> JSONResponse:
+    """
+    Report whether the worker should receive traffic.
+
+    The worker is ready once its warm-up has finished and the database
+    answers. The database check is cached for ``HEALTH_DB_CACHE_SECONDS``.
+
+    Returns:
+        JSONResponse: 200 when ready, 503 otherwise
+    """
+    database = await warmup.database_status()
+    ready = warmup.status == READY and database == "ok"
+    dependencies = {
+        "warmup": warmup.status,
+        "catalog": "loaded" if event_catalog.loaded else "not loaded",
+    }
+    dependencies.update({f"warmup.{step}": "failed" for step in warmup.failures})
+    health = HealthCheck(
+        status="ready" if ready else "not ready",
+        version=settings.API_VERSION,
+        timestamp=_timestamp(),
+        database=database,
+        dependencies=dependencies
+    )
+    return JSONResponse(status_code=200 if ready else 503, content=health.model_dump(mode="json"))
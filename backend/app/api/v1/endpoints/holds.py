@@ -0,0 +1,179 @@
+"""
+Seat hold endpoints for the API.
+"""
+
+import math
+from typing import Annotated, Optional
+from fastapi import APIRouter, Header, HTTPException, Path, status
+
+from app.db.database import lane_session
+from app.db.lanes import DatabaseBusyError, write_lane
+from app.services.attendee import AttendeeService
+from app.services.exceptions import (
+    AttendeeAlreadyRegisteredError,
+    EventCapacityExceededError,
+    EventNotFoundError,
+    InvalidQueueTicketError,
+    QueueTicketNotAdmittedError,
+    QueueTicketRequiredError,
+    SeatHoldNotFoundError
+)
+from app.services.waiting_room import QUEUE_TICKET_HEADER, waiting_rooms
+from app.schemas.attendee import AttendeeBase, AttendeeResponse
+from app.schemas.base import SuccessResponse
+from app.schemas.seat_hold import SeatHoldResponse
+
+router = APIRouter()
+
+
+@router.post("/", response_model=SuccessResponse[SeatHoldResponse], status_code=status.HTTP_201_CREATED)
+async def hold_seat(
+    event_id: Annotated[int, Path(description="Event ID")],
+    queue_ticket: Annotated[Optional[str], Header(alias=QUEUE_TICKET_HEADER)] = None
+) -> SuccessResponse[SeatHoldResponse]:
+    """
+    Hold a seat on an event during checkout.
+
+    The seat counts against the event's capacity until the hold is
+    confirmed, released or expires. Like a registration, it needs an
+    admitted queue ticket while the event's waiting room is active.
+
+    Args:
+        event_id: Event ID
+        queue_ticket: Waiting room ticket
+
+    Returns:
+        SuccessResponse[SeatHoldResponse]: Hold token and expiry
+
+    Raises:
+        HTTPException: If event not found, capacity exceeded or the queue
+            ticket is missing, invalid or not yet admitted
+    """
+    try:
+        queue_claim = await waiting_rooms.admit(event_id, queue_ticket)
+        async with lane_session(write_lane) as db:
+            await waiting_rooms.claim(db, event_id, queue_claim)
+            hold = await AttendeeService(db).hold_seat(event_id)
+        return SuccessResponse(
+            data=SeatHoldResponse.model_validate(hold),
+            message="Seat held successfully"
+        )
+    except DatabaseBusyError:
+        raise
+    except QueueTicketRequiredError as e:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail=str(e)
+        )
+    except InvalidQueueTicketError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+    except QueueTicketNotAdmittedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+    except EventNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except EventCapacityExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.post(
+    "/{token}/confirm",
+    response_model=SuccessResponse[AttendeeResponse],
+    status_code=status.HTTP_201_CREATED
+)
+async def confirm_hold(
+    event_id: Annotated[int, Path(description="Event ID")],
+    token: Annotated[str, Path(description="Hold token")],
+    attendee_data: AttendeeBase
+) -> SuccessResponse[AttendeeResponse]:
+    """
+    Confirm a seat hold by registering the attendee on the held seat.
+
+    Args:
+        event_id: Event ID
+        token: Hold token
+        attendee_data: Attendee registration data
+
+    Returns:
+        SuccessResponse[AttendeeResponse]: Registered attendee
+
+    Raises:
+        HTTPException: If event or hold not found, or attendee already registered
+    """
+    try:
+        async with lane_session(write_lane) as db:
+            attendee = await AttendeeService(db).confirm_hold(event_id, token, attendee_data)
+        return SuccessResponse(
+            data=AttendeeResponse.model_validate(attendee),
+            message="Attendee registered successfully"
+        )
+    except DatabaseBusyError:
+        raise
+    except (EventNotFoundError, SeatHoldNotFoundError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except AttendeeAlreadyRegisteredError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.delete("/{token}", response_model=SuccessResponse[None])
+async def release_hold(
+    event_id: Annotated[int, Path(description="Event ID")],
+    token: Annotated[str, Path(description="Hold token")]
+) -> SuccessResponse[None]:
+    """
+    Release a seat hold before it expires.
+
+    Args:
+        event_id: Event ID
+        token: Hold token
+
+    Returns:
+        SuccessResponse[None]: Confirmation message
+
+    Raises:
+        HTTPException: If hold not found
+    """
+    try:
+        async with lane_session(write_lane) as db:
+            await AttendeeService(db).release_hold(event_id, token)
+        return SuccessResponse(message="Seat hold released")
+    except DatabaseBusyError:
+        raise
+    except SeatHoldNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
@@ -0,0 +1,59 @@
+"""
+Metrics endpoints for the API.
+"""
+
+from typing import Any, Dict
+from fastapi import APIRouter, Query
+
+from app.core.config import settings
+from app.core.hot_events import KINDS, READS, REGISTRATIONS, hot_events
+from app.core.metrics import metrics
+from app.schemas.base import SuccessResponse
+from app.schemas.hot_events import HotEvent, HotEventsResponse
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SuccessResponse[Dict[str, Any]])
+async def get_metrics() -> SuccessResponse[Dict[str, Any]]:
+    """
+    Get a snapshot of in-process counters and gauges.
+
+    Returns:
+        SuccessResponse[Dict[str, Any]]: Counters and gauges keyed by name
+    """
+    return SuccessResponse(
+        data=metrics.snapshot(),
+        message="Metrics retrieved successfully"
+    )
+
+
+@router.get("/hot-events", response_model=SuccessResponse[HotEventsResponse])
+async def get_hot_events(
+    limit: int = Query(default=10, ge=1, le=settings.HOT_EVENTS_TOP_K, description="Events per kind of traffic")
+) -> SuccessResponse[HotEventsResponse]:
+    """
+    Get the events drawing the most reads and registrations on this worker.
+
+    Args:
+        limit: Events to list per kind of traffic
+
+    Returns:
+        SuccessResponse[HotEventsResponse]: Busiest events, busiest first
+    """
+    top = {
+        kind: [
+            HotEvent(event_id=event_id, rate=round(rate, 3), hot=rate >= hot_events.min_rate)
+            for event_id, rate in hot_events.top(kind, limit)
+        ]
+        for kind in KINDS
+    }
+    return SuccessResponse(
+        data=HotEventsResponse(
+            enabled=settings.HOT_EVENTS_ENABLED,
+            window_seconds=hot_events.window_seconds,
+            reads=top[READS],
+            registrations=top[REGISTRATIONS],
+        ),
+        message="Hot events retrieved successfully"
+    )
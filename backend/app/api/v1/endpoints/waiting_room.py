@@ -0,0 +1,197 @@
+"""
+Waiting room endpoints for the API.
+"""
+
+import math
+from dataclasses import asdict
+from typing import Annotated, Optional
+from fastapi import APIRouter, HTTPException, Path, Response, status
+
+from app.db.database import lane_session
+from app.db.lanes import DatabaseBusyError, read_lane
+from app.repositories.event import EventRepository
+from app.services.exceptions import InvalidQueueTicketError, WaitingRoomNotEnabledError
+from app.services.waiting_room import OpenRoom, waiting_rooms
+from app.schemas.base import SuccessResponse
+from app.schemas.waiting_room import QueueTicketResponse, WaitingRoomSettings, WaitingRoomStatus
+
+router = APIRouter()
+
+
+def _room_status(event_id: int, room: Optional[OpenRoom]) -> WaitingRoomStatus:
+    if room is None:
+        return WaitingRoomStatus(event_id=event_id, active=False)
+    return WaitingRoomStatus(
+        event_id=event_id,
+        active=True,
+        admit_rate=room.admit_rate,
+        burst=room.burst,
+        issued=room.issued,
+        admitted=room.admitted,
+        waiting=room.waiting,
+    )
+
+
+@router.get("/", response_model=SuccessResponse[WaitingRoomStatus])
+async def get_waiting_room(
+    event_id: Annotated[int, Path(description="Event ID")]
+) -> SuccessResponse[WaitingRoomStatus]:
+    """
+    Get the state of an event's waiting room.
+
+    The ticket counts are those of the worker answering the request.
+
+    Args:
+        event_id: Event ID
+
+    Returns:
+        SuccessResponse[WaitingRoomStatus]: Waiting room state
+    """
+    return SuccessResponse(
+        data=_room_status(event_id, await waiting_rooms.refresh(event_id)),
+        message="Waiting room retrieved successfully"
+    )
+
+
+@router.put("/", response_model=SuccessResponse[WaitingRoomStatus])
+async def enable_waiting_room(
+    event_id: Annotated[int, Path(description="Event ID")],
+    room_settings: WaitingRoomSettings
+) -> SuccessResponse[WaitingRoomStatus]:
+    """
+    Open an event's waiting room, or retune the admission rate of an open one.
+
+    Args:
+        event_id: Event ID
+        room_settings: Admission rate and burst (defaults from settings)
+
+    Returns:
+        SuccessResponse[WaitingRoomStatus]: Waiting room state
+
+    Raises:
+        HTTPException: If event not found
+    """
+    try:
+        async with lane_session(read_lane) as db:
+            exists = await EventRepository(db).exists(event_id)
+    except DatabaseBusyError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event with ID {event_id} not found"
+        )
+
+    room = await waiting_rooms.enable(event_id, room_settings.admit_rate, room_settings.burst)
+    return SuccessResponse(
+        data=_room_status(event_id, room),
+        message="Waiting room enabled"
+    )
+
+
+@router.delete("/", response_model=SuccessResponse[WaitingRoomStatus])
+async def disable_waiting_room(
+    event_id: Annotated[int, Path(description="Event ID")]
+) -> SuccessResponse[WaitingRoomStatus]:
+    """
+    Close an event's waiting room so registrations no longer need a ticket.
+
+    Args:
+        event_id: Event ID
+
+    Returns:
+        SuccessResponse[WaitingRoomStatus]: Waiting room state
+
+    Raises:
+        HTTPException: If the event has no active waiting room
+    """
+    if not await waiting_rooms.disable(event_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event {event_id} has no active waiting room"
+        )
+    return SuccessResponse(
+        data=_room_status(event_id, None),
+        message="Waiting room disabled"
+    )
+
+
+@router.post("/tickets", response_model=SuccessResponse[QueueTicketResponse], status_code=status.HTTP_201_CREATED)
+async def join_waiting_room(
+    event_id: Annotated[int, Path(description="Event ID")]
+) -> SuccessResponse[QueueTicketResponse]:
+    """
+    Take a queue ticket for an event's waiting room.
+
+    Tickets are issued from this worker's share of the room; no database
+    work is done.
+
+    Args:
+        event_id: Event ID
+
+    Returns:
+        SuccessResponse[QueueTicketResponse]: Ticket and its position
+
+    Raises:
+        HTTPException: If the event has no active waiting room
+    """
+    try:
+        ticket = waiting_rooms.join(event_id)
+    except WaitingRoomNotEnabledError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    return SuccessResponse(
+        data=QueueTicketResponse(**asdict(ticket)),
+        message="Joined waiting room"
+    )
+
+
+@router.get("/tickets/{ticket}", response_model=SuccessResponse[QueueTicketResponse])
+async def get_ticket_position(
+    event_id: Annotated[int, Path(description="Event ID")],
+    ticket: Annotated[str, Path(description="Queue ticket")],
+    response: Response
+) -> SuccessResponse[QueueTicketResponse]:
+    """
+    Poll a queue ticket's position.
+
+    While the ticket is waiting, ``Retry-After`` suggests when to poll next.
+    Only the ticket itself is checked; no database work is done.
+
+    Args:
+        event_id: Event ID
+        ticket: Queue ticket
+        response: Outgoing response, for the Retry-After header
+
+    Returns:
+        SuccessResponse[QueueTicketResponse]: Ticket and its position
+
+    Raises:
+        HTTPException: If the room is closed or the ticket is invalid or expired
+    """
+    try:
+        ticket_status = waiting_rooms.status(event_id, ticket)
+    except WaitingRoomNotEnabledError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except InvalidQueueTicketError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+
+    if not ticket_status.admitted:
+        response.headers["Retry-After"] = str(max(1, math.ceil(ticket_status.estimated_wait_seconds)))
+    return SuccessResponse(
+        data=QueueTicketResponse(**asdict(ticket_status)),
+        message="Ticket admitted" if ticket_status.admitted else "Ticket waiting"
+    )
@@ -0,0 +1,97 @@
+"""
+Waitlist endpoints for the API.
+"""
+
+from typing import Annotated
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_read_db, lane_session
+from app.db.lanes import DatabaseBusyError, write_lane
+from app.services.waitlist import WaitlistService
+from app.services.exceptions import WaitlistEntryNotFoundError
+from app.schemas.base import SuccessResponse
+from app.schemas.waitlist import WaitlistEntryResponse
+
+router = APIRouter()
+
+
+@router.get("/{entry_id}", response_model=SuccessResponse[WaitlistEntryResponse])
+async def get_waitlist_entry(
+    event_id: Annotated[int, Path(description="Event ID")],
+    entry_id: Annotated[int, Path(description="Waitlist entry ID")],
+    db: AsyncSession = Depends(get_read_db)
+) -> SuccessResponse[WaitlistEntryResponse]:
+    """
+    Get a waitlist entry and its current position.
+    
+    Args:
+        event_id: Event ID
+        entry_id: Waitlist entry ID
+        db: Database session
+        
+    Returns:
+        SuccessResponse[WaitlistEntryResponse]: Entry with its queue position
+        
+    Raises:
+        HTTPException: If the entry is not on the waitlist (it may have been promoted)
+    """
+    try:
+        entry, position = await WaitlistService(db).get_entry(event_id, entry_id)
+        return SuccessResponse(
+            data=WaitlistEntryResponse(
+                id=entry.id,
+                name=entry.name,
+                email=entry.email,
+                event_id=entry.event_id,
+                position=position,
+                created_at=entry.created_at
+            ),
+            message="Waitlist entry retrieved successfully"
+        )
+    except WaitlistEntryNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+
+@router.delete("/{entry_id}", response_model=SuccessResponse[None])
+async def leave_waitlist(
+    event_id: Annotated[int, Path(description="Event ID")],
+    entry_id: Annotated[int, Path(description="Waitlist entry ID")]
+) -> SuccessResponse[None]:
+    """
+    Leave an event's waitlist.
+    
+    Args:
+        event_id: Event ID
+        entry_id: Waitlist entry ID
+        
+    Returns:
+        SuccessResponse[None]: Confirmation message
+        
+    Raises:
+        HTTPException: If the entry is not on the waitlist
+    """
+    try:
+        async with lane_session(write_lane) as db:
+            await WaitlistService(db).leave(event_id, entry_id)
+        return SuccessResponse(message="Left the waitlist")
+    except DatabaseBusyError:
+        raise
+    except WaitlistEntryNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
@@ -4,7 +4,7 @@ Main API router for version 1.
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import events, attendees
+from app.api.v1.endpoints import batch, events, attendees, health, holds, metrics, waiting_room, waitlist
 from app.core.config import settings
 
 api_router = APIRouter(prefix=f"/{settings.API_VERSION}")
@@ -21,3 +21,39 @@ api_router.include_router(
     prefix="/events/{event_id}/attendees",
     tags=["attendees"]
 )
+
+api_router.include_router(
+    holds.router,
+    prefix="/events/{event_id}/holds",
+    tags=["holds"]
+)
+
+api_router.include_router(
+    waitlist.router,
+    prefix="/events/{event_id}/waitlist",
+    tags=["waitlist"]
+)
+
+api_router.include_router(
+    waiting_room.router,
+    prefix="/events/{event_id}/waiting-room",
+    tags=["waiting-room"]
+)
+
+api_router.include_router(
+    metrics.router,
+    prefix="/metrics",
+    tags=["metrics"]
+)
+
+api_router.include_router(
+    batch.router,
+    prefix="/batch",
+    tags=["batch"]
+)
+
+api_router.include_router(
+    health.router,
+    prefix="/health",
+    tags=["health"]
+)
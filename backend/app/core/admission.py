@@ -0,0 +1,188 @@
+"""
+Admission control: per-client and per-event rate limits plus global load shedding.
+"""
+
+import asyncio
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.core.rate_limit import RateLimitBackend, get_rate_limit_backend
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class AdmissionDecision:
+    """Outcome of an admission check for a rejected request."""
+
+    status_code: int
+    reason: str
+    retry_after: int
+    message: str
+
+
+class LoopLagMonitor:
+    """
+    Measures event loop lag by timing a periodic sleep.
+
+    When the loop is saturated with work a sleep wakes up late; the delay
+    beyond the requested interval is the lag every other coroutine is
+    paying too. The value is smoothed so a single slow tick does not
+    trigger load shedding on its own.
+    """
+
+    def __init__(self, interval: float, smoothing: float = 0.3):
+        self.interval = interval
+        self.smoothing = smoothing
+        self.lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (loop.time() - started - self.interval) * 1000)
+            self.lag_ms += self.smoothing * (lag_ms - self.lag_ms)
+
+    def start(self) -> None:
+        """Start sampling on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.lag_ms = 0.0
+
+
+class AdmissionController:
+    """
+    Decides whether a request may enter the application.
+
+    Two independent layers are applied:
+
+    * Load shedding (503) when the number of in-flight requests or the
+      event loop lag crosses the configured thresholds.
+    * Token bucket rate limits (429) per client for write requests and
+      per event for registrations.
+    """
+
+    def __init__(self, backend: Optional[RateLimitBackend] = None):
+        self.backend = backend
+        self.in_flight = 0
+        self.lag_monitor = LoopLagMonitor(settings.LOOP_LAG_SAMPLE_INTERVAL_MS / 1000)
+
+        metrics.register_gauge("admission.in_flight", lambda: self.in_flight)
+        metrics.register_gauge("admission.loop_lag_ms", lambda: round(self.lag_monitor.lag_ms, 3))
+
+    def _get_backend(self) -> RateLimitBackend:
+        if self.backend is None:
+            kwargs = {}
+            if settings.RATE_LIMIT_BACKEND == "memory":
+                kwargs["max_keys"] = settings.RATE_LIMIT_MAX_KEYS
+            self.backend = get_rate_limit_backend(settings.RATE_LIMIT_BACKEND, **kwargs)
+        return self.backend
+
+    def start(self) -> None:
+        """Start background monitors."""
+        self.lag_monitor.start()
+
+    async def stop(self) -> None:
+        """Stop background monitors and release the backend."""
+        await self.lag_monitor.stop()
+        if self.backend is not None:
+            await self.backend.close()
+
+    def _shed(self, reason: str, message: str) -> AdmissionDecision:
+        metrics.increment(f"admission.shed.{reason}")
+        return AdmissionDecision(
+            status_code=503,
+            reason=reason,
+            retry_after=settings.LOAD_SHED_RETRY_AFTER_SECONDS,
+            message=message,
+        )
+
+    def _limit(self, reason: str, wait: float, message: str) -> AdmissionDecision:
+        metrics.increment(f"admission.shed.{reason}")
+        return AdmissionDecision(
+            status_code=429,
+            reason=reason,
+            retry_after=max(1, math.ceil(wait)) if math.isfinite(wait) else 60,
+            message=message,
+        )
+
+    def check_load(self) -> Optional[AdmissionDecision]:
+        """
+        Check global load before admitting a request.
+
+        Returns:
+            Optional[AdmissionDecision]: Rejection, or None to admit
+        """
+        if self.in_flight >= settings.LOAD_SHED_MAX_IN_FLIGHT:
+            return self._shed("in_flight", "Server is at capacity, please retry later")
+
+        if self.lag_monitor.lag_ms > settings.LOAD_SHED_MAX_LOOP_LAG_MS:
+            return self._shed("loop_lag", "Server is overloaded, please retry later")
+
+        return None
+
+    async def check_rate_limits(
+        self,
+        client_id: str,
+        event_id: Optional[int] = None
+    ) -> Optional[AdmissionDecision]:
+        """
+        Check token bucket limits for a write request.
+
+        Args:
+            client_id: Client identifier
+            event_id: Event ID for registration requests
+
+        Returns:
+            Optional[AdmissionDecision]: Rejection, or None to admit
+        """
+        backend = self._get_backend()
+
+        wait = await backend.acquire(
+            f"client:{client_id}",
+            settings.RATE_LIMIT_CLIENT_RATE,
+            settings.RATE_LIMIT_CLIENT_BURST,
+        )
+        if wait > 0:
+            logger.warning(f"Client {client_id} rate limited")
+            return self._limit("client_rate_limited", wait, "Too many requests from this client")
+
+        if event_id is not None:
+            wait = await backend.acquire(
+                f"event:{event_id}",
+                settings.RATE_LIMIT_EVENT_RATE,
+                settings.RATE_LIMIT_EVENT_BURST,
+            )
+            if wait > 0:
+                return self._limit("event_rate_limited", wait, "Too many registrations for this event")
+
+        return None
+
+    def enter(self) -> None:
+        """Record that a request was admitted."""
+        self.in_flight += 1
+        metrics.increment("admission.admitted")
+
+    def leave(self) -> None:
+        """Record that an admitted request finished."""
+        self.in_flight -= 1
+
+
+# Global admission controller
+admission_controller = AdmissionController()
@@ -2,7 +2,7 @@
 Application configuration using Pydantic Settings.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import Field, validator
 from pydantic_settings import BaseSettings
 
@@ -21,6 +21,50 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./app.db",
         description="Database connection URL"
     )
+    DATABASE_SHARD_URLS: List[str] = Field(
+        default=[],
+        description="Further database URLs; events are spread over DATABASE_URL and these"
+    )
+    SQLITE_JOURNAL_MODE: str = Field(
+        default="WAL",
+        description="SQLite journal mode; WAL lets readers run alongside the single writer"
+    )
+    SQLITE_BUSY_TIMEOUT_MS: int = Field(
+        default=5000, ge=0, description="Milliseconds SQLite waits for a lock held by another connection"
+    )
+    SQLITE_SYNCHRONOUS: str = Field(default="NORMAL", description="SQLite synchronous level for commits")
+    DB_READ_CONCURRENCY: int = Field(default=16, ge=1, description="Concurrent read sessions")
+    DB_READ_QUEUE_TIMEOUT: float = Field(default=2.0, gt=0, description="Seconds a read may wait for a slot")
+    DB_READ_MAX_QUEUE: int = Field(default=256, ge=0, description="Reads allowed to wait for a slot")
+    DB_WRITE_CONCURRENCY: int = Field(default=4, ge=1, description="Concurrent write sessions")
+    DB_WRITE_QUEUE_TIMEOUT: float = Field(default=5.0, gt=0, description="Seconds a write may wait for a slot")
+    DB_WRITE_MAX_QUEUE: int = Field(default=256, ge=0, description="Writes allowed to wait for a slot")
+    DB_BUSY_RETRY_AFTER_SECONDS: int = Field(default=1, ge=0, description="Retry-After when a lane is saturated")
+    
+    # Server (python -m app.serve)
+    SERVER_HOST: str = Field(default="0.0.0.0", description="Address the server listens on")
+    SERVER_PORT: int = Field(default=8000, ge=1, le=65535, description="Port the server listens on")
+    SERVER_WORKERS: int = Field(default=0, ge=0, description="Worker processes; 0 runs one per available core")
+    SERVER_PIN_WORKERS: bool = Field(default=False, description="Pin each worker to its own core (Linux)")
+    SERVER_LOOP: str = Field(default="auto", description="Event loop: auto, uvloop or asyncio")
+    SERVER_HTTP: str = Field(default="auto", description="HTTP parser: auto, httptools or h11")
+    SERVER_BACKLOG: int = Field(default=2048, ge=1, description="Pending connections queued by the listening socket")
+    SERVER_KEEPALIVE_TIMEOUT: int = Field(default=5, ge=1, description="Seconds idle keep-alive connections stay open")
+    SERVER_MAX_REQUESTS: int = Field(default=0, ge=0, description="Requests before a worker is recycled; 0 disables")
+    SERVER_MAX_REQUESTS_JITTER: int = Field(default=0, ge=0, description="Random extra requests so workers recycle apart")
+    SERVER_MAX_MEMORY_MB: int = Field(default=0, ge=0, description="Resident memory before a worker is replaced; 0 disables")
+    SERVER_GRACEFUL_TIMEOUT: int = Field(default=30, ge=1, description="Seconds a stopping worker may finish requests")
+    SERVER_STARTUP_TIMEOUT: float = Field(default=60.0, gt=0, description="Seconds a new worker may take to start")
+    SERVER_CHECK_INTERVAL: float = Field(default=1.0, gt=0, description="Seconds between worker health checks")
+    
+    # Event Catalog
+    CATALOG_ENABLED: bool = Field(default=True, description="Serve the events list from the in-memory catalog")
+    CATALOG_REFRESH_INTERVAL: float = Field(default=1.0, gt=0, description="Seconds between catalog refreshes")
+    
+    # Membership Filters
+    MEMBERSHIP_FILTER_ENABLED: bool = Field(default=True, description="Skip duplicate-email queries on definite misses")
+    MEMBERSHIP_FILTER_MAX_EVENTS: int = Field(default=1024, ge=1, description="Events with a cached filter")
+    MEMBERSHIP_FILTER_ERROR_RATE: float = Field(default=0.01, gt=0, lt=1, description="Target false positive rate")
     
     # API Configuration
     API_PREFIX: str = Field(default="/api", description="API prefix")
@@ -52,8 +96,132 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
     LOG_FORMAT: str = Field(default="json", description="Logging format")
+
+    # Admission Control
+    ADMISSION_CONTROL_ENABLED: bool = Field(default=True, description="Enable rate limiting and load shedding")
+    RATE_LIMIT_BACKEND: str = Field(
+        default="memory",
+        description="Token bucket backend name or dotted import path"
+    )
+    RATE_LIMIT_MAX_KEYS: int = Field(default=100_000, ge=1, description="Maximum buckets kept by the memory backend")
+    RATE_LIMIT_CLIENT_HEADER: Optional[str] = Field(
+        default=None,
+        description="Header identifying the client (e.g. X-Forwarded-For); defaults to the peer address"
+    )
+    RATE_LIMIT_CLIENT_RATE: float = Field(default=5.0, ge=0, description="Write requests per second per client")
+    RATE_LIMIT_CLIENT_BURST: int = Field(default=20, ge=1, description="Write request burst per client")
+    RATE_LIMIT_EVENT_RATE: float = Field(default=50.0, ge=0, description="Registrations per second per event")
+    RATE_LIMIT_EVENT_BURST: int = Field(default=100, ge=1, description="Registration burst per event")
+    LOAD_SHED_MAX_IN_FLIGHT: int = Field(default=512, ge=1, description="In-flight requests before shedding")
+    LOAD_SHED_MAX_LOOP_LAG_MS: float = Field(default=200.0, gt=0, description="Event loop lag before shedding")
+    LOAD_SHED_RETRY_AFTER_SECONDS: int = Field(default=1, ge=0, description="Retry-After for shed requests")
+    LOOP_LAG_SAMPLE_INTERVAL_MS: float = Field(default=100.0, gt=0, description="Event loop lag sampling interval")
+
+    # Single-flight reads
+    SINGLE_FLIGHT_ENABLED: bool = Field(default=True, description="Share one DB call between identical concurrent reads")
+
+    # Event Loader
+    EVENT_LOADER_MAX_BATCH: int = Field(default=500, ge=1, description="Event IDs per batched IN query")
+    EVENT_BATCH_MAX_IDS: int = Field(default=100, ge=1, description="Event IDs accepted by the multi-get endpoint")
+
+    # Idempotency
+    IDEMPOTENCY_ENABLED: bool = Field(default=True, description="Honour Idempotency-Key on event creation and registrations")
+    IDEMPOTENCY_TTL_SECONDS: float = Field(default=3600.0, gt=0, description="Seconds a stored response can be replayed")
+    IDEMPOTENCY_MAX_ENTRIES: int = Field(default=10_000, ge=1, description="Stored responses kept per process")
+
+    # Seat Holds
+    SEAT_HOLD_TTL_SECONDS: float = Field(default=300.0, gt=0, description="Seconds a seat hold lasts before expiring")
+    SEAT_HOLD_REAP_BATCH_SIZE: int = Field(default=500, ge=1, description="Expired holds released per transaction")
+
+    # Waitlist
+    WAITLIST_ENABLED: bool = Field(default=True, description="Queue registrants for full events instead of rejecting them")
+
+    # Bulk Registration
+    BULK_REGISTRATION_MAX_SIZE: int = Field(default=500, ge=1, description="Maximum attendees per bulk registration request")
+
+    # Persons
+    PERSON_CACHE_SIZE: int = Field(default=100_000, ge=0, description="Person IDs cached by email per process (0 disables)")
+
+    # Cache Invalidation
+    INVALIDATION_ENABLED: bool = Field(default=True, description="Share cache invalidations with other workers")
+    INVALIDATION_POLL_INTERVAL: float = Field(default=0.5, gt=0, description="Seconds between change-log polls")
+    INVALIDATION_RETENTION_SECONDS: float = Field(default=3600.0, gt=0, description="Seconds change-log rows are kept")
+
+    # Warm-up and Health
+    WARMUP_ENABLED: bool = Field(default=True, description="Warm connections, statements and caches before reporting ready")
+    WARMUP_MEMBERSHIP_EVENTS: int = Field(default=10, ge=0, description="Busiest upcoming events whose membership filters are built at startup")
+    HEALTH_DB_CACHE_SECONDS: float = Field(default=2.0, ge=0, description="Seconds a database health check result is reused")
+    HEALTH_DB_TIMEOUT: float = Field(default=1.0, gt=0, description="Seconds a database health check may take")
+
+    # Request Cancellation
+    REQUEST_CANCELLATION_ENABLED: bool = Field(default=True, description="Cancel reads whose client disconnected or whose deadline passed")
+    REQUEST_DEADLINES: Dict[str, float] = Field(
+        default={
+            "GET /api/v1/events/": 5.0,
+            "GET /api/v1/events/batch": 5.0,
+            "GET /api/v1/events/{event_id}/attendees/": 10.0,
+        },
+        description="Seconds a read route may run, keyed by 'METHOD /route/path'"
+    )
+
+    # Capacity Feed
+    CAPACITY_FEED_ENABLED: bool = Field(default=True, description="Serve live capacity updates over Server-Sent Events")
+    CAPACITY_FEED_INTERVAL: float = Field(default=0.5, gt=0, description="Seconds capacity changes are coalesced before fan-out")
+    CAPACITY_FEED_HISTORY: int = Field(default=120, ge=1, description="Ticks kept for lagging or reconnecting subscribers")
+    CAPACITY_FEED_KEEPALIVE: float = Field(default=15.0, gt=0, description="Seconds between keepalive comments on idle streams")
+    CAPACITY_FEED_MAX_SUBSCRIBERS: int = Field(default=10_000, ge=1, description="Open capacity streams per process")
+
+    # Batch Requests
+    BATCH_MAX_REQUESTS: int = Field(default=20, ge=1, description="Maximum requests in one batch")
+    BATCH_MAX_CONCURRENCY: int = Field(default=8, ge=1, description="Requests of one batch run at once")
+
+    # Hot Events
+    HOT_EVENTS_ENABLED: bool = Field(default=True, description="Track the events drawing the most reads and registrations")
+    HOT_EVENTS_WINDOW_SECONDS: float = Field(default=60.0, gt=0, description="Seconds of traffic the hot event rates cover")
+    HOT_EVENTS_TOP_K: int = Field(default=20, ge=1, description="Busiest events tracked per kind of traffic")
+    HOT_EVENTS_SKETCH_WIDTH: int = Field(default=2048, ge=16, description="Counters per row of the count-min sketch")
+    HOT_EVENTS_SKETCH_DEPTH: int = Field(default=4, ge=1, description="Rows of the count-min sketch")
+    HOT_EVENTS_MIN_RATE: float = Field(default=1.0, ge=0, description="Requests per second before a tracked event counts as hot")
+
+    # Waiting Room
+    WAITING_ROOM_EVENT_IDS: List[int] = Field(default=[], description="Events whose waiting room opens at startup")
+    WAITING_ROOM_ADMIT_RATE: float = Field(default=20.0, gt=0, description="Queue tickets admitted per second per event")
+    WAITING_ROOM_ADMIT_BURST: int = Field(default=20, ge=1, description="Tickets admitted at once after an idle period")
+    WAITING_ROOM_ADMISSION_TTL: float = Field(default=120.0, gt=0, description="Seconds an admitted ticket stays usable")
+    WAITING_ROOM_AUTO_OPEN_RATE: float = Field(
+        default=0.0,
+        ge=0,
+        description="Registrations per second per worker that open a hot event's waiting room (0 disables)"
+    )
+
+    
+    
+    @validator("REQUEST_DEADLINES")
+    def validate_request_deadlines(cls, v):
+        """Validate deadlines are positive and only set on read routes."""
+        for key, seconds in v.items():
+            method, _, path = key.partition(" ")
+            if method not in ("GET", "HEAD") or not path.startswith("/"):
+                raise ValueError(f"Deadline key {key!r} must look like 'GET /path'; only reads can be cancelled")
+            if seconds <= 0:
+                raise ValueError(f"Deadline for {key!r} must be positive")
+        return v
     
+    @validator("SERVER_LOOP")
+    def validate_server_loop(cls, v):
+        """Validate event loop name."""
+        allowed = ["auto", "uvloop", "asyncio"]
+        if v not in allowed:
+            raise ValueError(f"Server loop must be one of {allowed}")
+        return v
     
+    @validator("SERVER_HTTP")
+    def validate_server_http(cls, v):
+        """Validate HTTP implementation name."""
+        allowed = ["auto", "httptools", "h11"]
+        if v not in allowed:
+            raise ValueError(f"Server HTTP implementation must be one of {allowed}")
+        return v
     
     @validator("ENVIRONMENT")
     def validate_environment(cls, v):
@@ -0,0 +1,254 @@
+"""
+Streaming detection of the events drawing the most traffic.
+"""
+
+import heapq
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+# Traffic kinds tracked separately
+READS = "reads"
+REGISTRATIONS = "registrations"
+KINDS = (READS, REGISTRATIONS)
+
+# Mersenne prime for the sketch's hash family
+HASH_PRIME = (1 << 61) - 1
+
+
+class CountMinSketch:
+    """
+    Approximate counts of integer keys in ``depth`` rows of ``width`` counters.
+
+    Each row hashes the key to one counter with its own ``(a * key + b) mod
+    p`` function. Updates are conservative (only the row counters at the
+    current minimum are raised), and the estimate is the minimum over the
+    rows: it never undercounts, and overcounts by at most a small share of
+    the total added.
+    """
+
+    __slots__ = ("width", "rows", "hashes", "total")
+
+    def __init__(self, width: int, depth: int, seed: int = 0):
+        rng = random.Random(seed)
+        self.width = width
+        self.rows = [[0] * width for _ in range(depth)]
+        self.hashes = [(rng.randrange(1, HASH_PRIME), rng.randrange(HASH_PRIME)) for _ in range(depth)]
+        self.total = 0
+
+    def _cells(self, key: int) -> List[int]:
+        return [(a * key + b) % HASH_PRIME % self.width for a, b in self.hashes]
+
+    def add(self, key: int, count: int = 1) -> int:
+        """
+        Count a key.
+
+        Args:
+            key: Key
+            count: Occurrences to add
+
+        Returns:
+            int: The key's new estimate
+        """
+        cells = self._cells(key)
+        estimate = min(row[cell] for row, cell in zip(self.rows, cells)) + count
+        for row, cell in zip(self.rows, cells):
+            if row[cell] < estimate:
+                row[cell] = estimate
+        self.total += count
+        return estimate
+
+    def estimate(self, key: int) -> int:
+        """Estimated occurrences of a key."""
+        return min(row[cell] for row, cell in zip(self.rows, self._cells(key)))
+
+
+class TopK:
+    """
+    The ``k`` keys with the highest estimates offered so far.
+
+    A min-heap finds the smallest tracked key to displace. Entries are
+    pushed again when a key's estimate grows, and outdated entries are
+    skipped when they reach the top, so every offer is O(log k).
+    """
+
+    __slots__ = ("k", "counts", "_heap")
+
+    def __init__(self, k: int):
+        self.k = k
+        self.counts: Dict[int, int] = {}
+        self._heap: List[Tuple[int, int]] = []
+
+    def _floor(self) -> Tuple[int, int]:
+        while self._heap:
+            count, key = self._heap[0]
+            if self.counts.get(key) == count:
+                return count, key
+            heapq.heappop(self._heap)
+        raise IndexError("empty")
+
+    def offer(self, key: int, estimate: int) -> None:
+        """
+        Track a key if its estimate ranks among the top ``k``.
+
+        Args:
+            key: Key
+            estimate: Its current estimate, never lower than a previous one
+        """
+        if key not in self.counts and len(self.counts) >= self.k:
+            floor_count, floor_key = self._floor()
+            if estimate <= floor_count:
+                return
+            heapq.heappop(self._heap)
+            del self.counts[floor_key]
+        self.counts[key] = estimate
+        heapq.heappush(self._heap, (estimate, key))
+        if len(self._heap) > 4 * self.k + 16:
+            self._heap = [(count, key) for key, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+
+class Window:
+    """Sketch and top keys of one kind of traffic over one window."""
+
+    __slots__ = ("sketch", "top")
+
+    def __init__(self, width: int, depth: int, k: int):
+        self.sketch = CountMinSketch(width, depth)
+        self.top = TopK(k)
+
+    def add(self, key: int, count: int) -> None:
+        self.top.offer(key, self.sketch.add(key, count))
+
+
+class HotEventTracker:
+    """
+    Rolling estimate of requests per event, split into reads and
+    registrations.
+
+    Each kind of traffic is counted in a count-min sketch with a top-K
+    heap, per window of ``window_seconds``. Counts blend the current
+    window with the share of the previous one that the sliding window
+    still covers, so they move smoothly instead of resetting when a
+    window ends. Memory is fixed by the sketch size, whatever the number
+    of events.
+
+    Other subsystems ask ``rate`` or ``is_hot`` to treat busy events
+    differently. Counts are per worker: with several workers each one
+    sees its own share of the traffic.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        top_k: int,
+        width: int,
+        depth: int,
+        min_rate: float
+    ):
+        self.window_seconds = window_seconds
+        self.top_k = top_k
+        self.width = width
+        self.depth = depth
+        self.min_rate = min_rate
+        self._started = time.monotonic()
+        self._current = {kind: self._window() for kind in KINDS}
+        self._previous = {kind: self._window() for kind in KINDS}
+
+    def _window(self) -> Window:
+        return Window(self.width, self.depth, self.top_k)
+
+    def _elapsed(self) -> float:
+        """Seconds into the current window, rotating windows that have ended."""
+        now = time.monotonic()
+        elapsed = now - self._started
+        if elapsed < self.window_seconds:
+            return elapsed
+        if elapsed < 2 * self.window_seconds:
+            self._previous = self._current
+        else:
+            self._previous = {kind: self._window() for kind in KINDS}
+        self._current = {kind: self._window() for kind in KINDS}
+        self._started = now - elapsed % self.window_seconds
+        return now - self._started
+
+    def record(self, kind: str, event_id: int, count: int = 1) -> None:
+        """
+        Count requests for an event.
+
+        Args:
+            kind: ``reads`` or ``registrations``
+            event_id: Event ID
+            count: Number of requests
+        """
+        self._elapsed()
+        self._current[kind].add(event_id, count)
+
+    def _estimate(self, kind: str, event_id: int, elapsed: float) -> float:
+        carried = 1 - elapsed / self.window_seconds
+        return (
+            self._current[kind].sketch.estimate(event_id)
+            + self._previous[kind].sketch.estimate(event_id) * carried
+        )
+
+    def rate(self, kind: str, event_id: int) -> float:
+        """
+        Estimated requests per second for an event over the last window.
+
+        Args:
+            kind: ``reads`` or ``registrations``
+            event_id: Event ID
+
+        Returns:
+            float: Requests per second
+        """
+        return self._estimate(kind, event_id, self._elapsed()) / self.window_seconds
+
+    def top(self, kind: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        The busiest events over the last window.
+
+        Args:
+            kind: ``reads`` or ``registrations``
+            limit: Most events to return (defaults to ``top_k``)
+
+        Returns:
+            List[Tuple[int, float]]: Event ID and requests per second,
+            busiest first
+        """
+        elapsed = self._elapsed()
+        candidates = set(self._current[kind].top.counts) | set(self._previous[kind].top.counts)
+        rates = [
+            (event_id, self._estimate(kind, event_id, elapsed) / self.window_seconds)
+            for event_id in candidates
+        ]
+        rates.sort(key=lambda item: item[1], reverse=True)
+        return rates[:limit or self.top_k]
+
+    def is_hot(self, event_id: int, kind: str = REGISTRATIONS) -> bool:
+        """
+        Check whether an event is among the busiest and at least ``min_rate``.
+
+        Args:
+            event_id: Event ID
+            kind: ``reads`` or ``registrations``
+
+        Returns:
+            bool: True if the event is hot
+        """
+        if not settings.HOT_EVENTS_ENABLED:
+            return False
+        tracked = event_id in self._current[kind].top.counts or event_id in self._previous[kind].top.counts
+        return tracked and self.rate(kind, event_id) >= self.min_rate
+
+
+# Global hot event tracker
+hot_events = HotEventTracker(
+    window_seconds=settings.HOT_EVENTS_WINDOW_SECONDS,
+    top_k=settings.HOT_EVENTS_TOP_K,
+    width=settings.HOT_EVENTS_SKETCH_WIDTH,
+    depth=settings.HOT_EVENTS_SKETCH_DEPTH,
+    min_rate=settings.HOT_EVENTS_MIN_RATE,
+)
@@ -0,0 +1,175 @@
+"""
+Idempotency key store: replays stored responses and coalesces concurrent retries.
+"""
+
+import asyncio
+import hashlib
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+DIGEST_BYTES = 16
+# Bodies at least this large are kept zlib-compressed
+COMPRESS_MIN_BYTES = 512
+
+
+def digest(*parts: bytes) -> bytes:
+    """Hash request parts into a fixed-size store key or fingerprint."""
+    hasher = hashlib.blake2b(digest_size=DIGEST_BYTES)
+    for part in parts:
+        hasher.update(len(part).to_bytes(4, "big"))
+        hasher.update(part)
+    return hasher.digest()
+
+
+@dataclass
+class StoredResponse:
+    """A completed response kept for replay."""
+
+    fingerprint: bytes
+    status_code: int
+    headers: List[Tuple[str, str]]
+    payload: bytes
+    compressed: bool
+    expires_at: float
+
+    @property
+    def body(self) -> bytes:
+        """Response body, decompressed if needed."""
+        return zlib.decompress(self.payload) if self.compressed else self.payload
+
+    @property
+    def size(self) -> int:
+        """Approximate bytes held for this entry."""
+        return len(self.payload) + sum(len(name) + len(value) for name, value in self.headers) + 64
+
+
+class IdempotencyStore:
+    """
+    Bounded in-process store of responses by idempotency key.
+
+    Keys and request fingerprints are kept as 16-byte digests and large
+    bodies are compressed, so an entry costs little more than its
+    response. Every entry lives for the same TTL, so insertion order is
+    expiry order: eviction pops expired entries off the front of an
+    ordered dict, and the oldest entries go first when the store is full.
+
+    A key being worked on is registered as in flight; concurrent requests
+    with the same key wait for that one instead of running the request
+    again.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.bytes = 0
+        self._entries: "OrderedDict[bytes, StoredResponse]" = OrderedDict()
+        self._in_flight: Dict[bytes, Tuple[bytes, asyncio.Future]] = {}
+
+        metrics.register_gauge("idempotency.entries", lambda: len(self._entries))
+        metrics.register_gauge("idempotency.bytes", lambda: self.bytes)
+        metrics.register_gauge("idempotency.in_flight", lambda: len(self._in_flight))
+
+    def _evict(self, now: float) -> None:
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry.expires_at > now and len(self._entries) <= self.max_entries:
+                break
+            del self._entries[key]
+            self.bytes -= entry.size
+
+    def get(self, key: bytes) -> Optional[StoredResponse]:
+        """
+        Get the stored response for a key.
+
+        Args:
+            key: Store key
+
+        Returns:
+            Optional[StoredResponse]: Stored response, or None if absent or expired
+        """
+        self._evict(time.monotonic())
+        return self._entries.get(key)
+
+    def put(
+        self,
+        key: bytes,
+        fingerprint: bytes,
+        status_code: int,
+        headers: List[Tuple[str, str]],
+        body: bytes
+    ) -> StoredResponse:
+        """
+        Store a completed response.
+
+        Args:
+            key: Store key
+            fingerprint: Digest of the request that produced the response
+            status_code: Response status
+            headers: Response headers
+            body: Response body
+
+        Returns:
+            StoredResponse: Stored entry
+        """
+        payload, compressed = body, False
+        if len(body) >= COMPRESS_MIN_BYTES:
+            packed = zlib.compress(body)
+            if len(packed) < len(body):
+                payload, compressed = packed, True
+
+        now = time.monotonic()
+        entry = StoredResponse(fingerprint, status_code, headers, payload, compressed, now + self.ttl)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= previous.size
+        self._entries[key] = entry
+        self.bytes += entry.size
+        self._evict(now)
+        metrics.increment("idempotency.stored")
+        return entry
+
+    def in_flight(self, key: bytes) -> Optional[Tuple[bytes, asyncio.Future]]:
+        """Get the fingerprint and completion future of a request running under a key."""
+        return self._in_flight.get(key)
+
+    def begin(self, key: bytes, fingerprint: bytes) -> asyncio.Future:
+        """
+        Mark a key as in flight.
+
+        Args:
+            key: Store key
+            fingerprint: Request fingerprint
+
+        Returns:
+            asyncio.Future: Resolved with the response (or None if the
+            request failed) when ``finish`` is called
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (fingerprint, future)
+        return future
+
+    def finish(self, key: bytes, response: Optional[StoredResponse]) -> None:
+        """
+        Release an in-flight key and wake the requests waiting on it.
+
+        Args:
+            key: Store key
+            response: Response to share with waiters, or None if there is none
+        """
+        _, future = self._in_flight.pop(key)
+        if not future.done():
+            future.set_result(response)
+
+
+# Global idempotency store
+idempotency_store = IdempotencyStore(
+    ttl=settings.IDEMPOTENCY_TTL_SECONDS,
+    max_entries=settings.IDEMPOTENCY_MAX_ENTRIES
+)
@@ -0,0 +1,119 @@
+"""
+In-process metrics registry for counters, gauges and summaries.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Union
+
+Number = Union[int, float]
+
+
+class MetricsRegistry:
+    """
+    Minimal thread-safe registry of named counters, gauges and summaries.
+
+    Counters only go up and are used to record things that happened
+    (e.g. requests shed). Gauges hold the latest value of something that
+    goes up and down (e.g. in-flight requests); a gauge may also be
+    registered as a callable that is evaluated when a snapshot is taken.
+    Summaries keep count, sum and max of observed values such as durations.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Number] = defaultdict(int)
+        self._gauges: Dict[str, Number] = {}
+        self._gauge_callbacks: Dict[str, Callable[[], Number]] = {}
+        self._summaries: Dict[str, Dict[str, Number]] = {}
+
+    def increment(self, name: str, value: Number = 1) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            name: Counter name
+            value: Amount to add
+        """
+        with self._lock:
+            self._counters[name] += value
+
+    def set_gauge(self, name: str, value: Number) -> None:
+        """
+        Set a gauge to its current value.
+
+        Args:
+            name: Gauge name
+            value: Current value
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def observe(self, name: str, value: Number) -> None:
+        """
+        Record an observation in a summary.
+
+        Args:
+            name: Summary name
+            value: Observed value
+        """
+        with self._lock:
+            summary = self._summaries.get(name)
+            if summary is None:
+                self._summaries[name] = {"count": 1, "sum": value, "max": value}
+            else:
+                summary["count"] += 1
+                summary["sum"] += value
+                summary["max"] = max(summary["max"], value)
+
+    def register_gauge(self, name: str, callback: Callable[[], Number]) -> None:
+        """
+        Register a gauge whose value is computed on demand.
+
+        Args:
+            name: Gauge name
+            callback: Zero-argument callable returning the current value
+        """
+        with self._lock:
+            self._gauge_callbacks[name] = callback
+
+    def get_counter(self, name: str) -> Number:
+        """Get the current value of a counter."""
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Take a point-in-time copy of all metrics.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Counters, gauges and summaries keyed by name
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            callbacks = dict(self._gauge_callbacks)
+            summaries = {name: dict(summary) for name, summary in self._summaries.items()}
+
+        for name, callback in callbacks.items():
+            gauges[name] = callback()
+
+        for summary in summaries.values():
+            summary["avg"] = summary["sum"] / summary["count"]
+
+        return {
+            "counters": dict(sorted(counters.items())),
+            "gauges": dict(sorted(gauges.items())),
+            "summaries": dict(sorted(summaries.items())),
+        }
+
+    def reset(self) -> None:
+        """Reset all counters and gauges."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
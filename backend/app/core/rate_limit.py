@@ -0,0 +1,112 @@
+"""
+Token bucket rate limiting with pluggable state backends.
+"""
+
+import importlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, List, Type
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage backend for token buckets.
+
+    Implementations decide where bucket state lives. The in-process
+    backend keeps it in memory; a shared backend (e.g. Redis) can be
+    plugged in through ``RATE_LIMIT_BACKEND`` without touching callers.
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str, rate: float, burst: int, cost: float = 1.0) -> float:
+        """
+        Try to take tokens from a bucket.
+
+        Args:
+            key: Bucket key
+            rate: Refill rate in tokens per second
+            burst: Bucket capacity
+            cost: Number of tokens to take
+
+        Returns:
+            float: 0.0 if the tokens were taken, otherwise the number of
+            seconds until enough tokens will be available
+        """
+
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Process-local token buckets.
+
+    Buckets are kept in LRU order and the least recently used ones are
+    dropped once ``max_keys`` is exceeded, so a flood of distinct clients
+    cannot grow memory without bound. A dropped bucket simply starts full
+    again, which is the same as a client that has been idle.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    async def acquire(self, key: str, rate: float, burst: int, cost: float = 1.0) -> float:
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            bucket = [float(burst), now]
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            tokens, last = bucket
+            bucket[0] = min(float(burst), tokens + (now - last) * rate)
+            bucket[1] = now
+
+        if bucket[0] >= cost:
+            bucket[0] -= cost
+            return 0.0
+
+        if rate <= 0:
+            return float("inf")
+        return (cost - bucket[0]) / rate
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+RATE_LIMIT_BACKENDS: Dict[str, Type[RateLimitBackend]] = {
+    "memory": InMemoryRateLimitBackend,
+}
+
+
+def get_rate_limit_backend(name: str, **kwargs) -> RateLimitBackend:
+    """
+    Create a rate limit backend by name or dotted import path.
+
+    Args:
+        name: Registered backend name (e.g. ``memory``) or a path such
+            as ``mypackage.limits.RedisBackend``
+        **kwargs: Backend constructor arguments
+
+    Returns:
+        RateLimitBackend: Backend instance
+
+    Raises:
+        ValueError: If the backend cannot be resolved
+    """
+    backend_class = RATE_LIMIT_BACKENDS.get(name)
+
+    if backend_class is None:
+        module_name, _, class_name = name.rpartition(".")
+        if not module_name:
+            raise ValueError(f"Unknown rate limit backend: {name}")
+        backend_class = getattr(importlib.import_module(module_name), class_name, None)
+        if backend_class is None or not issubclass(backend_class, RateLimitBackend):
+            raise ValueError(f"Invalid rate limit backend: {name}")
+
+    return backend_class(**kwargs)
@@ -2,31 +2,108 @@
 Database configuration and session management.
 """
 
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Dict
 
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session, SessionTransaction
 
 from app.core.config import settings
+from app.db.lanes import ConcurrencyLane, read_lane, write_lane
+from app.db.sharding import HOME_SHARD, ShardRouter
+
+
+def _configure_sqlite(dbapi_connection, connection_record) -> None:
+    """
+    Configure every SQLite connection for concurrent use.
+    
+    WAL keeps readers from blocking on the writer, and the busy timeout
+    makes writers in other sessions or processes wait for the lock
+    instead of failing immediately with "database is locked". With WAL,
+    ``synchronous = NORMAL`` skips the fsync on every commit while still
+    keeping the database consistent after a crash.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}")
+    cursor.close()
+
+
+# Session info flag for sessions that take the write lock when they begin
+BEGIN_IMMEDIATE = "begin_immediate"
+
+
+def _begin_immediate(session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+    """
+    Start the transactions of write sessions with ``BEGIN IMMEDIATE``.
+    
+    A deferred transaction that reads before it writes has to upgrade its
+    lock at the first write, and SQLite fails that upgrade at once with
+    "database is locked" when another connection already holds the write
+    lock (the busy timeout does not apply). Taking the write lock up
+    front makes concurrent writers queue on the busy timeout instead.
+    pysqlite issues no BEGIN of its own until the first write, so the
+    explicit one here takes its place.
+    """
+    if transaction.nested or not session.info.get(BEGIN_IMMEDIATE):
+        return
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+event.listen(Session, "after_begin", _begin_immediate)
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    shard_engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        pool_pre_ping=True,
+    )
+    if shard_engine.dialect.name == "sqlite":
+        event.listen(shard_engine.sync_engine, "connect", _configure_sqlite)
+    return shard_engine
+
 
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-    pool_pre_ping=True,
-)
+engine = _create_engine(settings.DATABASE_URL)
+
+# Engines of every shard by shard ID; the home shard "0" is ``engine``
+shard_engines: Dict[str, AsyncEngine] = {HOME_SHARD: engine}
+for index, url in enumerate(settings.DATABASE_SHARD_URLS, start=1):
+    shard_engines[str(index)] = _create_engine(url)
+
+shard_router = ShardRouter(shard_engines)
 
 # Create session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-    autocommit=False,
-)
+if shard_router.enabled:
+    AsyncSessionLocal = async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=ShardedSession,
+        shards={shard_id: shard_engine.sync_engine for shard_id, shard_engine in shard_engines.items()},
+        shard_chooser=shard_router.choose_shard,
+        identity_chooser=shard_router.choose_identity,
+        execute_chooser=shard_router.choose_execute,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+    event.listen(ShardedSession, "before_flush", shard_router.allocate_event_ids)
+else:
+    AsyncSessionLocal = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
 
 
 class Base(DeclarativeBase):
@@ -51,13 +128,83 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@asynccontextmanager
+async def lane_session(lane: ConcurrencyLane) -> AsyncIterator[AsyncSession]:
+    """
+    Open a database session while holding a slot in a concurrency lane.
+    
+    Sessions in the write lane begin their transactions with
+    ``BEGIN IMMEDIATE``.
+    
+    Args:
+        lane: Lane to hold for the lifetime of the session
+        
+    Yields:
+        AsyncSession: Database session
+        
+    Raises:
+        DatabaseBusyError: If the lane is saturated, or the database stayed
+            locked by another writer for the whole busy timeout
+    """
+    async with lane.acquire():
+        async with AsyncSessionLocal() as session:
+            if lane is write_lane:
+                session.info[BEGIN_IMMEDIATE] = True
+            try:
+                yield session
+            except OperationalError as e:
+                await session.rollback()
+                if "database is locked" in str(e.orig):
+                    raise lane.reject("locked", f"Database {lane.name} lock wait timed out") from e
+                raise
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a database session in the read lane.
+    
+    Yields:
+        AsyncSession: Database session
+    """
+    async with lane_session(read_lane) as session:
+        yield session
+
+
+async def get_write_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides a database session in the write lane.
+    
+    Yields:
+        AsyncSession: Database session
+    """
+    async with lane_session(write_lane) as session:
+        yield session
+
+
 async def create_tables() -> None:
     """Create all database tables and populate with sample data if empty."""
     # Import models to ensure they are registered with the Base metadata
-    from app.models import Event, Attendee, BaseModel
+    from app.models import Event, Attendee, SeatHold, WaitlistEntry, CacheInvalidation, EventShard, BaseModel
+    from app.db.migrations import migrate_attendee_persons
     
-    async with engine.begin() as conn:
-        await conn.run_sync(BaseModel.metadata.create_all)
+    for shard_id, shard_engine in shard_engines.items():
+        # The shard directory only exists on the home shard, when sharded
+        tables = [
+            table for table in BaseModel.metadata.sorted_tables
+            if table is not EventShard.__table__ or (shard_router.enabled and shard_id == HOME_SHARD)
+        ]
+        async with shard_engine.begin() as conn:
+            await conn.run_sync(BaseModel.metadata.create_all, tables=tables)
+            await conn.run_sync(migrate_attendee_persons)
+    
+    if shard_router.enabled:
+        await shard_router.backfill()
+        await shard_router.load()
     
     # Check if database is empty and populate with sample data
     await create_sample_data()
@@ -69,13 +216,14 @@ async def create_sample_data() -> None:
     from app.models.event import Event
     from app.models.attendee import Attendee
     from app.db.sample_names import get_random_attendees
+    from app.services.persons import person_directory
     
     async with AsyncSessionLocal() as session:
-        # Check if we already have data
+        # Check if we already have data (one count per shard)
         result = await session.execute(
-            text("SELECT COUNT(*) FROM events")
+            select(func.count(Event.id))
         )
-        event_count = result.scalar()
+        event_count = sum(result.scalars().all())
         
         if event_count > 0:
             # Database already has data, skip sample data creation
@@ -135,14 +283,18 @@ async def create_sample_data() -> None:
         # Create sample attendees for each event
         sample_attendees = []
         
+        async def person_ids(event: Event, attendees: list[tuple[str, str]]) -> dict[str, int]:
+            """Person IDs of sample attendees by email, inserting the persons."""
+            return await person_directory.resolve(session, event.id, {email: name for name, email in attendees})
+        
         
         # Tech Conference 2025 attendees (48 attendees - nearly sold out)
         tech_conf_attendees = get_random_attendees(48)
         
+        ids = await person_ids(sample_events[0], tech_conf_attendees)
         for name, email in tech_conf_attendees:
             attendee = Attendee(
-                name=name,
-                email=email,
+                person_id=ids[email],
                 event_id=sample_events[0].id,
                 registered_at=datetime.now() - timedelta(days=5)
             )
@@ -150,10 +302,10 @@ async def create_sample_data() -> None:
         
         web_workshop_attendees = get_random_attendees(100)
         
+        ids = await person_ids(sample_events[1], web_workshop_attendees)
         for name, email in web_workshop_attendees:
             attendee = Attendee(
-                name=name,
-                email=email,
+                person_id=ids[email],
                 event_id=sample_events[1].id,
                 registered_at=datetime.now() - timedelta(days=3)
             )
@@ -162,10 +314,10 @@ async def create_sample_data() -> None:
         # AI & ML Summit attendees (40 attendees)
         ai_summit_attendees = get_random_attendees(250)
         
+        ids = await person_ids(sample_events[2], ai_summit_attendees)
         for name, email in ai_summit_attendees:
             attendee = Attendee(
-                name=name,
-                email=email,
+                person_id=ids[email],
                 event_id=sample_events[2].id,
                 registered_at=datetime.now() - timedelta(days=2)
             )
@@ -174,20 +326,20 @@ async def create_sample_data() -> None:
         # Startup Networking Event attendees (31 attendees)
         startup_event_attendees = get_random_attendees(100)
         
+        ids = await person_ids(sample_events[3], startup_event_attendees)
         for name, email in startup_event_attendees:
             attendee = Attendee(
-                name=name,
-                email=email,
+                person_id=ids[email],
                 event_id=sample_events[3].id,
                 registered_at=datetime.now() - timedelta(days=1)
             )
             sample_attendees.append(attendee)
         
         design_class_attendees = get_random_attendees(50)
+        ids = await person_ids(sample_events[4], design_class_attendees)
         for name, email in design_class_attendees:
             attendee = Attendee(
-                name=name,
-                email=email,
+                person_id=ids[email],
                 event_id=sample_events[4].id,
                 registered_at=datetime.now() - timedelta(hours=12)
             )
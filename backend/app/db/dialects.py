@@ -0,0 +1,32 @@
+"""
+Dialect-specific SQL constructs.
+"""
+
+from typing import Any, Callable, Dict
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+# ``insert`` constructs with ``ON CONFLICT`` support by dialect name
+CONFLICT_INSERTS: Dict[str, Callable[..., Any]] = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def conflict_insert(dialect_name: str) -> Callable[..., Any]:
+    """
+    Get the ``insert`` construct offering ``on_conflict_do_nothing`` for a dialect.
+
+    Args:
+        dialect_name: Dialect name, e.g. ``engine.dialect.name``
+
+    Returns:
+        Callable[..., Any]: The dialect's ``insert``
+
+    Raises:
+        NotImplementedError: If the dialect is neither SQLite nor PostgreSQL
+    """
+    try:
+        return CONFLICT_INSERTS[dialect_name]
+    except KeyError:
+        raise NotImplementedError(f"Inserts that skip conflicting rows are not supported on {dialect_name}")
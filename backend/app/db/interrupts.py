@@ -0,0 +1,128 @@
+"""
+Tracking and interrupting the statements a request is running.
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from contextvars import Context, ContextVar, copy_context
+from typing import Any, Iterator, Optional, Set
+
+from sqlalchemy import event
+
+from app.core.metrics import metrics
+from app.db.database import shard_engines
+
+_current: ContextVar[Optional["StatementTracker"]] = ContextVar("statement_tracker", default=None)
+
+
+def _sqlite_handle(dbapi_connection: Any) -> Optional[sqlite3.Connection]:
+    """The ``sqlite3`` connection behind SQLAlchemy's aiosqlite adapter, if any."""
+    handle = getattr(getattr(dbapi_connection, "_connection", None), "_conn", None)
+    return handle if isinstance(handle, sqlite3.Connection) else None
+
+
+class StatementCancelledError(Exception):
+    """Exception raised when a cancelled request tries to run another statement."""
+    pass
+
+
+class StatementTracker:
+    """
+    Connections currently running a statement for one request.
+
+    Cancelling the request's task would only stop the coroutine waiting
+    for a statement: aiosqlite keeps running it on its worker thread, and
+    the session's rollback and close would be cancelled too, so the
+    connection is never released cleanly. ``cancel`` instead aborts the
+    running statements through ``sqlite3.Connection.interrupt`` (safe to
+    call from another thread) and makes every later statement fail with
+    ``StatementCancelledError``. The request then unwinds through its
+    normal error handling and closes its sessions as usual.
+    """
+
+    def __init__(self) -> None:
+        self.connections: Set[Any] = set()
+        self.cancelled = False
+
+    def cancel(self) -> int:
+        """
+        Abort the statements running for the request and refuse new ones.
+
+        Returns:
+            int: Number of statements interrupted
+        """
+        self.cancelled = True
+        interrupted = 0
+        for dbapi_connection in list(self.connections):
+            handle = _sqlite_handle(dbapi_connection)
+            if handle is not None:
+                handle.interrupt()
+                interrupted += 1
+        metrics.increment("db.statements_interrupted", interrupted)
+        return interrupted
+
+
+def request_cancelled() -> bool:
+    """Whether the statements of the current request have been cancelled."""
+    tracker = _current.get()
+    return tracker is not None and tracker.cancelled
+
+
+def untracked_context() -> Context:
+    """
+    Copy of the current context in which statements are not tracked.
+
+    Run work shared by several requests in it, so it is not aborted when
+    the request that happened to start it is cancelled.
+
+    Returns:
+        Context: Context for ``asyncio.create_task``
+    """
+    context = copy_context()
+    context.run(_current.set, None)
+    return context
+
+
+@contextmanager
+def track_statements() -> Iterator[StatementTracker]:
+    """
+    Track statements run by tasks created inside the block.
+
+    Tasks copy the current context when they are created, so everything
+    a task started here runs, including its child tasks, is tracked.
+
+    Yields:
+        StatementTracker: Tracker for the statements
+    """
+    tracker = StatementTracker()
+    token = _current.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current.reset(token)
+
+
+def _statement_started(conn, cursor, statement, parameters, context, executemany) -> None:
+    tracker = _current.get()
+    if tracker is not None:
+        if tracker.cancelled:
+            raise StatementCancelledError("The request was cancelled")
+        tracker.connections.add(conn.connection.dbapi_connection)
+
+
+def _statement_finished(conn, cursor, statement, parameters, context, executemany) -> None:
+    tracker = _current.get()
+    if tracker is not None:
+        tracker.connections.discard(conn.connection.dbapi_connection)
+
+
+def _statement_failed(exception_context) -> None:
+    tracker = _current.get()
+    if tracker is not None and exception_context.connection is not None:
+        tracker.connections.discard(exception_context.connection.connection.dbapi_connection)
+
+
+for shard_engine in shard_engines.values():
+    event.listen(shard_engine.sync_engine, "before_cursor_execute", _statement_started)
+    event.listen(shard_engine.sync_engine, "after_cursor_execute", _statement_finished)
+    event.listen(shard_engine.sync_engine, "handle_error", _statement_failed)
@@ -0,0 +1,115 @@
+"""
+Bounded concurrency lanes for database work.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+
+class DatabaseBusyError(Exception):
+    """Exception raised when a database lane cannot admit more work in time."""
+
+    def __init__(self, lane: str, message: str):
+        super().__init__(message)
+        self.lane = lane
+
+
+class ConcurrencyLane:
+    """
+    Semaphore-bounded lane with a bounded, time-limited queue.
+
+    Reads and writes get separate lanes so a burst of heavy list queries
+    cannot queue ahead of short registration transactions (or the other
+    way round). Work that cannot start within ``queue_timeout`` seconds,
+    or that arrives when ``max_queue`` callers are already waiting, fails
+    fast with ``DatabaseBusyError`` instead of piling up.
+    """
+
+    def __init__(self, name: str, limit: int, queue_timeout: float, max_queue: int):
+        self.name = name
+        self.limit = limit
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_queue
+        self.active = 0
+        self.waiting = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        metrics.register_gauge(f"db.lane.{name}.active", lambda: self.active)
+        metrics.register_gauge(f"db.lane.{name}.waiting", lambda: self.waiting)
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.limit)
+        return self._semaphore
+
+    def reject(self, reason: str, message: str) -> DatabaseBusyError:
+        """
+        Count a rejection and build the error to raise for it.
+
+        Args:
+            reason: Metric suffix naming why the work was turned away
+            message: Error message
+
+        Returns:
+            DatabaseBusyError: Error for the caller to raise
+        """
+        metrics.increment(f"db.lane.{self.name}.rejected.{reason}")
+        return DatabaseBusyError(self.name, message)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """
+        Hold a slot in the lane for the duration of the block.
+
+        Raises:
+            DatabaseBusyError: If the queue is full or the wait times out
+        """
+        semaphore = self.semaphore
+
+        if semaphore.locked():
+            if self.waiting >= self.max_queue:
+                raise self.reject("queue_full", f"Database {self.name} queue is full")
+
+            self.waiting += 1
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                raise self.reject(
+                    "timeout",
+                    f"Timed out after {self.queue_timeout}s waiting for the database {self.name} lane"
+                )
+            finally:
+                self.waiting -= 1
+            metrics.observe(f"db.lane.{self.name}.wait_ms", (time.perf_counter() - started) * 1000)
+        else:
+            await semaphore.acquire()
+
+        self.active += 1
+        metrics.increment(f"db.lane.{self.name}.acquired")
+        try:
+            yield
+        finally:
+            self.active -= 1
+            semaphore.release()
+
+
+read_lane = ConcurrencyLane(
+    "read",
+    limit=settings.DB_READ_CONCURRENCY,
+    queue_timeout=settings.DB_READ_QUEUE_TIMEOUT,
+    max_queue=settings.DB_READ_MAX_QUEUE,
+)
+
+write_lane = ConcurrencyLane(
+    "write",
+    limit=settings.DB_WRITE_CONCURRENCY,
+    queue_timeout=settings.DB_WRITE_QUEUE_TIMEOUT,
+    max_queue=settings.DB_WRITE_MAX_QUEUE,
+)
@@ -0,0 +1,87 @@
+"""
+In-place upgrades of databases created by earlier versions.
+"""
+
+from sqlalchemy import MetaData, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateTable
+
+from app.core.logging import get_logger
+from app.models.attendee import Attendee
+
+logger = get_logger(__name__)
+
+# Name the slim attendees table is built under before replacing the old one
+STAGING_TABLE = "attendees_migrated"
+
+
+def migrate_attendee_persons(conn: Connection) -> int:
+    """
+    Move attendee names and emails into the ``persons`` table.
+    
+    Earlier versions stored the name and email on every attendee row.
+    Each normalized email becomes one person, named after its earliest
+    registration, and the attendees table is rebuilt to point at it.
+    Registrations that only differed in the case or spacing of the email
+    collapse into the earliest one, and the event's attendee count drops
+    accordingly. Runs inside the caller's transaction, so a failure
+    leaves the database as it was. Does nothing on a migrated database.
+    
+    Args:
+        conn: Connection to one shard, inside a transaction
+        
+    Returns:
+        int: Number of attendees migrated
+    """
+    columns = {column["name"] for column in inspect(conn).get_columns("attendees")}
+    if "email" not in columns:
+        return 0
+    
+    # Ordered by ID, so the earliest registration names the person. The
+    # ON CONFLICT clause works on SQLite and PostgreSQL alike; SQLite needs
+    # the WHERE to tell it apart from a join constraint
+    conn.exec_driver_sql(
+        "INSERT INTO persons (email, name, created_at, updated_at) "
+        "SELECT lower(trim(email)), name, created_at, updated_at FROM attendees WHERE true ORDER BY id "
+        "ON CONFLICT DO NOTHING"
+    )
+    
+    # Same columns and constraints as the model; its indexes come after the rename
+    metadata = MetaData()
+    for fk in Attendee.__table__.foreign_keys:
+        fk.column.table.to_metadata(metadata)
+    staging = Attendee.__table__.to_metadata(metadata, name=STAGING_TABLE)
+    conn.execute(CreateTable(staging))
+    conn.exec_driver_sql(
+        f"INSERT INTO {STAGING_TABLE} (id, person_id, event_id, registered_at, created_at, updated_at) "
+        "SELECT attendees.id, persons.id, attendees.event_id, attendees.registered_at, "
+        "attendees.created_at, attendees.updated_at "
+        "FROM attendees JOIN persons ON persons.email = lower(trim(attendees.email)) "
+        "WHERE true ORDER BY attendees.id "
+        "ON CONFLICT DO NOTHING"
+    )
+    migrated = conn.exec_driver_sql(f"SELECT count(*) FROM {STAGING_TABLE}").scalar()
+    total = conn.exec_driver_sql("SELECT count(*) FROM attendees").scalar()
+    if migrated < total:
+        conn.exec_driver_sql(
+            "UPDATE events SET current_attendees = current_attendees "
+            "- (SELECT count(*) FROM attendees WHERE attendees.event_id = events.id) "
+            f"+ (SELECT count(*) FROM {STAGING_TABLE} WHERE {STAGING_TABLE}.event_id = events.id)"
+        )
+    
+    conn.exec_driver_sql("DROP TABLE attendees")
+    conn.exec_driver_sql(f"ALTER TABLE {STAGING_TABLE} RENAME TO attendees")
+    if conn.dialect.name == "postgresql":
+        # The copied IDs bypassed the new table's sequence
+        conn.exec_driver_sql(
+            "SELECT setval(pg_get_serial_sequence('attendees', 'id'), coalesce(max(id), 0) + 1, false) "
+            "FROM attendees"
+        )
+    for index in Attendee.__table__.indexes:
+        index.create(conn)
+    
+    logger.info(
+        f"Moved attendee identities to persons: {migrated} attendees migrated, "
+        f"{total - migrated} duplicate registrations merged"
+    )
+    return migrated
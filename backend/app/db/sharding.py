@@ -0,0 +1,256 @@
+"""
+Routing of events and their rows to database shards.
+"""
+
+from typing import Any, Dict, Iterable, List, Set
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter
+from sqlalchemy.sql.schema import Column
+
+from app.core.logging import get_logger
+from app.db.dialects import conflict_insert
+from app.models.event import Event
+from app.models.event_shard import EventShard
+
+logger = get_logger(__name__)
+
+# Shard holding the directory, and everything that is not per event
+HOME_SHARD = "0"
+
+# Tables whose rows belong to the event in their ``event_id`` column
+EVENT_TABLES = {"attendees", "seat_holds", "waitlist_entries", "waiting_rooms", "queue_ticket_claims"}
+
+
+class ShardRouter:
+    """
+    Places every event, with its attendees, waitlist, seat holds and
+    waiting room, on one of several database files.
+
+    Shard ``0`` is ``DATABASE_URL``; the others are ``DATABASE_SHARD_URLS``
+    in order. New events take their ID from the ``event_shards`` directory
+    on the home shard and are placed on shard ``id % N``; the directory
+    records where each event lives, so ``tools/rebalance.py`` can move an
+    event to another shard. Every worker keeps the directory in memory.
+
+    The choosers plug into SQLAlchemy's ``ShardedSession``. A statement
+    goes to the shards of the events its criteria name (``event_id ==``,
+    ``event_id IN`` or the same on ``events.id``), an insert to the shard
+    of its rows' ``event_id`` and a flushed object to its event's shard.
+    Anything else, such as the upcoming events list, runs on every shard
+    and the results are concatenated. Criteria combining event keys with
+    ``OR`` are not supported.
+
+    With a single shard the router is disabled, sessions are plain
+    ``AsyncSession`` objects and every event maps to the home shard.
+    """
+
+    def __init__(self, engines: Dict[str, AsyncEngine]):
+        self.engines = engines
+        self.shard_ids = list(engines)
+        self._directory: Dict[int, str] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether more than one shard is configured."""
+        return len(self.shard_ids) > 1
+
+    def shard_for_event(self, event_id: int) -> str:
+        """
+        Get the shard holding an event.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            str: Shard ID
+        """
+        shard_id = self._directory.get(event_id)
+        if shard_id is None:
+            shard_id = self.shard_ids[event_id % len(self.shard_ids)]
+        return shard_id
+
+    def shards_for_events(self, event_ids: Iterable[int]) -> List[str]:
+        """
+        Get the shards holding several events.
+
+        Args:
+            event_ids: Event IDs
+
+        Returns:
+            List[str]: Distinct shard IDs, in shard order
+        """
+        shard_ids = {self.shard_for_event(event_id) for event_id in event_ids}
+        return [shard_id for shard_id in self.shard_ids if shard_id in shard_ids]
+
+    def _assign(self, event_id: int, shard: int) -> None:
+        self._directory[event_id] = self.shard_ids[shard]
+
+    async def backfill(self) -> int:
+        """
+        Add directory rows for events that have none yet.
+
+        Events created before sharding was configured stay on the shard
+        they are on.
+
+        Returns:
+            int: Number of events added to the directory
+        """
+        added = 0
+        async with self.engines[HOME_SHARD].begin() as home:
+            for index, shard_id in enumerate(self.shard_ids):
+                async with self.engines[shard_id].connect() as conn:
+                    event_ids = (await conn.execute(select(Event.id))).scalars().all()
+                if event_ids:
+                    result = await home.execute(
+                        conflict_insert(home.dialect.name)(EventShard).on_conflict_do_nothing(),
+                        [{"id": event_id, "shard": index} for event_id in event_ids]
+                    )
+                    added += result.rowcount
+        if added:
+            logger.info(f"Added {added} existing events to the shard directory")
+        return added
+
+    async def load(self) -> None:
+        """Load the whole shard directory."""
+        async with self.engines[HOME_SHARD].connect() as conn:
+            rows = (await conn.execute(select(EventShard.id, EventShard.shard))).all()
+        self._directory = {}
+        for row in rows:
+            self._assign(row.id, row.shard)
+        logger.info(f"Loaded the shard directory: {len(rows)} events on {len(self.shard_ids)} shards")
+
+    async def reload(self, event_ids: List[int]) -> None:
+        """
+        Re-read where some events live after they were moved.
+
+        Args:
+            event_ids: Event IDs
+        """
+        async with self.engines[HOME_SHARD].connect() as conn:
+            rows = (await conn.execute(
+                select(EventShard.id, EventShard.shard).where(EventShard.id.in_(event_ids))
+            )).all()
+        for row in rows:
+            self._assign(row.id, row.shard)
+
+    def allocate_event_ids(self, session: Session, flush_context: Any, instances: Any) -> None:
+        """
+        ``before_flush`` hook giving new events an ID and a shard.
+
+        The directory row is written in the flushing transaction, so it
+        is rolled back together with the event.
+        """
+        for obj in session.new:
+            if not isinstance(obj, Event) or obj.id is not None:
+                continue
+            next_id = func.coalesce(func.max(EventShard.id), 0) + 1
+            row = session.execute(
+                insert(EventShard)
+                .from_select(["id", "shard"], select(next_id, next_id % len(self.shard_ids)))
+                .returning(EventShard.id, EventShard.shard),
+                bind_arguments={"shard_id": HOME_SHARD}
+            ).one()
+            obj.id = row.id
+            self._assign(row.id, row.shard)
+
+    async def move(self, event_id: int, shard_id: str, conn: Any) -> None:
+        """
+        Record that an event now lives on another shard.
+
+        Args:
+            event_id: Event ID
+            shard_id: Shard now holding the event
+            conn: Open connection to the home shard; the caller commits
+        """
+        await conn.execute(
+            update(EventShard)
+            .where(EventShard.id == event_id)
+            .values(shard=self.shard_ids.index(shard_id))
+        )
+
+    def _is_event_key(self, column: Any) -> bool:
+        if not isinstance(column, Column) or column.table is None:
+            return False
+        if column.table.name == "events":
+            return column.key == "id"
+        return column.table.name in EVENT_TABLES and column.key == "event_id"
+
+    def _criteria_event_ids(self, clause: Any) -> Set[int]:
+        event_ids: Set[int] = set()
+        if clause is None:
+            return event_ids
+        for node in visitors.iterate(clause):
+            if (
+                isinstance(node, BinaryExpression)
+                and isinstance(node.right, BindParameter)
+                and self._is_event_key(node.left)
+            ):
+                value = node.right.effective_value
+                if node.operator is operators.eq:
+                    event_ids.add(value)
+                elif node.operator is operators.in_op:
+                    event_ids.update(value or [])
+        return event_ids
+
+    def choose_shard(self, mapper: Any, instance: Any, clause: Any = None) -> str:
+        """
+        ``shard_chooser``: the shard an object is flushed to.
+
+        Statements that reach it without a mapped instance, such as raw
+        SQL, run on the home shard.
+        """
+        if isinstance(instance, Event) and instance.id is not None:
+            return self.shard_for_event(instance.id)
+        event_id = getattr(instance, "event_id", None)
+        if event_id is not None:
+            return self.shard_for_event(event_id)
+        return HOME_SHARD
+
+    def choose_identity(
+        self,
+        mapper: Any,
+        primary_key: Any,
+        *,
+        lazy_loaded_from: Any,
+        execution_options: Any,
+        bind_arguments: Any,
+        **kw: Any
+    ) -> List[str]:
+        """``identity_chooser``: the shards to look up a primary key on."""
+        if lazy_loaded_from is not None:
+            return [lazy_loaded_from.identity_token]
+        if mapper.class_ is Event:
+            return [self.shard_for_event(primary_key[0])]
+        if mapper.class_ is EventShard:
+            return [HOME_SHARD]
+        return self.shard_ids
+
+    def choose_execute(self, orm_context: ORMExecuteState) -> List[str]:
+        """
+        ``execute_chooser``: the shards a statement runs on.
+
+        Raises:
+            ValueError: If an insert names no event to route its rows by
+        """
+        mapper = orm_context.bind_mapper
+        if mapper is not None and mapper.class_ is EventShard:
+            return [HOME_SHARD]
+        if orm_context.is_select and orm_context.lazy_loaded_from is not None:
+            return [orm_context.lazy_loaded_from.identity_token]
+
+        if orm_context.is_insert:
+            parameters = orm_context.parameters
+            rows = parameters if isinstance(parameters, list) else [parameters or {}]
+            event_ids = {row.get("event_id") for row in rows}
+            if None in event_ids:
+                raise ValueError(f"Cannot route an insert into {mapper} without event_id")
+            return self.shards_for_events(event_ids)
+
+        event_ids = self._criteria_event_ids(orm_context.statement.whereclause)
+        if event_ids:
+            return self.shards_for_events(event_ids)
+        return self.shard_ids
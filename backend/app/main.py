@@ -10,11 +10,31 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 
 from app.api.v1.router import api_router
+from app.core.admission import admission_controller
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.db.database import create_tables
+from app.middleware.admission import AdmissionControlMiddleware
+from app.middleware.deadline import RequestDeadlineMiddleware
 from app.middleware.error_handler import ErrorHandlerMiddleware
+from app.middleware.hot_events import HotEventMiddleware
+from app.middleware.idempotency import IdempotencyMiddleware
 from app.middleware.request_id import RequestIDMiddleware
+from app.services.capacity_feed import capacity_broadcaster
+from app.services.catalog import event_catalog
+from app.services.invalidation import (
+    EVENTS_CACHE,
+    MEMBERSHIP_CACHE,
+    SHARDS_CACHE,
+    WAITING_ROOMS_CACHE,
+    add_memberships,
+    invalidation_bus,
+    reload_events,
+    reload_shards
+)
+from app.services.seat_hold import seat_hold_reaper
+from app.services.waiting_room import reload_waiting_rooms, waiting_rooms
+from app.services.warmup import warmup
 
 
 @asynccontextmanager
@@ -26,11 +46,39 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     setup_logging()
     await create_tables()
+    admission_controller.start()
+    if settings.CATALOG_ENABLED or settings.CAPACITY_FEED_ENABLED:
+        # The capacity feed watches the catalog even when lists don't use it
+        await event_catalog.refresh()
+        event_catalog.start()
+    if settings.CAPACITY_FEED_ENABLED:
+        event_catalog.add_listener(capacity_broadcaster.publish)
+        capacity_broadcaster.start()
+    await seat_hold_reaper.load()
+    seat_hold_reaper.start()
+    await waiting_rooms.load()
+    if settings.INVALIDATION_ENABLED:
+        invalidation_bus.subscribe(EVENTS_CACHE, reload_events)
+        invalidation_bus.subscribe(MEMBERSHIP_CACHE, add_memberships)
+        invalidation_bus.subscribe(SHARDS_CACHE, reload_shards)
+        invalidation_bus.subscribe(WAITING_ROOMS_CACHE, reload_waiting_rooms)
+        await invalidation_bus.load()
+        invalidation_bus.start()
+    if settings.WARMUP_ENABLED:
+        # Serve liveness probes meanwhile; readiness waits for warm-up
+        warmup.start(app)
+    else:
+        warmup.mark_ready()
     
     yield
     
     # Shutdown
-    # Add cleanup logic here if needed
+    await warmup.stop()
+    await invalidation_bus.stop()
+    await seat_hold_reaper.stop()
+    await capacity_broadcaster.stop()
+    await event_catalog.stop()
+    await admission_controller.stop()
 
 
 def create_app() -> FastAPI:
@@ -51,8 +99,13 @@ def create_app() -> FastAPI:
     )
 
     # Add middleware (order matters!)
+    app.add_middleware(IdempotencyMiddleware)
     app.add_middleware(RequestIDMiddleware)
     app.add_middleware(ErrorHandlerMiddleware)
+    app.add_middleware(AdmissionControlMiddleware)
+    app.add_middleware(RequestDeadlineMiddleware)
+    # Outside admission control, so shed and rate limited traffic is counted too
+    app.add_middleware(HotEventMiddleware)
 
 
     app.add_middleware(
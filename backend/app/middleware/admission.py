@@ -0,0 +1,98 @@
+"""
+Admission control middleware for rate limiting and load shedding.
+"""
+
+import re
+from typing import Callable, Optional
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.admission import AdmissionController, AdmissionDecision, admission_controller
+from app.core.config import settings
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class AdmissionControlMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that rejects requests before they reach the application.
+
+    Overloaded servers answer 503 and rate limited clients answer 429,
+    both with a ``Retry-After`` header so well-behaved clients back off
+    instead of retrying immediately.
+    """
+
+    def __init__(self, app, controller: AdmissionController = admission_controller):
+        super().__init__(app)
+        self.controller = controller
+        self.registration_path = re.compile(
+            rf"^{re.escape(settings.API_PREFIX)}/{re.escape(settings.API_VERSION)}"
+            r"/events/(?P<event_id>\d+)/(?:attendees(?:/bulk)?|holds)/?$"
+        )
+        # Each request inside a batch is admitted on its own
+        self.batch_path = re.compile(
+            rf"^{re.escape(settings.API_PREFIX)}/{re.escape(settings.API_VERSION)}/batch/?$"
+        )
+        # Health probes must answer even when the worker sheds load
+        self.health_path = re.compile(
+            rf"^{re.escape(settings.API_PREFIX)}/{re.escape(settings.API_VERSION)}/health/"
+        )
+
+    def _client_id(self, request: Request) -> str:
+        if settings.RATE_LIMIT_CLIENT_HEADER:
+            value = request.headers.get(settings.RATE_LIMIT_CLIENT_HEADER)
+            if value:
+                return value.split(",")[0].strip()
+        return request.client.host if request.client else "unknown"
+
+    def _event_id(self, request: Request) -> Optional[int]:
+        if request.method != "POST":
+            return None
+        match = self.registration_path.match(request.url.path)
+        return int(match.group("event_id")) if match else None
+
+    def _reject(self, decision: AdmissionDecision) -> Response:
+        return JSONResponse(
+            status_code=decision.status_code,
+            content={
+                "success": False,
+                "error": decision.message,
+                "code": decision.reason.upper()
+            },
+            headers={"Retry-After": str(decision.retry_after)}
+        )
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Admit, rate limit or shed the request.
+
+        Args:
+            request: The incoming request
+            call_next: The next middleware or endpoint
+
+        Returns:
+            Response: The response or a 429/503 rejection
+        """
+        if not settings.ADMISSION_CONTROL_ENABLED or self.health_path.match(request.url.path):
+            return await call_next(request)
+
+        decision = self.controller.check_load()
+        if (
+            decision is None
+            and request.method in WRITE_METHODS
+            and not self.batch_path.match(request.url.path)
+        ):
+            decision = await self.controller.check_rate_limits(
+                self._client_id(request),
+                self._event_id(request)
+            )
+        if decision is not None:
+            return self._reject(decision)
+
+        self.controller.enter()
+        try:
+            return await call_next(request)
+        finally:
+            self.controller.leave()
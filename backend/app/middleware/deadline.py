@@ -0,0 +1,154 @@
+"""
+Request cancellation middleware for client disconnects and route deadlines.
+"""
+
+import asyncio
+from typing import Any, List, Optional, Pattern, Tuple
+
+from fastapi.responses import JSONResponse
+from starlette.status import HTTP_504_GATEWAY_TIMEOUT
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.interrupts import StatementTracker, track_statements
+
+logger = get_logger(__name__)
+
+# Writes always run to completion so their post-commit cache updates
+# (catalog, membership filters, invalidations) are never skipped
+CANCELLABLE_METHODS = {"GET", "HEAD"}
+
+# Seconds a cancelled request may take to unwind before its task is cancelled
+CANCEL_GRACE_SECONDS = 1.0
+
+
+class RequestDeadlineMiddleware:
+    """
+    Middleware that stops read requests nobody is waiting for any more.
+
+    A ``GET`` is cancelled when its client disconnects or when it has run
+    longer than the deadline configured for its route in
+    ``REQUEST_DEADLINES``, as long as no response has started. Its
+    running SQLite statements are interrupted and further statements
+    refused, so the request fails fast and its connection is rolled back
+    and released at once instead of after the query would have finished.
+    An expired deadline is answered with 504; a disconnected client gets
+    nothing.
+
+    This is a plain ASGI middleware rather than a ``BaseHTTPMiddleware``:
+    noticing a disconnect means listening on the receive channel while
+    the endpoint runs, and the endpoint still has to get its messages.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._deadlines: Optional[List[Tuple[str, Pattern, float]]] = None
+
+    def _compile_deadlines(self, app: Any) -> List[Tuple[str, Pattern, float]]:
+        routes = {getattr(route, "path", None): route for route in getattr(app, "routes", [])}
+        deadlines = []
+        for key, seconds in settings.REQUEST_DEADLINES.items():
+            method, path = key.split(" ", 1)
+            route = routes.get(path)
+            if route is None:
+                logger.warning(f"REQUEST_DEADLINES entry {key!r} matches no route")
+                continue
+            deadlines.append((method, route.path_regex, seconds))
+        return deadlines
+
+    def _deadline(self, scope: Scope) -> Optional[float]:
+        if self._deadlines is None:
+            self._deadlines = self._compile_deadlines(scope.get("app"))
+        for method, path, seconds in self._deadlines:
+            if scope["method"] == method and path.match(scope["path"]):
+                return seconds
+        return None
+
+    def _deadline_exceeded(self) -> JSONResponse:
+        return JSONResponse(
+            status_code=HTTP_504_GATEWAY_TIMEOUT,
+            content={
+                "success": False,
+                "error": "The request took longer than its deadline",
+                "code": "DEADLINE_EXCEEDED"
+            }
+        )
+
+    async def _cancel(self, task: asyncio.Task, statements: StatementTracker) -> None:
+        statements.cancel()
+        # Let the request unwind through its own error handling, which
+        # rolls back and closes its sessions; only force it if it is
+        # stuck somewhere else
+        done, _ = await asyncio.wait({task}, timeout=CANCEL_GRACE_SECONDS)
+        if not done:
+            task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"Cancelled request raised {type(e).__name__}: {e}")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in CANCELLABLE_METHODS
+            or not settings.REQUEST_CANCELLATION_ENABLED
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        deadline = self._deadline(scope)
+        messages: asyncio.Queue = asyncio.Queue()
+        disconnected = asyncio.Event()
+        response_started = False
+        cancelled = False
+
+        async def listen() -> None:
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                    return
+
+        async def receive_message() -> Message:
+            return await messages.get()
+
+        async def send_message(message: Message) -> None:
+            nonlocal response_started
+            if cancelled:
+                # Whatever the request answers after being cancelled is dropped
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        with track_statements() as statements:
+            task = asyncio.create_task(self.app(scope, receive_message, send_message))
+        listener = asyncio.create_task(listen())
+        disconnect = asyncio.create_task(disconnected.wait())
+        try:
+            done, _ = await asyncio.wait({task, disconnect}, timeout=deadline, return_when=asyncio.FIRST_COMPLETED)
+            if task in done or response_started:
+                # Finished, or streaming: the response handles disconnects itself
+                await task
+                return
+
+            cancelled = True
+            await self._cancel(task, statements)
+            if disconnect in done:
+                metrics.increment("requests.cancelled_disconnect")
+                logger.info(f"Cancelled {scope['method']} {scope['path']}: client disconnected")
+            else:
+                metrics.increment("requests.cancelled_deadline")
+                logger.warning(f"Cancelled {scope['method']} {scope['path']}: exceeded its {deadline}s deadline")
+                await self._deadline_exceeded()(scope, receive, send)
+        finally:
+            if not task.done():
+                cancelled = True
+                await self._cancel(task, statements)
+            listener.cancel()
+            disconnect.cancel()
@@ -8,9 +8,12 @@ from typing import Callable
 from fastapi import Request, Response, HTTPException
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR, HTTP_503_SERVICE_UNAVAILABLE
 
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.db.interrupts import request_cancelled
+from app.db.lanes import DatabaseBusyError
 from app.services.exceptions import ServiceError
 
 logger = get_logger(__name__)
@@ -43,6 +46,19 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             # Let FastAPI handle HTTP exceptions
             raise
         
+        except DatabaseBusyError as e:
+            # Database lane saturated, ask the client to back off
+            logger.warning(f"Database busy: {str(e)}")
+            return JSONResponse(
+                status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                content={
+                    "success": False,
+                    "error": str(e),
+                    "code": "DATABASE_BUSY"
+                },
+                headers={"Retry-After": str(settings.DB_BUSY_RETRY_AFTER_SECONDS)}
+            )
+        
         except ServiceError as e:
             # Handle service layer exceptions
             logger.warning(f"Service error: {str(e)}", exc_info=True)
@@ -56,12 +72,16 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             )
         
         except Exception as e:
-            # Handle unexpected exceptions
-            logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
-            
-            # Log the full traceback in development
-            if hasattr(request.app.state, "debug") and request.app.state.debug:
-                logger.error(f"Traceback: {traceback.format_exc()}")
+            if request_cancelled():
+                # Aborted on purpose; nobody reads this response
+                logger.info(f"Cancelled request stopped: {str(e)}")
+            else:
+                # Handle unexpected exceptions
+                logger.error(f"Unhandled exception: {str(e)}", exc_info=True)
+                
+                # Log the full traceback in development
+                if hasattr(request.app.state, "debug") and request.app.state.debug:
+                    logger.error(f"Traceback: {traceback.format_exc()}")
             
             return JSONResponse(
                 status_code=HTTP_500_INTERNAL_SERVER_ERROR,
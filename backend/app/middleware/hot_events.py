@@ -0,0 +1,44 @@
+"""
+Hot event tracking middleware.
+"""
+
+import re
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.hot_events import READS, REGISTRATIONS, HotEventTracker, hot_events
+
+READ_METHODS = {"GET", "HEAD"}
+
+
+class HotEventMiddleware:
+    """
+    Middleware that counts the requests made for each event.
+
+    Reads are any ``GET`` under ``/events/{event_id}``; registrations are
+    the ``POST`` requests that take a seat (attendees, bulk, holds and
+    hold confirmations). Requests inside a batch pass through here on
+    their own and are counted individually. A request is counted when it
+    arrives, whatever its outcome, since the point is to see where the
+    traffic goes.
+    """
+
+    def __init__(self, app: ASGIApp, tracker: HotEventTracker = hot_events):
+        self.app = app
+        self.tracker = tracker
+        self.event_path = re.compile(
+            rf"^{re.escape(settings.API_PREFIX)}/{re.escape(settings.API_VERSION)}"
+            r"/events/(?P<event_id>\d+)(?P<rest>/.*)?$"
+        )
+        self.registration_path = re.compile(r"^/(?:attendees(?:/bulk)?|holds(?:/[^/]+/confirm)?)/?$")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and settings.HOT_EVENTS_ENABLED:
+            match = self.event_path.match(scope["path"])
+            if match:
+                if scope["method"] in READ_METHODS:
+                    self.tracker.record(READS, int(match.group("event_id")))
+                elif scope["method"] == "POST" and self.registration_path.match(match.group("rest") or ""):
+                    self.tracker.record(REGISTRATIONS, int(match.group("event_id")))
+        await self.app(scope, receive, send)
@@ -0,0 +1,144 @@
+"""
+Idempotency middleware for safely retried writes.
+"""
+
+import asyncio
+import re
+from typing import Callable, List, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
+
+from app.core.config import settings
+from app.core.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    IdempotencyStore,
+    StoredResponse,
+    digest,
+    idempotency_store
+)
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+
+logger = get_logger(__name__)
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+# Outcomes a retry with the same key should be allowed to change: the
+# request was turned away before it ran (waiting room, rate limits) or
+# timed out. Everything else below 500 is final and is stored.
+RETRYABLE_STATUSES = {403, 408, 425, 428, 429}
+
+
+class IdempotencyMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that makes keyed event creation and registrations idempotent.
+
+    A ``POST`` carrying an ``Idempotency-Key`` header is run once; later
+    requests with the same key and body get the stored response back,
+    marked with ``Idempotent-Replayed: true``, without reaching the
+    endpoint. A request arriving while the first one is still running
+    waits for it and shares its response. Reusing a key with a different
+    body is rejected with 422. Server errors are never stored, so a
+    failed request can be retried under the same key.
+    """
+
+    def __init__(self, app, store: IdempotencyStore = idempotency_store):
+        super().__init__(app)
+        self.store = store
+        prefix = rf"^{re.escape(settings.API_PREFIX)}/{re.escape(settings.API_VERSION)}"
+        self.paths = re.compile(
+            prefix + r"/events(?:/\d+/(?:attendees(?:/bulk)?|holds))?/?$"
+        )
+
+    def _replay(self, entry: StoredResponse) -> Response:
+        response = self._build(entry.status_code, entry.headers, entry.body)
+        response.headers[REPLAYED_HEADER] = "true"
+        return response
+
+    def _build(self, status_code: int, headers: List[Tuple[str, str]], body: bytes) -> Response:
+        response = Response(content=body, status_code=status_code)
+        for name, value in headers:
+            response.headers.append(name, value)
+        return response
+
+    def _key_reused(self) -> Response:
+        return JSONResponse(
+            status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+            content={
+                "success": False,
+                "error": f"{IDEMPOTENCY_KEY_HEADER} was already used for a different request",
+                "code": "IDEMPOTENCY_KEY_REUSED"
+            }
+        )
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Replay, coalesce or run a keyed request.
+
+        Args:
+            request: The incoming request
+            call_next: The next middleware or endpoint
+
+        Returns:
+            Response: The stored, shared or fresh response
+        """
+        idempotency_key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+        if (
+            not settings.IDEMPOTENCY_ENABLED
+            or not idempotency_key
+            or request.method != "POST"
+            or not self.paths.match(request.url.path)
+        ):
+            return await call_next(request)
+
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            return JSONResponse(
+                status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+                content={
+                    "success": False,
+                    "error": f"{IDEMPOTENCY_KEY_HEADER} must be at most {MAX_KEY_LENGTH} characters",
+                    "code": "IDEMPOTENCY_KEY_INVALID"
+                }
+            )
+
+        key = digest(request.url.path.rstrip("/").encode(), idempotency_key.encode())
+        fingerprint = digest(await request.body())
+
+        while True:
+            entry = self.store.get(key)
+            if entry is not None:
+                if entry.fingerprint != fingerprint:
+                    return self._key_reused()
+                metrics.increment("idempotency.replayed")
+                return self._replay(entry)
+
+            in_flight = self.store.in_flight(key)
+            if in_flight is None:
+                break
+            in_flight_fingerprint, future = in_flight
+            if in_flight_fingerprint != fingerprint:
+                return self._key_reused()
+            metrics.increment("idempotency.coalesced")
+            shared: Optional[StoredResponse] = await asyncio.shield(future)
+            if shared is not None:
+                return self._replay(shared)
+            # The first request failed without a response; try again
+
+        self.store.begin(key, fingerprint)
+        shared = None
+        try:
+            response = await call_next(request)
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            headers = [
+                (name, value) for name, value in response.headers.items()
+                if name.lower() != "content-length"
+            ]
+            if response.status_code < 500 and response.status_code not in RETRYABLE_STATUSES:
+                shared = self.store.put(key, fingerprint, response.status_code, headers, body)
+            return self._build(response.status_code, headers, body)
+        finally:
+            self.store.finish(key, shared)
@@ -2,6 +2,12 @@
 
 from app.models.base import BaseModel
 from app.models.event import Event
+from app.models.person import Person
 from app.models.attendee import Attendee
+from app.models.seat_hold import SeatHold
+from app.models.waitlist import WaitlistEntry
+from app.models.waiting_room import QueueTicketClaim, WaitingRoom
+from app.models.cache_invalidation import CacheInvalidation
+from app.models.event_shard import EventShard
 
-__all__ = ["BaseModel", "Event", "Attendee"]
+__all__ = ["BaseModel", "Event", "Person", "Attendee", "SeatHold", "WaitlistEntry", "WaitingRoom", "QueueTicketClaim", "CacheInvalidation", "EventShard"]
@@ -5,10 +5,11 @@ Attendee model for the database.
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import DateTime, ForeignKey, Integer, UniqueConstraint, select
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 from app.models.base import BaseModel
+from app.models.person import Person
 
 if TYPE_CHECKING:
     from app.models.event import Event
@@ -18,27 +19,28 @@ class Attendee(BaseModel):
     """
     Attendee model representing event attendees.
     
+    A registration only links a person to an event; the name and email
+    live on the ``persons`` row and are read through correlated
+    subqueries, so they can be selected, returned and filtered on like
+    columns but not written.
+    
     Attributes:
-        name: Attendee name
-        email: Attendee email address
+        person_id: Foreign key to the person
         event_id: Foreign key to the event
         registered_at: Registration timestamp
+        name: Person name (read-only)
+        email: Person email address (read-only)
         event: Relationship to the event
     """
     
     __tablename__ = "attendees"
     
     # Core fields
-    name: Mapped[str] = mapped_column(
-        String(255), 
+    person_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("persons.id"),
         nullable=False,
-        comment="Attendee name"
-    )
-    email: Mapped[str] = mapped_column(
-        String(255), 
-        nullable=False, 
-        index=True,
-        comment="Attendee email address"
+        comment="Foreign key to the person"
     )
     event_id: Mapped[int] = mapped_column(
         Integer,
@@ -54,6 +56,14 @@ class Attendee(BaseModel):
         comment="Registration timestamp"
     )
     
+    # Identity, read from the person
+    name: Mapped[str] = column_property(
+        select(Person.name).where(Person.id == person_id).correlate_except(Person).scalar_subquery()
+    )
+    email: Mapped[str] = column_property(
+        select(Person.email).where(Person.id == person_id).correlate_except(Person).scalar_subquery()
+    )
+    
     # Relationships
     event: Mapped["Event"] = relationship(
         "Event",
@@ -64,12 +74,12 @@ class Attendee(BaseModel):
     # Constraints
     __table_args__ = (
         UniqueConstraint(
-            'email', 
-            'event_id', 
-            name='uix_attendee_email_event'
+            'person_id',
+            'event_id',
+            name='uix_attendee_person_event'
         ),
     )
     
     def __repr__(self) -> str:
         """String representation of the attendee."""
-        return f"<Attendee(id={self.id}, name='{self.name}', email='{self.email}', event_id={self.event_id})>"
+        return f"<Attendee(id={self.id}, person_id={self.person_id}, event_id={self.event_id})>"
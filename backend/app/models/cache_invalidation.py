@@ -0,0 +1,38 @@
+"""
+Cache invalidation model for the database.
+"""
+
+from sqlalchemy import Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class CacheInvalidation(BaseModel):
+    """
+    Change-log row telling other workers to refresh a cached key.
+    
+    Rows are written in the same transaction as the change they describe
+    and read back by every worker in ``id`` order. The table uses
+    ``AUTOINCREMENT`` so IDs keep growing after old rows are pruned and a
+    worker's high-water mark never points past new rows.
+    
+    Attributes:
+        origin: Worker that wrote the change; it skips its own rows
+        cache: Name of the affected cache
+        key: Affected key within the cache
+    """
+    
+    __tablename__ = "cache_invalidations"
+    __table_args__ = (
+        Index("ix_cache_invalidations_created_at", "created_at"),
+        {"sqlite_autoincrement": True},
+    )
+    
+    origin: Mapped[str] = mapped_column(String(32), nullable=False, comment="Writing worker")
+    cache: Mapped[str] = mapped_column(String(64), nullable=False, comment="Cache name")
+    key: Mapped[str] = mapped_column(String(320), nullable=False, comment="Invalidated key")
+    
+    def __repr__(self) -> str:
+        """String representation of the cache invalidation."""
+        return f"<CacheInvalidation(id={self.id}, cache='{self.cache}', key='{self.key}')>"
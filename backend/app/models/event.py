@@ -66,12 +66,12 @@ class Event(BaseModel):
         comment="Current number of registered attendees"
     )
     
-    # Relationships
+    # Relationships (loaded on access only; an event can have a very large roster)
     attendees: Mapped[List["Attendee"]] = relationship(
         "Attendee",
         back_populates="event",
         cascade="all, delete-orphan",
-        lazy="selectin"
+        lazy="select"
     )
     
     # Constraints
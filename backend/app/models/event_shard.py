@@ -0,0 +1,29 @@
+"""
+Event shard directory model for the database.
+"""
+
+from sqlalchemy import Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class EventShard(BaseModel):
+    """
+    Directory row placing one event on a database shard.
+    
+    The table lives on the home shard only and is used when more than one
+    shard is configured. Its ``id`` is the event's ID: new events take the
+    next ID from this table, so event IDs stay unique across every shard.
+    
+    Attributes:
+        shard: Index of the shard holding the event and its rows
+    """
+    
+    __tablename__ = "event_shards"
+    
+    shard: Mapped[int] = mapped_column(Integer, nullable=False, comment="Shard index")
+    
+    def __repr__(self) -> str:
+        """String representation of the event shard."""
+        return f"<EventShard(id={self.id}, shard={self.shard})>"
@@ -0,0 +1,40 @@
+"""
+Person model for the database.
+"""
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class Person(BaseModel):
+    """
+    Person model holding one registrant's identity.
+    
+    Every normalized email is stored once per database shard, and attendee
+    rows point at it instead of repeating the name and email for each
+    event. The name is the one given at the person's first registration.
+    
+    Attributes:
+        email: Normalized (trimmed, lower-case) email address
+        name: Person name
+    """
+    
+    __tablename__ = "persons"
+    
+    email: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        unique=True,
+        comment="Normalized email address"
+    )
+    name: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Person name"
+    )
+    
+    def __repr__(self) -> str:
+        """String representation of the person."""
+        return f"<Person(id={self.id}, email='{self.email}')>"
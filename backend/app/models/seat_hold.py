@@ -0,0 +1,50 @@
+"""
+Seat hold model for the database.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class SeatHold(BaseModel):
+    """
+    Seat hold model representing a seat reserved during checkout.
+    
+    A hold counts towards the event's ``current_attendees`` until it is
+    confirmed (the seat passes to the new attendee), released or expires.
+    
+    Attributes:
+        event_id: Foreign key to the event
+        token: Opaque token the client uses to confirm or release the hold
+        expires_at: Time after which the hold is reclaimed
+    """
+    
+    __tablename__ = "seat_holds"
+    
+    event_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Foreign key to the event"
+    )
+    token: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        unique=True,
+        comment="Opaque hold token"
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
+        comment="Hold expiry timestamp"
+    )
+    
+    def __repr__(self) -> str:
+        """String representation of the seat hold."""
+        return f"<SeatHold(id={self.id}, event_id={self.event_id}, expires_at={self.expires_at})>"
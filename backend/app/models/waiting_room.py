@@ -0,0 +1,97 @@
+"""
+Waiting room models for the database.
+"""
+
+from sqlalchemy import Boolean, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class WaitingRoom(BaseModel):
+    """
+    Waiting room model holding the settings of an event's queue.
+
+    Only the settings are shared through this row; every worker issues
+    tickets from its own share of the admission rate, so taking a ticket
+    never writes to the database.
+
+    Attributes:
+        event_id: Foreign key to the event
+        room_id: Random ID of this opening of the room, signed into its tickets
+        admit_rate: Tickets admitted per second, over all workers
+        burst: Tickets admitted at once after an idle period, over all workers
+        auto_opened: Whether the room was opened automatically for a hot event
+    """
+
+    __tablename__ = "waiting_rooms"
+
+    event_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        comment="Foreign key to the event"
+    )
+    room_id: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        comment="ID of this opening of the room"
+    )
+    admit_rate: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        comment="Tickets admitted per second"
+    )
+    burst: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        comment="Tickets admitted at once after an idle period"
+    )
+    auto_opened: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        comment="Whether the room was opened automatically"
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the waiting room."""
+        return f"<WaitingRoom(id={self.id}, event_id={self.event_id}, room_id='{self.room_id}')>"
+
+
+class QueueTicketClaim(BaseModel):
+    """
+    Queue ticket claim model recording an admitted ticket that has been used.
+
+    Attributes:
+        event_id: Foreign key to the event
+        ticket: Room ID and sequence number of the used ticket
+        expires_at: Time the ticket's admission expires (Unix seconds),
+            after which the claim is no longer needed
+    """
+
+    __tablename__ = "queue_ticket_claims"
+
+    event_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+        comment="Foreign key to the event"
+    )
+    ticket: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+        unique=True,
+        comment="Room ID and sequence number of the ticket"
+    )
+    expires_at: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        comment="Admission expiry (Unix seconds)"
+    )
+
+    def __repr__(self) -> str:
+        """String representation of the queue ticket claim."""
+        return f"<QueueTicketClaim(id={self.id}, event_id={self.event_id}, ticket='{self.ticket}')>"
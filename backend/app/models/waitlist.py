@@ -0,0 +1,57 @@
+"""
+Waitlist entry model for the database.
+"""
+
+from sqlalchemy import ForeignKey, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class WaitlistEntry(BaseModel):
+    """
+    Waitlist entry model representing a registrant queued for a full event.
+    
+    Entries are served first in, first out: the auto-increment ``id`` is
+    the queue order, and the ``(event_id, id)`` index lets the head of an
+    event's queue and a ranked position be read without touching any other
+    event's entries.
+    
+    Attributes:
+        name: Registrant name
+        email: Registrant email address
+        event_id: Foreign key to the event
+    """
+    
+    __tablename__ = "waitlist_entries"
+    
+    name: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Registrant name"
+    )
+    email: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+        comment="Registrant email address"
+    )
+    event_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        comment="Foreign key to the event"
+    )
+    
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint(
+            'email',
+            'event_id',
+            name='uix_waitlist_email_event'
+        ),
+        Index('ix_waitlist_entries_event_order', 'event_id', 'id'),
+    )
+    
+    def __repr__(self) -> str:
+        """String representation of the waitlist entry."""
+        return f"<WaitlistEntry(id={self.id}, email='{self.email}', event_id={self.event_id})>"
@@ -2,34 +2,37 @@
 Attendee repository with attendee-specific database operations.
 """
 
-from typing import List, Optional, Tuple
-from sqlalchemy import select, and_, func
+from typing import Any, Iterable, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import delete, select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.attendee import Attendee
+from app.models.person import Person
 from app.repositories.base import BaseRepository
-from app.schemas.attendee import AttendeeCreate
+from app.schemas.attendee import AttendeeRecordCreate
 from app.schemas.base import PaginationParams
 
 
-class AttendeeRepository(BaseRepository[Attendee, AttendeeCreate]):
+class AttendeeRepository(BaseRepository[Attendee, AttendeeRecordCreate]):
     """
     Repository for Attendee model with attendee-specific operations.
+    
+    Emails passed in must already be normalized.
     """
     
     def __init__(self, db: AsyncSession):
         super().__init__(Attendee, db)
     
-    async def get_by_email_and_event(
+    async def get_by_person_and_event(
         self, 
-        email: str, 
+        person_id: int, 
         event_id: int
     ) -> Optional[Attendee]:
         """
-        Get attendee by email and event ID.
+        Get attendee by person ID and event ID.
         
         Args:
-            email: Attendee email
+            person_id: Person ID
             event_id: Event ID
             
         Returns:
@@ -38,13 +41,72 @@ class AttendeeRepository(BaseRepository[Attendee, AttendeeCreate]):
         result = await self.db.execute(
             select(Attendee).where(
                 and_(
-                    Attendee.email == email,
+                    Attendee.person_id == person_id,
                     Attendee.event_id == event_id
                 )
             )
         )
         return result.scalar_one_or_none()
     
+    async def get_emails_by_event(self, event_id: int) -> List[str]:
+        """
+        Get the emails of all attendees registered for an event.
+        
+        Args:
+            event_id: Event ID
+            
+        Returns:
+            List[str]: Registered emails
+        """
+        result = await self.db.execute(
+            select(Person.email)
+            .join(Attendee, Attendee.person_id == Person.id)
+            .where(Attendee.event_id == event_id)
+        )
+        return result.scalars().all()
+    
+    async def get_registered_emails(self, event_id: int, emails: Iterable[str]) -> Set[str]:
+        """
+        Get which of the given emails are registered for an event.
+        
+        Args:
+            event_id: Event ID
+            emails: Candidate emails
+            
+        Returns:
+            Set[str]: Registered emails among the candidates
+        """
+        result = await self.db.execute(
+            select(Person.email)
+            .join(Attendee, Attendee.person_id == Person.id)
+            .where(
+                and_(
+                    Attendee.event_id == event_id,
+                    Person.email.in_(list(emails))
+                )
+            )
+        )
+        return set(result.scalars().all())
+    
+    async def delete_from_event(self, event_id: int, attendee_id: int) -> Optional[str]:
+        """
+        Remove an attendee's registration for an event without committing.
+        
+        Args:
+            event_id: Event ID
+            attendee_id: Attendee ID
+            
+        Returns:
+            Optional[str]: Email of the removed attendee, or None
+        """
+        result = await self.db.execute(
+            delete(Attendee)
+            .where(Attendee.id == attendee_id, Attendee.event_id == event_id)
+            .returning(Attendee.email)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none()
+    
     async def get_attendees_by_event(
         self, 
         event_id: int, 
@@ -61,7 +123,6 @@ class AttendeeRepository(BaseRepository[Attendee, AttendeeCreate]):
             List[Attendee]: List of attendees
         """
         query = select(Attendee).where(Attendee.event_id == event_id)
-        print("pagination::", pagination)
         # Apply pagination if provided
         if pagination:
             query = query.offset(pagination.offset).limit(pagination.size)
@@ -72,17 +133,20 @@ class AttendeeRepository(BaseRepository[Attendee, AttendeeCreate]):
     async def get_attendees_by_event_with_count(
         self, 
         event_id: int, 
-        pagination: PaginationParams
-    ) -> Tuple[List[Attendee], int]:
+        pagination: PaginationParams,
+        columns: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Any], int]:
         """
         Get attendees for a specific event with total count.
         
         Args:
             event_id: Event ID
             pagination: Pagination parameters
+            columns: Only select these columns; rows are returned instead of
+                ``Attendee`` instances
             
         Returns:
-            Tuple[List[Attendee], int]: List of attendees and total count
+            Tuple[List[Any], int]: List of attendees (or rows) and total count
         """
         # Get total count
         count_query = select(func.count(Attendee.id)).where(Attendee.event_id == event_id)
@@ -90,14 +154,15 @@ class AttendeeRepository(BaseRepository[Attendee, AttendeeCreate]):
         total = count_result.scalar() or 0
         
         # Get paginated attendees
+        entities = [getattr(Attendee, column) for column in columns] if columns else [Attendee]
         attendees_query = (
-            select(Attendee)
+            select(*entities)
             .where(Attendee.event_id == event_id)
             .offset(pagination.offset)
             .limit(pagination.size)
         )
         attendees_result = await self.db.execute(attendees_query)
-        attendees = attendees_result.scalars().all()
+        attendees = attendees_result.all() if columns else attendees_result.scalars().all()
         
         return attendees, total
 
@@ -2,8 +2,8 @@
 Base repository class with common CRUD operations.
 """
 
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
-from sqlalchemy import select, delete, func, and_, or_
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
+from sqlalchemy import insert, select, delete, func, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
@@ -45,6 +45,21 @@ class BaseRepository(Generic[ModelType, CreateSchemaType]):
         result = await self.db.execute(select(self.model).where(self.model.id == id))
         return result.scalar_one_or_none()
     
+    async def get_many(self, ids: List[int]) -> List[ModelType]:
+        """
+        Get the records with the given IDs in one query.
+        
+        Args:
+            ids: Record IDs
+            
+        Returns:
+            List[ModelType]: Records found, in no particular order
+        """
+        if not ids:
+            return []
+        result = await self.db.execute(select(self.model).where(self.model.id.in_(ids)))
+        return list(result.scalars().all())
+    
     async def get_multi(
         self,
         pagination: Optional[PaginationParams] = None,
@@ -107,12 +122,14 @@ class BaseRepository(Generic[ModelType, CreateSchemaType]):
         result = await self.db.execute(query)
         return result.scalar() or 0
     
-    async def create(self, obj_in: CreateSchemaType) -> ModelType:
+    async def create(self, obj_in: CreateSchemaType, commit: bool = True) -> ModelType:
         """
         Create a new record.
         
         Args:
             obj_in: Create schema instance
+            commit: Commit immediately; when False the record is only flushed
+                so it can join a larger transaction owned by the caller
             
         Returns:
             ModelType: Created model instance
@@ -120,10 +137,41 @@ class BaseRepository(Generic[ModelType, CreateSchemaType]):
         obj_data = obj_in.model_dump() if hasattr(obj_in, 'model_dump') else obj_in.dict()
         db_obj = self.model(**obj_data)
         self.db.add(db_obj)
+        if not commit:
+            await self.db.flush()
+            return db_obj
         await self.db.commit()
         await self.db.refresh(db_obj)
         return db_obj
     
+    async def create_many(self, objs_in: Sequence[CreateSchemaType], commit: bool = True) -> List[int]:
+        """
+        Create several records with one batched INSERT.
+        
+        Rows go to the driver as a single parameter list instead of one
+        flush per object, and no ORM instances are built.
+        
+        Args:
+            objs_in: Create schema instances
+            commit: Commit immediately; when False the rows join the
+                caller's transaction
+            
+        Returns:
+            List[int]: IDs of the created records, in input order
+        """
+        if not objs_in:
+            return []
+        # A Core insert on the table: sharded sessions cannot route ORM bulk inserts
+        table = self.model.__table__
+        result = await self.db.execute(
+            insert(table).returning(table.c.id, sort_by_parameter_order=True),
+            [obj_in.model_dump() for obj_in in objs_in]
+        )
+        ids = list(result.scalars().all())
+        if commit:
+            await self.db.commit()
+        return ids
+    
     async def exists(self, id: int) -> bool:
         """
         Check if a record exists by ID.
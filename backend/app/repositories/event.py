@@ -3,10 +3,11 @@ Event repository with event-specific database operations.
 """
 
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import select, asc, and_
+from typing import Any, List, Optional, Sequence
+from sqlalchemy import select, asc, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.database import shard_router
 from app.models.event import Event
 from app.repositories.base import BaseRepository
 from app.schemas.event import EventCreate
@@ -37,40 +38,99 @@ class EventRepository(BaseRepository[Event, EventCreate]):
         )
         return result.scalar_one_or_none()
     
-    async def get_upcoming_events(self) -> List[Event]:
+    async def get_upcoming_events(self, columns: Optional[Sequence[str]] = None) -> List[Any]:
         """
         Get upcoming events (future start_time).
         
+        Args:
+            columns: Only select these columns; rows are returned instead of
+                ``Event`` instances
+        
         Returns:
-            List[Event]: List of upcoming events
+            List[Any]: List of upcoming events (or rows)
         """
-        query = select(Event).where(
+        entities = [getattr(Event, column) for column in columns] if columns else [Event]
+        if shard_router.enabled and columns and "start_time" not in columns:
+            # Needed to merge the shards' results in order
+            entities.append(Event.start_time)
+        query = select(*entities).where(
             Event.start_time > datetime.utcnow()
         ).order_by(asc(Event.start_time))
         
         result = await self.db.execute(query)
-        return result.scalars().all()
+        events = result.all() if columns else result.scalars().all()
+        if shard_router.enabled:
+            # Each shard's events arrive sorted on their own
+            events = sorted(events, key=lambda event: event.start_time)
+        return events
     
-    async def increment_attendee_count(self, event_id: int) -> None:
+    async def lock_available_spots(self, event_id: int) -> Optional[int]:
         """
-        Increment the attendee count for an event.
+        Lock an event's capacity for the current transaction and read it.
+        
+        The no-op UPDATE takes the row's write lock (the whole database's
+        on SQLite, which has no ``SELECT ... FOR UPDATE``), so the free
+        spots returned cannot change until the caller commits or rolls
+        back.
         
         Args:
             event_id: Event ID
+            
+        Returns:
+            Optional[int]: Free spots, or None if the event is missing
         """
-        event = await self.get(event_id)
-        if event:
-            event.current_attendees += 1
-            await self.db.commit()
+        result = await self.db.execute(
+            update(Event)
+            .where(Event.id == event_id)
+            .values(current_attendees=Event.current_attendees)
+            .returning(Event.max_capacity - Event.current_attendees)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none()
     
-    async def decrement_attendee_count(self, event_id: int) -> None:
+    async def increment_attendee_count(self, event_id: int, count: int = 1) -> bool:
         """
-        Decrement the attendee count for an event.
+        Reserve spots on an event in the current transaction.
+        
+        The capacity check and the increment are a single guarded UPDATE, so
+        concurrent registrations (in this or another process) can neither
+        lose an increment nor push the event past its capacity. The caller
+        owns the transaction and must commit or roll back.
         
         Args:
             event_id: Event ID
+            count: Number of spots to reserve
+            
+        Returns:
+            bool: True if the spots were reserved, False if the event is
+            missing or lacks the capacity
         """
-        event = await self.get(event_id)
-        if event and event.current_attendees > 0:
-            event.current_attendees -= 1
-            await self.db.commit()
+        result = await self.db.execute(
+            update(Event)
+            .where(
+                Event.id == event_id,
+                Event.current_attendees + count <= Event.max_capacity,
+            )
+            .values(current_attendees=Event.current_attendees + count)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+    
+    async def decrement_attendee_count(self, event_id: int, count: int = 1) -> bool:
+        """
+        Release spots on an event in the current transaction.
+        
+        Args:
+            event_id: Event ID
+            count: Number of spots to release
+            
+        Returns:
+            bool: True if the spots were released
+        """
+        result = await self.db.execute(
+            update(Event)
+            .where(Event.id == event_id, Event.current_attendees >= count)
+            .values(current_attendees=Event.current_attendees - count)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
@@ -0,0 +1,76 @@
+"""
+Person repository with person-specific database operations.
+"""
+
+from typing import Any, Dict, Iterable
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import shard_router
+from app.db.dialects import conflict_insert
+from app.models.person import Person
+from app.repositories.base import BaseRepository
+from app.schemas.attendee import AttendeeBase
+
+
+class PersonRepository(BaseRepository[Person, AttendeeBase]):
+    """
+    Repository for Person model with person-specific operations.
+    
+    Persons are stored on every shard that has registrations for them, so
+    each method takes the event the lookup is made for and runs on that
+    event's shard. Emails must already be normalized. None of the
+    methods commit.
+    """
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(Person, db)
+    
+    def _bind(self, event_id: int) -> Dict[str, Any]:
+        return {"shard_id": shard_router.shard_for_event(event_id)}
+    
+    async def get_ids_by_email(self, event_id: int, emails: Iterable[str]) -> Dict[str, int]:
+        """
+        Get the IDs of the persons with the given emails.
+        
+        Args:
+            event_id: Event whose shard is searched
+            emails: Normalized emails
+            
+        Returns:
+            Dict[str, int]: Person ID by email, for the persons found
+        """
+        result = await self.db.execute(
+            select(Person.email, Person.id).where(Person.email.in_(list(emails))),
+            bind_arguments=self._bind(event_id)
+        )
+        return dict(result.all())
+    
+    async def create_missing(self, event_id: int, people: Dict[str, str]) -> Dict[str, int]:
+        """
+        Insert the persons that do not exist yet.
+        
+        Args:
+            event_id: Event whose shard the persons are stored on
+            people: Name by normalized email
+            
+        Returns:
+            Dict[str, int]: Person ID by email, for the persons inserted;
+            emails stored meanwhile by another transaction are left out
+            
+        Raises:
+            NotImplementedError: If the shard is neither SQLite nor PostgreSQL
+        """
+        if not people:
+            return {}
+        table = Person.__table__
+        bind = self._bind(event_id)
+        insert = conflict_insert(self.db.sync_session.get_bind(**bind).dialect.name)
+        result = await self.db.execute(
+            insert(table)
+            .on_conflict_do_nothing(index_elements=[table.c.email])
+            .returning(table.c.email, table.c.id),
+            [{"email": email, "name": name} for email, name in people.items()],
+            bind_arguments=bind
+        )
+        return dict(result.all())
@@ -0,0 +1,98 @@
+"""
+Seat hold repository with hold-specific database operations.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.seat_hold import SeatHold
+from app.repositories.base import BaseRepository
+from app.schemas.seat_hold import SeatHoldCreate
+
+
+class SeatHoldRepository(BaseRepository[SeatHold, SeatHoldCreate]):
+    """
+    Repository for SeatHold model with hold-specific operations.
+    
+    Removal methods delete with ``RETURNING`` so the caller knows exactly
+    which holds it removed and can release their seats, even when a
+    confirmation, a release and the reaper race for the same hold.
+    None of them commit.
+    """
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(SeatHold, db)
+    
+    async def take(self, event_id: int, token: str, now: datetime) -> Optional[int]:
+        """
+        Remove an unexpired hold so its seat can be handed to an attendee.
+        
+        Args:
+            event_id: Event ID
+            token: Hold token
+            now: Current time; holds expiring at or before it are not taken
+            
+        Returns:
+            Optional[int]: ID of the removed hold, or None
+        """
+        result = await self.db.execute(
+            delete(SeatHold)
+            .where(
+                SeatHold.event_id == event_id,
+                SeatHold.token == token,
+                SeatHold.expires_at > now,
+            )
+            .returning(SeatHold.id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none()
+    
+    async def delete_by_token(self, event_id: int, token: str) -> bool:
+        """
+        Remove a hold whether or not it has expired.
+        
+        Args:
+            event_id: Event ID
+            token: Hold token
+            
+        Returns:
+            bool: True if a hold was removed
+        """
+        result = await self.db.execute(
+            delete(SeatHold)
+            .where(SeatHold.event_id == event_id, SeatHold.token == token)
+            .returning(SeatHold.id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none() is not None
+    
+    async def delete_expired(self, ids: Sequence[int], now: datetime) -> List[int]:
+        """
+        Remove the given holds if they have expired.
+        
+        Args:
+            ids: Candidate hold IDs
+            now: Current time
+            
+        Returns:
+            List[int]: Event ID of every removed hold (repeated per hold)
+        """
+        result = await self.db.execute(
+            delete(SeatHold)
+            .where(SeatHold.id.in_(ids), SeatHold.expires_at <= now)
+            .returning(SeatHold.event_id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+    
+    async def get_expiries(self) -> List[Tuple[int, datetime]]:
+        """
+        Get the ID and expiry of every outstanding hold.
+        
+        Returns:
+            List[Tuple[int, datetime]]: (hold ID, expires_at) pairs
+        """
+        result = await self.db.execute(select(SeatHold.id, SeatHold.expires_at))
+        return [(hold_id, expires_at) for hold_id, expires_at in result.all()]
@@ -0,0 +1,124 @@
+"""
+Waiting room repository with queue-specific database operations.
+"""
+
+from typing import Any, Dict, List, Optional
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import shard_router
+from app.db.dialects import conflict_insert
+from app.models.waiting_room import QueueTicketClaim, WaitingRoom
+from app.repositories.base import BaseRepository
+from app.schemas.waiting_room import WaitingRoomSettings
+
+
+class WaitingRoomRepository(BaseRepository[WaitingRoom, WaitingRoomSettings]):
+    """
+    Repository for WaitingRoom model with queue-specific operations.
+
+    Rows only hold each room's settings; tickets are issued by the
+    workers without touching them. Claims of used tickets live in
+    ``queue_ticket_claims``. None of the methods commit.
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(WaitingRoom, db)
+
+    def _bind(self, event_id: int) -> Dict[str, Any]:
+        return {"shard_id": shard_router.shard_for_event(event_id)}
+
+    async def get_by_event(self, event_id: int) -> Optional[WaitingRoom]:
+        """
+        Get an event's waiting room.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Optional[WaitingRoom]: Waiting room or None if it is closed
+        """
+        result = await self.db.execute(select(WaitingRoom).where(WaitingRoom.event_id == event_id))
+        return result.scalar_one_or_none()
+
+    async def get_by_events(self, event_ids: Optional[List[int]] = None) -> List[WaitingRoom]:
+        """
+        Get the waiting rooms of the given events, or of every event.
+
+        Args:
+            event_ids: Event IDs (all events if None)
+
+        Returns:
+            List[WaitingRoom]: Open waiting rooms
+        """
+        query = select(WaitingRoom)
+        if event_ids is not None:
+            if not event_ids:
+                return []
+            query = query.where(WaitingRoom.event_id.in_(event_ids))
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def close(self, event_id: int, auto_opened_only: bool = False) -> bool:
+        """
+        Delete an event's waiting room and the claims of its tickets.
+
+        Args:
+            event_id: Event ID
+            auto_opened_only: Only delete the room if it was opened automatically
+
+        Returns:
+            bool: True if a room was deleted
+        """
+        query = delete(WaitingRoom).where(WaitingRoom.event_id == event_id)
+        if auto_opened_only:
+            query = query.where(WaitingRoom.auto_opened.is_(True))
+        result = await self.db.execute(
+            query.returning(WaitingRoom.id).execution_options(synchronize_session=False)
+        )
+        if result.scalar_one_or_none() is None:
+            return False
+        await self.db.execute(
+            delete(QueueTicketClaim)
+            .where(QueueTicketClaim.event_id == event_id)
+            .execution_options(synchronize_session=False)
+        )
+        return True
+
+    async def claim(self, event_id: int, ticket: str, expires_at: float, now: float) -> bool:
+        """
+        Record that a ticket has been used, unless it already was.
+
+        Claims of the event whose admission has expired are deleted on
+        the way, as their tickets can no longer be used anyway. The claim
+        is part of the caller's transaction, so it only sticks if that
+        transaction commits.
+
+        Args:
+            event_id: Event ID
+            ticket: Room ID and sequence number of the ticket
+            expires_at: Time the ticket's admission expires (Unix seconds)
+            now: Current time (Unix seconds)
+
+        Returns:
+            bool: True if the ticket was claimed, False if it was used before
+
+        Raises:
+            NotImplementedError: If the shard is neither SQLite nor PostgreSQL
+        """
+        await self.db.execute(
+            delete(QueueTicketClaim)
+            .where(QueueTicketClaim.event_id == event_id, QueueTicketClaim.expires_at <= now)
+            .execution_options(synchronize_session=False)
+        )
+        table = QueueTicketClaim.__table__
+        bind = self._bind(event_id)
+        insert = conflict_insert(self.db.sync_session.get_bind(**bind).dialect.name)
+        result = await self.db.execute(
+            insert(table)
+            .on_conflict_do_nothing(index_elements=[table.c.ticket])
+            .returning(table.c.id),
+            [{"event_id": event_id, "ticket": ticket, "expires_at": expires_at}],
+            bind_arguments=bind
+        )
+        return result.first() is not None
@@ -0,0 +1,145 @@
+"""
+Waitlist repository with queue-specific database operations.
+"""
+
+from typing import Iterable, List, Optional, Sequence, Set
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.waitlist import WaitlistEntry
+from app.repositories.base import BaseRepository
+from app.schemas.waitlist import WaitlistEntryCreate
+
+
+class WaitlistRepository(BaseRepository[WaitlistEntry, WaitlistEntryCreate]):
+    """
+    Repository for WaitlistEntry model with queue-specific operations.
+    
+    Every query is bounded to one event and served by the
+    ``(event_id, id)`` index. None of the removal methods commit.
+    """
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(WaitlistEntry, db)
+    
+    async def get_by_event(self, event_id: int, entry_id: int) -> Optional[WaitlistEntry]:
+        """
+        Get a waitlist entry of a given event.
+        
+        Args:
+            event_id: Event ID
+            entry_id: Waitlist entry ID
+            
+        Returns:
+            Optional[WaitlistEntry]: Entry instance or None
+        """
+        result = await self.db.execute(
+            select(WaitlistEntry).where(
+                and_(
+                    WaitlistEntry.id == entry_id,
+                    WaitlistEntry.event_id == event_id
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+    
+    async def get_position(self, event_id: int, entry_id: int) -> int:
+        """
+        Get an entry's place in its event's queue.
+        
+        The count is a range scan over the covering ``(event_id, id)``
+        index that reads only entries ahead of this one; no table rows
+        are visited.
+        
+        Args:
+            event_id: Event ID
+            entry_id: Waitlist entry ID
+            
+        Returns:
+            int: 1-based queue position
+        """
+        result = await self.db.execute(
+            select(func.count()).select_from(WaitlistEntry).where(
+                and_(
+                    WaitlistEntry.event_id == event_id,
+                    WaitlistEntry.id <= entry_id
+                )
+            )
+        )
+        return result.scalar()
+    
+    async def get_waitlisted_emails(self, event_id: int, emails: Iterable[str]) -> Set[str]:
+        """
+        Get which of the given emails are on an event's waitlist.
+        
+        Args:
+            event_id: Event ID
+            emails: Candidate emails
+            
+        Returns:
+            Set[str]: Waitlisted emails among the candidates
+        """
+        result = await self.db.execute(
+            select(WaitlistEntry.email).where(
+                and_(
+                    WaitlistEntry.event_id == event_id,
+                    WaitlistEntry.email.in_(list(emails))
+                )
+            )
+        )
+        return set(result.scalars().all())
+    
+    async def get_head(self, event_id: int, limit: int) -> List[WaitlistEntry]:
+        """
+        Get the entries at the front of an event's queue.
+        
+        Args:
+            event_id: Event ID
+            limit: Maximum number of entries
+            
+        Returns:
+            List[WaitlistEntry]: Entries in queue order
+        """
+        result = await self.db.execute(
+            select(WaitlistEntry)
+            .where(WaitlistEntry.event_id == event_id)
+            .order_by(WaitlistEntry.id)
+            .limit(limit)
+        )
+        return result.scalars().all()
+    
+    async def delete_ids(self, event_id: int, ids: Sequence[int]) -> int:
+        """
+        Remove entries of an event by ID.
+        
+        Args:
+            event_id: Event ID
+            ids: Waitlist entry IDs
+            
+        Returns:
+            int: Number of entries removed
+        """
+        result = await self.db.execute(
+            delete(WaitlistEntry)
+            .where(WaitlistEntry.event_id == event_id, WaitlistEntry.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    async def delete_by_email(self, event_id: int, email: str) -> int:
+        """
+        Remove a registrant's entry from an event's queue, if any.
+        
+        Args:
+            event_id: Event ID
+            email: Registrant email
+            
+        Returns:
+            int: Number of entries removed
+        """
+        result = await self.db.execute(
+            delete(WaitlistEntry)
+            .where(WaitlistEntry.event_id == event_id, WaitlistEntry.email == email)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
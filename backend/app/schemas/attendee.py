@@ -3,9 +3,10 @@ Attendee schemas for request/response serialization.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, Field, EmailStr, validator
 
+from app.core.config import settings
 from app.schemas.base import BaseSchema
 
 
@@ -21,6 +22,11 @@ class AttendeeBase(BaseSchema):
         if not v.strip():
             raise ValueError("Name cannot be empty")
         return v.strip()
+    
+    @validator("email")
+    def normalize_email(cls, v):
+        """Normalize the email, which identifies the person."""
+        return v.strip().lower()
 
 
 class AttendeeCreate(AttendeeBase):
@@ -28,6 +34,13 @@ class AttendeeCreate(AttendeeBase):
     event_id: int = Field(gt=0, description="Event ID")
 
 
+class AttendeeRecordCreate(BaseSchema):
+    """Schema for storing a person's registration for an event."""
+    
+    event_id: int = Field(gt=0, description="Event ID")
+    person_id: int = Field(gt=0, description="Person ID")
+
+
 class AttendeeResponse(AttendeeBase):
     """Schema for attendee responses."""
     
@@ -39,3 +52,35 @@ class AttendeeResponse(AttendeeBase):
     
     class Config:
         from_attributes = True
+
+
+class BulkRegistrationRequest(BaseSchema):
+    """Schema for registering many attendees for one event at once."""
+    
+    attendees: List[AttendeeBase] = Field(
+        min_length=1,
+        max_length=settings.BULK_REGISTRATION_MAX_SIZE,
+        description="Attendees to register, in priority order"
+    )
+
+
+class BulkRegistrationResult(BaseSchema):
+    """Outcome of one attendee in a bulk registration."""
+    
+    index: int = Field(description="Position of the attendee in the request")
+    email: EmailStr = Field(description="Attendee email address")
+    status: str = Field(description="registered, waitlisted, duplicate or full")
+    attendee_id: Optional[int] = Field(default=None, description="Attendee ID when registered")
+    waitlist_entry_id: Optional[int] = Field(default=None, description="Waitlist entry ID when waitlisted")
+    waitlist_position: Optional[int] = Field(default=None, description="Waitlist position when waitlisted")
+    detail: Optional[str] = Field(default=None, description="Why the attendee was not registered")
+
+
+class BulkRegistrationResponse(BaseSchema):
+    """Schema for bulk registration responses."""
+    
+    registered: int = Field(description="Attendees registered")
+    waitlisted: int = Field(description="Attendees added to the waitlist")
+    rejected: int = Field(description="Attendees neither registered nor waitlisted")
+    results: List[BulkRegistrationResult] = Field(description="Outcome per attendee, in request order")
+
@@ -0,0 +1,58 @@
+"""
+Batch request schemas for data validation and serialization.
+"""
+
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import Field, validator
+
+from app.core.config import settings
+from app.schemas.base import BaseSchema
+
+
+class BatchSubRequest(BaseSchema):
+    """One request inside a batch."""
+    
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = Field(default="GET", description="HTTP method")
+    path: str = Field(
+        min_length=1,
+        max_length=2048,
+        description="Path under the API version with optional query string, e.g. /events/1/attendees?page=2"
+    )
+    headers: Dict[str, str] = Field(default={}, description="Extra request headers, e.g. Idempotency-Key")
+    body: Optional[Any] = Field(default=None, description="JSON request body")
+    
+    @validator("path")
+    def validate_path(cls, v):
+        """Validate the path targets another v1 route."""
+        if not v.startswith("/"):
+            raise ValueError("Path must start with '/'")
+        path = v.split("?", 1)[0].rstrip("/")
+        if path == "/batch":
+            raise ValueError("Batches cannot be nested")
+        if path == "/events/stream":
+            raise ValueError("Streams cannot be batched")
+        return v
+
+
+class BatchRequest(BaseSchema):
+    """Schema for running several API requests in one round trip."""
+    
+    requests: List[BatchSubRequest] = Field(
+        min_length=1,
+        max_length=settings.BATCH_MAX_REQUESTS,
+        description="Requests to run concurrently"
+    )
+
+
+class BatchSubResponse(BaseSchema):
+    """Response to one request inside a batch."""
+    
+    status: int = Field(description="HTTP status code")
+    headers: Dict[str, str] = Field(description="Response headers")
+    body: Optional[Any] = Field(default=None, description="Decoded JSON body, or text for other content types")
+
+
+class BatchResponse(BaseSchema):
+    """Schema for batch responses."""
+    
+    responses: List[BatchSubResponse] = Field(description="One response per request, in request order")
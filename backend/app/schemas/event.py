@@ -54,6 +54,21 @@ class EventResponse(EventBase):
         from_attributes = True
 
 
+# Computed EventResponse fields and the columns they are derived from
+EVENT_COMPUTED_FIELDS = {
+    "is_full": ("current_attendees", "max_capacity"),
+    "available_spots": ("current_attendees", "max_capacity"),
+    "capacity_percentage": ("current_attendees", "max_capacity"),
+}
+
+
+class EventBatchResponse(BaseSchema):
+    """Schema for multi-get event responses."""
+    
+    events: List[EventResponse] = Field(description="Events found, in request order")
+    missing: List[int] = Field(description="Requested IDs with no event")
+
+
 class EventWithAttendees(EventResponse):
     """Schema for event with attendees included."""
     
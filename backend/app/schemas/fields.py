@@ -0,0 +1,80 @@
+"""
+Sparse fieldsets: response fields selected with a ``fields=`` parameter.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Type
+from pydantic import BaseModel
+
+
+def parse_fields(value: Optional[str], schema: Type[BaseModel]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated ``fields=`` value against a response schema.
+
+    Args:
+        value: Raw parameter, e.g. ``"id,name"``; None selects every field
+        schema: Response schema the fields belong to
+
+    Returns:
+        Optional[List[str]]: Selected fields in schema order, or None for all
+
+    Raises:
+        ValueError: If the value is empty or names an unknown field
+    """
+    if value is None:
+        return None
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    if not names:
+        raise ValueError("fields must name at least one field")
+    unknown = sorted(names - set(schema.model_fields))
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(schema.model_fields)}"
+        )
+    return [name for name in schema.model_fields if name in names]
+
+
+def required_columns(
+    fields: Sequence[str],
+    computed: Optional[Mapping[str, Tuple[str, ...]]] = None
+) -> List[str]:
+    """
+    Get the model columns needed to produce a set of response fields.
+
+    Args:
+        fields: Selected response fields
+        computed: Computed fields mapped to the columns they derive from
+
+    Returns:
+        List[str]: Column names, without duplicates
+    """
+    computed = computed or {}
+    columns: Dict[str, None] = {}
+    for name in fields:
+        for column in computed.get(name, (name,)):
+            columns[column] = None
+    return list(columns)
+
+
+def project(obj: Any, fields: Sequence[str], model: Optional[type] = None) -> Dict[str, Any]:
+    """
+    Pick the selected fields off a model instance, record or projected row.
+
+    A projected row only carries columns; computed fields missing from it
+    are evaluated with ``model``'s own property so the formula lives in
+    one place.
+
+    Args:
+        obj: Object or row to read
+        fields: Selected response fields
+        model: Model class whose properties compute derived fields
+
+    Returns:
+        Dict[str, Any]: Field name to value
+    """
+    values = {}
+    for name in fields:
+        if hasattr(obj, name):
+            values[name] = getattr(obj, name)
+        else:
+            values[name] = getattr(model, name).fget(obj)
+    return values
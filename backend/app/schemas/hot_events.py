@@ -0,0 +1,25 @@
+"""
+Hot event schemas for response serialization.
+"""
+
+from typing import List
+from pydantic import Field
+
+from app.schemas.base import BaseSchema
+
+
+class HotEvent(BaseSchema):
+    """Schema for one event's share of the traffic."""
+
+    event_id: int = Field(description="Event ID")
+    rate: float = Field(description="Estimated requests per second over the last window")
+    hot: bool = Field(description="Whether the rate reaches HOT_EVENTS_MIN_RATE")
+
+
+class HotEventsResponse(BaseSchema):
+    """Schema for the busiest events of this worker."""
+
+    enabled: bool = Field(description="Whether requests are being counted")
+    window_seconds: float = Field(description="Seconds of traffic the rates cover")
+    reads: List[HotEvent] = Field(description="Events with the most reads, busiest first")
+    registrations: List[HotEvent] = Field(description="Events with the most registrations, busiest first")
@@ -0,0 +1,28 @@
+"""
+Seat hold schemas for request/response serialization.
+"""
+
+from datetime import datetime
+from pydantic import Field
+
+from app.schemas.base import BaseSchema
+
+
+class SeatHoldCreate(BaseSchema):
+    """Schema for storing a new seat hold."""
+    
+    event_id: int = Field(gt=0, description="Event ID")
+    token: str = Field(min_length=1, max_length=64, description="Opaque hold token")
+    expires_at: datetime = Field(description="Hold expiry timestamp")
+
+
+class SeatHoldResponse(BaseSchema):
+    """Schema for seat hold responses."""
+    
+    token: str = Field(description="Token to confirm or release the hold with")
+    event_id: int = Field(description="Event ID")
+    expires_at: datetime = Field(description="Hold expiry timestamp (UTC)")
+    created_at: datetime = Field(description="Creation timestamp")
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,40 @@
+"""
+Waiting room schemas for request/response serialization.
+"""
+
+from typing import Optional
+from pydantic import Field
+
+from app.schemas.base import BaseSchema
+
+
+class WaitingRoomSettings(BaseSchema):
+    """Schema for opening or retuning an event's waiting room."""
+
+    admit_rate: Optional[float] = Field(default=None, gt=0, description="Tickets admitted per second")
+    burst: Optional[int] = Field(default=None, ge=1, description="Tickets admitted at once after an idle period")
+
+
+class WaitingRoomStatus(BaseSchema):
+    """Schema for an event's waiting room state."""
+
+    event_id: int = Field(description="Event ID")
+    active: bool = Field(description="Whether registrations require an admitted ticket")
+    admit_rate: Optional[float] = Field(default=None, description="Tickets admitted per second")
+    burst: Optional[int] = Field(default=None, description="Tickets admitted at once after an idle period")
+    issued: int = Field(default=0, description="Tickets issued by the answering worker")
+    admitted: int = Field(default=0, description="Tickets of the answering worker admitted")
+    waiting: int = Field(default=0, description="Tickets of the answering worker waiting to be admitted")
+
+
+class QueueTicketResponse(BaseSchema):
+    """Schema for a queue ticket and its position."""
+
+    ticket: str = Field(description="Ticket to send as the X-Queue-Ticket header when registering")
+    event_id: int = Field(description="Event ID")
+    position: int = Field(description="Tickets ahead of this one, including it; 0 once admitted")
+    admitted: bool = Field(description="Whether the ticket can be used to register")
+    estimated_wait_seconds: float = Field(description="Estimated seconds until admission")
+    expires_in_seconds: Optional[float] = Field(
+        default=None, description="Seconds left to register with an admitted ticket"
+    )
@@ -0,0 +1,25 @@
+"""
+Waitlist schemas for request/response serialization.
+"""
+
+from datetime import datetime
+from pydantic import Field
+
+from app.schemas.attendee import AttendeeBase
+
+
+class WaitlistEntryCreate(AttendeeBase):
+    """Schema for queueing a registrant on an event's waitlist."""
+    event_id: int = Field(gt=0, description="Event ID")
+
+
+class WaitlistEntryResponse(AttendeeBase):
+    """Schema for waitlist entry responses."""
+    
+    id: int = Field(description="Waitlist entry ID")
+    event_id: int = Field(description="Event ID")
+    position: int = Field(description="Place in the queue (1 is next to be promoted)")
+    created_at: datetime = Field(description="Time the registrant joined the waitlist")
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,377 @@
+"""
+Production launcher supervising several uvicorn worker processes.
+
+Run from the ``backend`` directory::
+
+    python -m app.serve
+
+Everything is configured through the ``SERVER_*`` settings. Send
+``SIGHUP`` for a rolling restart and ``SIGTERM`` or ``SIGINT`` to stop.
+"""
+
+import asyncio
+import importlib.util
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import sys
+import threading
+import time
+from multiprocessing.context import SpawnProcess
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+
+from app.core.config import settings
+from app.core.logging import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+APP = "app.main:app"
+
+# Seconds allowed on top of the graceful timeout before a worker is killed
+KILL_GRACE_SECONDS = 5.0
+
+
+def available_cores() -> List[int]:
+    """CPU cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def resolve_loop(name: str) -> str:
+    """
+    Resolve the ``auto`` event loop to the fastest one installed.
+
+    Args:
+        name: ``auto``, ``uvloop`` or ``asyncio``
+
+    Returns:
+        str: Concrete uvicorn loop name
+    """
+    if name == "auto":
+        return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    return name
+
+
+def resolve_http(name: str) -> str:
+    """
+    Resolve the ``auto`` HTTP parser to the fastest one installed.
+
+    Args:
+        name: ``auto``, ``httptools`` or ``h11``
+
+    Returns:
+        str: Concrete uvicorn HTTP implementation name
+    """
+    if name == "auto":
+        return "httptools" if importlib.util.find_spec("httptools") else "h11"
+    return name
+
+
+def worker_count() -> int:
+    """Configured worker count, or one per available core when 0."""
+    return settings.SERVER_WORKERS or len(available_cores())
+
+
+def build_config() -> uvicorn.Config:
+    """
+    Build the uvicorn configuration shared by the supervisor and workers.
+
+    Returns:
+        uvicorn.Config: Server configuration
+    """
+    return uvicorn.Config(
+        APP,
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        loop=resolve_loop(settings.SERVER_LOOP),
+        http=resolve_http(settings.SERVER_HTTP),
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_TIMEOUT,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+        log_level=settings.LOG_LEVEL.lower(),
+    )
+
+
+def resident_memory(pid: int) -> Optional[int]:
+    """
+    Resident memory of a process in bytes.
+
+    Args:
+        pid: Process ID
+
+    Returns:
+        Optional[int]: Resident set size, or None where /proc is unavailable
+    """
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class RequestCounter:
+    """ASGI wrapper counting the HTTP requests a worker has accepted."""
+
+    def __init__(self, app: Any):
+        self.app = app
+        self.requests = 0
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] == "http":
+            self.requests += 1
+        await self.app(scope, receive, send)
+
+
+class WorkerServer(uvicorn.Server):
+    """
+    uvicorn server run by each worker process.
+
+    It tells the supervisor once it accepts requests and has warmed up,
+    and asks to be retired once it has served its request allowance or
+    grown past the memory limit. A retiring worker keeps serving until the supervisor has
+    started its replacement, unlike uvicorn's ``limit_max_requests``,
+    which exits straight away and leaves the slot empty meanwhile.
+    """
+
+    def __init__(self, config: uvicorn.Config, ready: Any, retire: Any):
+        super().__init__(config)
+        self.ready = ready
+        self.retire = retire
+        self.counter: Optional[RequestCounter] = None
+        self.max_requests: Optional[int] = None
+        if settings.SERVER_MAX_REQUESTS:
+            self.max_requests = settings.SERVER_MAX_REQUESTS + random.randint(0, settings.SERVER_MAX_REQUESTS_JITTER)
+        self.max_memory = settings.SERVER_MAX_MEMORY_MB * 1024 * 1024
+
+    async def startup(self, sockets: Optional[List[socket.socket]] = None) -> None:
+        from app.services.warmup import warmup
+
+        self.counter = RequestCounter(self.config.loaded_app)
+        self.config.loaded_app = self.counter
+        await super().startup(sockets=sockets)
+        if self.started:
+            # Replacements take over only once they are warm
+            await warmup.wait(settings.SERVER_STARTUP_TIMEOUT)
+            self.ready.set()
+
+    def _retire_reason(self) -> Optional[str]:
+        if self.max_requests is not None and self.counter.requests >= self.max_requests:
+            return f"served {self.counter.requests} requests"
+        if self.max_memory:
+            rss = resident_memory(os.getpid())
+            if rss is not None and rss > self.max_memory:
+                return f"uses {rss // (1024 * 1024)} MB"
+        return None
+
+    async def on_tick(self, counter: int) -> bool:
+        # Checked once a second, like uvicorn's own housekeeping
+        if counter % 10 == 0 and not self.retire.is_set():
+            reason = self._retire_reason()
+            if reason is not None:
+                logger.info(f"Worker {os.getpid()} {reason}; asking to be replaced")
+                self.retire.set()
+        return await super().on_tick(counter)
+
+
+def run_worker(sock: socket.socket, core: Optional[int], ready: Any, retire: Any) -> None:
+    """
+    Worker process entry point: serve the app on the shared socket.
+
+    Args:
+        sock: Listening socket bound by the supervisor
+        core: CPU core to pin the worker to, if any
+        ready: Event set once the worker accepts requests
+        retire: Event set when the worker wants to be replaced
+    """
+    if core is not None:
+        os.sched_setaffinity(0, {core})
+    setup_logging()
+    WorkerServer(build_config(), ready, retire).run(sockets=[sock])
+
+
+class Worker:
+    """One supervised worker process."""
+
+    def __init__(self, process: SpawnProcess, ready: Any, retire: Any):
+        self.process = process
+        self.ready = ready
+        self.retire = retire
+        self.started = time.monotonic()
+        self.kill_at: Optional[float] = None
+
+
+class Supervisor:
+    """
+    Keeps a fixed number of uvicorn workers serving one listening socket.
+
+    The socket is bound once by the supervisor and shared, so workers can
+    be swapped without refusing connections. A worker is replaced by
+    first starting its successor and draining it only once the successor
+    accepts requests; if the successor fails to start, the old worker
+    keeps serving. This happens when a worker asks to retire (request or
+    memory limit) and, one slot at a time, on ``SIGHUP``; a slot whose
+    worker was started after the ``SIGHUP`` is skipped. A worker that
+    dies is started again.
+    """
+
+    def __init__(self, sock: socket.socket, workers: int):
+        self.sock = sock
+        self.workers = workers
+        pin = settings.SERVER_PIN_WORKERS and hasattr(os, "sched_setaffinity")
+        self.cores = available_cores() if pin else None
+        self.graceful_timeout = settings.SERVER_GRACEFUL_TIMEOUT
+        self.context = multiprocessing.get_context("spawn")
+        self.slots: List[Worker] = []
+        self.successors: Dict[int, Worker] = {}
+        self.draining: List[Worker] = []
+        self.restart_queue: List[int] = []
+        self.should_exit = False
+        self.restart_requested = False
+        self.restart_requested_at = 0.0
+        self._wakeup = threading.Event()
+
+    def _spawn(self, slot: int) -> Worker:
+        core = self.cores[slot % len(self.cores)] if self.cores else None
+        ready = self.context.Event()
+        retire = self.context.Event()
+        process = self.context.Process(
+            target=run_worker,
+            args=(self.sock, core, ready, retire),
+            name=f"worker-{slot}",
+        )
+        process.start()
+        logger.info(f"Started worker {process.pid} in slot {slot}" + (f" on core {core}" if core is not None else ""))
+        return Worker(process, ready, retire)
+
+    def _drain(self, worker: Worker) -> None:
+        """Ask a worker to finish its requests and exit."""
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.kill_at = time.monotonic() + self.graceful_timeout + KILL_GRACE_SECONDS
+        self.draining.append(worker)
+
+    def _reap(self) -> None:
+        """Collect drained workers, killing those past their grace period."""
+        for worker in list(self.draining):
+            if worker.process.is_alive() and time.monotonic() >= worker.kill_at:
+                logger.warning(f"Worker {worker.process.pid} did not stop in time; killing it")
+                worker.process.kill()
+            if not worker.process.is_alive():
+                worker.process.join()
+                self.draining.remove(worker)
+
+    def check_workers(self) -> None:
+        """Advance replacements, restart dead workers and start requested ones."""
+        for slot, worker in enumerate(self.slots):
+            successor = self.successors.get(slot)
+            if successor is not None:
+                if successor.ready.is_set():
+                    del self.successors[slot]
+                    self.slots[slot] = successor
+                    self._drain(worker)
+                elif (
+                    not successor.process.is_alive()
+                    or time.monotonic() - successor.started > settings.SERVER_STARTUP_TIMEOUT
+                ):
+                    logger.error(
+                        f"Replacement worker {successor.process.pid} failed to start; "
+                        f"keeping worker {worker.process.pid}"
+                    )
+                    del self.successors[slot]
+                    self._drain(successor)
+                    self.restart_queue.clear()
+            elif not worker.process.is_alive():
+                worker.process.join()
+                logger.warning(f"Worker {worker.process.pid} exited with code {worker.process.exitcode}; restarting it")
+                self.slots[slot] = self._spawn(slot)
+            elif worker.retire.is_set():
+                self.successors[slot] = self._spawn(slot)
+
+        while self.restart_queue and not self.successors:
+            slot = self.restart_queue.pop(0)
+            # Already replaced since the restart was asked for, e.g. recycled
+            if self.slots[slot].started > self.restart_requested_at:
+                continue
+            self.successors[slot] = self._spawn(slot)
+        self._reap()
+
+    def _handle_exit(self, signum: int, frame: Any) -> None:
+        self.should_exit = True
+        self._wakeup.set()
+
+    def _handle_restart(self, signum: int, frame: Any) -> None:
+        self.restart_requested = True
+        self.restart_requested_at = time.monotonic()
+        self._wakeup.set()
+
+    def run(self) -> None:
+        """Start the workers and supervise them until asked to stop."""
+        signal.signal(signal.SIGTERM, self._handle_exit)
+        signal.signal(signal.SIGINT, self._handle_exit)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self._handle_restart)
+
+        self.slots = [self._spawn(slot) for slot in range(self.workers)]
+        while not self.should_exit:
+            if self.restart_requested:
+                self.restart_requested = False
+                logger.info("Rolling restart of all workers")
+                self.restart_queue = list(range(self.workers))
+            self.check_workers()
+            # Poll faster while a replacement is starting up
+            self._wakeup.wait(0.1 if self.successors else settings.SERVER_CHECK_INTERVAL)
+            self._wakeup.clear()
+
+        logger.info("Stopping workers")
+        for worker in self.slots + list(self.successors.values()):
+            self._drain(worker)
+        while self.draining:
+            self._reap()
+            time.sleep(0.1)
+
+
+async def prepare_database() -> None:
+    """Create tables and sample data once, before workers could race to do it."""
+    from app.db.database import create_tables, shard_engines
+
+    await create_tables()
+    for shard_engine in shard_engines.values():
+        await shard_engine.dispose()
+
+
+def main() -> int:
+    """
+    Serve the API with the configured number of workers.
+
+    Returns:
+        int: Process exit code
+    """
+    setup_logging()
+    asyncio.run(prepare_database())
+
+    config = build_config()
+    workers = worker_count()
+    # Workers read it to take their share of per-event rates such as the waiting room's
+    os.environ["SERVER_WORKERS"] = str(workers)
+    if settings.SERVER_MAX_MEMORY_MB and resident_memory(os.getpid()) is None:
+        logger.warning("SERVER_MAX_MEMORY_MB is ignored: worker memory cannot be read on this platform")
+    logger.info(
+        f"Serving {APP} on {settings.SERVER_HOST}:{settings.SERVER_PORT} with {workers} workers "
+        f"(loop={config.loop}, http={config.http})"
+    )
+
+    sock = config.bind_socket()
+    try:
+        Supervisor(sock, workers).run()
+    finally:
+        sock.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
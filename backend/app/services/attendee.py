@@ -121,24 +121,48 @@ class AttendeeService:
             logger.error(f"Failed to register attendee: {e}")
             raise
 
-from typing import List, Optional
+import secrets
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.core.metrics import metrics
 from app.models.attendee import Attendee
+from app.models.event import Event
+from app.models.seat_hold import SeatHold
 from app.repositories.attendee import AttendeeRepository
 from app.repositories.event import EventRepository
-from app.schemas.attendee import AttendeeCreate
+from app.repositories.seat_hold import SeatHoldRepository
+from app.repositories.waitlist import WaitlistRepository
+from app.schemas.attendee import AttendeeBase, AttendeeCreate, AttendeeRecordCreate, BulkRegistrationResult
 from app.schemas.base import PaginationParams
+from app.schemas.seat_hold import SeatHoldCreate
+from app.schemas.waitlist import WaitlistEntryCreate
+from app.services.catalog import event_catalog
+from app.services.invalidation import EVENTS_CACHE, MEMBERSHIP_CACHE, invalidation_bus, membership_key
+from app.services.loaders import get_event_loader
+from app.services.membership import membership_filters
+from app.services.persons import person_directory
+from app.services.seat_hold import seat_hold_reaper
+from app.services.single_flight import coalesced
+from app.services.waitlist import WaitlistService
 from app.services.exceptions import (
     AttendeeNotFoundError,
     AttendeeAlreadyRegisteredError,
+    AttendeeAlreadyWaitlistedError,
+    AttendeeWaitlistedError,
     EventNotFoundError,
-    EventCapacityExceededError
+    EventCapacityExceededError,
+    SeatHoldNotFoundError
 )
 
 logger = get_logger(__name__)
 
+HOLD_TOKEN_BYTES = 24
+
 
 class AttendeeService:
     """
@@ -158,6 +182,10 @@ class AttendeeService:
         self.db = db
         self.attendee_repo = AttendeeRepository(db)
         self.event_repo = EventRepository(db)
+        self.seat_hold_repo = SeatHoldRepository(db)
+        self.waitlist_repo = WaitlistRepository(db)
+        self.waitlist = WaitlistService(db)
+        self.event_loader = get_event_loader(db)
     
     async def get_attendee(self, attendee_id: int) -> Attendee:
         """
@@ -178,30 +206,84 @@ class AttendeeService:
             raise AttendeeNotFoundError(f"Attendee with ID {attendee_id} not found")
         return attendee
     
+    @coalesced
     async def get_event_attendees(
         self,
         event_id: int,
-        pagination: PaginationParams
-    ) -> Tuple[List[Attendee], int]:
+        pagination: PaginationParams,
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Any], int]:
         """
         Get attendees for a specific event with pagination.
         
+        Identical concurrent requests share one set of queries.
+        
         Args:
             event_id: Event ID
             pagination: Pagination parameters
+            fields: Response fields wanted; only those columns are read and
+                rows are returned instead of ``Attendee`` instances
             
         Returns:
-            Tuple[List[Attendee], int]: List of attendees and total count
+            Tuple[List[Any], int]: List of attendees (or rows) and total count
             
         Raises:
             EventNotFoundError: If event not found
         """
         # Verify event exists
-        event = await self.event_repo.get(event_id)
+        event = await self.event_loader.load(event_id)
         if not event:
             raise EventNotFoundError(f"Event with ID {event_id} not found")
         
-        return await self.attendee_repo.get_attendees_by_event_with_count(event_id, pagination)
+        return await self.attendee_repo.get_attendees_by_event_with_count(event_id, pagination, fields)
+    
+    async def _ensure_not_registered(self, event: Event, email: str) -> None:
+        """
+        Check that an email is not yet registered for an event.
+        
+        The lookup is skipped when the event's membership filter proves the
+        email is new.
+        
+        Args:
+            event: Event
+            email: Attendee email
+            
+        Raises:
+            AttendeeAlreadyRegisteredError: If attendee already registered
+        """
+        if await membership_filters.might_contain(
+            event.id, event.max_capacity, email, self.attendee_repo.get_emails_by_event
+        ):
+            person_id = (await person_directory.lookup(self.db, event.id, [email])).get(email)
+            if person_id is not None and await self.attendee_repo.get_by_person_and_event(person_id, event.id):
+                logger.warning(f"Attendee {email} already registered for event {event.id}")
+                raise AttendeeAlreadyRegisteredError(
+                    f"Attendee with email '{email}' is already registered for this event"
+                )
+            membership_filters.record_false_positive()
+    
+    async def _create_attendee(self, event_id: int, attendee_data: AttendeeBase) -> Attendee:
+        """
+        Insert an attendee, and their person if new, without committing.
+        
+        Args:
+            event_id: Event ID
+            attendee_data: Attendee registration data
+            
+        Returns:
+            Attendee: Attendee with its server defaults loaded
+        """
+        person_ids = await person_directory.resolve(
+            self.db, event_id, {attendee_data.email: attendee_data.name}
+        )
+        attendee = await self.attendee_repo.create(
+            AttendeeRecordCreate(event_id=event_id, person_id=person_ids[attendee_data.email]),
+            commit=False
+        )
+        # Load server defaults before committing so the refresh reuses
+        # the transaction's connection instead of opening another
+        await self.db.refresh(attendee)
+        return attendee
     
     async def register_attendee(
         self,
@@ -211,6 +293,10 @@ class AttendeeService:
         """
         Register an attendee for an event.
         
+        With ``WAITLIST_ENABLED`` a registrant for a full event is queued on
+        its waitlist instead, in the same transaction that found the event
+        full, so a seat freed concurrently is never missed.
+        
         Args:
             event_id: Event ID
             attendee_data: Attendee registration data
@@ -220,8 +306,10 @@ class AttendeeService:
             
         Raises:
             EventNotFoundError: If event not found
-            EventCapacityExceededError: If event is full
+            AttendeeWaitlistedError: If event is full and the registrant was waitlisted
+            EventCapacityExceededError: If event is full and waitlists are disabled
             AttendeeAlreadyRegisteredError: If attendee already registered
+            AttendeeAlreadyWaitlistedError: If attendee is already waitlisted
         """
         # Verify event exists
         event = await self.event_repo.get(event_id)
@@ -229,40 +317,190 @@ class AttendeeService:
             raise EventNotFoundError(f"Event with ID {event_id} not found")
         
         # Check if event is full
-        if event.is_full:
+        if event.is_full and not settings.WAITLIST_ENABLED:
             logger.warning(f"Event {event_id} is at full capacity")
             raise EventCapacityExceededError(f"Event '{event.name}' is at full capacity")
         
         # Check if attendee is already registered
-        existing_attendee = await self.attendee_repo.get_by_email_and_event(
-            attendee_data.email, event_id
-        )
-        if existing_attendee:
+        await self._ensure_not_registered(event, attendee_data.email)
+        
+        # Reserve the spot and insert the attendee in one transaction. The
+        # guarded increment is the authoritative capacity check: the read
+        # above can be stale by the time we write.
+        try:
+            if not await self.event_repo.increment_attendee_count(event_id):
+                event_name = event.name
+                if settings.WAITLIST_ENABLED:
+                    entry, position = await self.waitlist.join(event_id, attendee_data)
+                    await self.db.commit()
+                    logger.info(f"Attendee {attendee_data.email} waitlisted for event {event_id} at {position}")
+                    raise AttendeeWaitlistedError(
+                        f"Event '{event_name}' is at full capacity; added to the waitlist at position {position}",
+                        entry=entry,
+                        position=position,
+                    )
+                await self.db.rollback()
+                logger.warning(f"Event {event_id} is at full capacity")
+                raise EventCapacityExceededError(f"Event '{event_name}' is at full capacity")
+            
+            attendee = await self._create_attendee(event_id, attendee_data)
+            invalidation_bus.record(self.db, EVENTS_CACHE, [event_id])
+            invalidation_bus.record(self.db, MEMBERSHIP_CACHE, [membership_key(event_id, attendee.email)])
+            await self.db.commit()
+            event_catalog.adjust_attendees(event_id, 1)
+            membership_filters.add(event_id, attendee.email)
+            
+            logger.info(f"Attendee registered: {attendee.email} for event {event_id}")
+            return attendee
+        
+        except IntegrityError as e:
+            await self.db.rollback()
+            if "UNIQUE" not in str(e.orig):
+                logger.error(f"Failed to register attendee: {e}")
+                raise
+            # Registered concurrently, possibly by another worker
             logger.warning(f"Attendee {attendee_data.email} already registered for event {event_id}")
             raise AttendeeAlreadyRegisteredError(
                 f"Attendee with email '{attendee_data.email}' is already registered for this event"
             )
         
-        # Create attendee record
-        attendee_dict = attendee_data.model_dump()
-        attendee_dict["event_id"] = event_id
+        except (EventCapacityExceededError, AttendeeAlreadyWaitlistedError):
+            raise
+        
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to register attendee: {e}")
+            raise
+    
+    async def register_attendees_bulk(
+        self,
+        event_id: int,
+        attendees: List[AttendeeBase]
+    ) -> List[BulkRegistrationResult]:
+        """
+        Register many attendees for one event in a single transaction.
+        
+        The event's capacity is locked first, then every email is checked
+        against existing registrations (and the waitlist) with one
+        set-based query, the seats for the whole batch are reserved with a
+        single guarded update and the new attendees are inserted in one
+        batched statement. Attendees that do not fit are waitlisted in
+        request order, or rejected as full when waitlists are disabled.
+        
+        Args:
+            event_id: Event ID
+            attendees: Attendees to register, in priority order
+            
+        Returns:
+            List[BulkRegistrationResult]: Outcome per attendee, in request order
+            
+        Raises:
+            EventNotFoundError: If event not found
+        """
+        results: List[Optional[BulkRegistrationResult]] = [None] * len(attendees)
+        candidates: List[Tuple[int, AttendeeBase]] = []
+        seen = set()
+        for index, attendee in enumerate(attendees):
+            if attendee.email in seen:
+                results[index] = BulkRegistrationResult(
+                    index=index, email=attendee.email, status="duplicate",
+                    detail="Email appears earlier in this request"
+                )
+                continue
+            seen.add(attendee.email)
+            candidates.append((index, attendee))
         
-        # Use a transaction to ensure consistency
         try:
-            # Create attendee
-            attendee = await self.attendee_repo.create(
-                AttendeeCreate(**attendee_dict)
+            available = await self.event_repo.lock_available_spots(event_id)
+            if available is None:
+                await self.db.rollback()
+                raise EventNotFoundError(f"Event with ID {event_id} not found")
+            
+            # Authoritative now that the event is locked for this transaction
+            emails = [attendee.email for _, attendee in candidates]
+            registered = await self.attendee_repo.get_registered_emails(event_id, emails)
+            waitlisted = (
+                await self.waitlist_repo.get_waitlisted_emails(event_id, emails)
+                if settings.WAITLIST_ENABLED else set()
             )
-            # Increment event attendee count
-            await self.event_repo.increment_attendee_count(event_id)
             
-            logger.info(f"Attendee registered: {attendee.email} for event {event_id}")
-            return attendee
+            new: List[Tuple[int, AttendeeBase]] = []
+            for index, attendee in candidates:
+                if attendee.email in registered:
+                    detail = "Already registered for this event"
+                elif attendee.email in waitlisted:
+                    detail = "Already on the waitlist for this event"
+                else:
+                    new.append((index, attendee))
+                    continue
+                results[index] = BulkRegistrationResult(
+                    index=index, email=attendee.email, status="duplicate", detail=detail
+                )
+            
+            admitted, overflow = new[:max(0, available)], new[max(0, available):]
+            if admitted and not await self.event_repo.increment_attendee_count(event_id, len(admitted)):
+                raise RuntimeError(f"Capacity of event {event_id} changed while locked")
+            person_ids = await person_directory.resolve(
+                self.db, event_id, {attendee.email: attendee.name for _, attendee in admitted}
+            )
+            attendee_ids = await self.attendee_repo.create_many(
+                [
+                    AttendeeRecordCreate(event_id=event_id, person_id=person_ids[attendee.email])
+                    for _, attendee in admitted
+                ],
+                commit=False
+            )
+            
+            entry_ids: List[int] = []
+            queue_length = 0
+            if overflow and settings.WAITLIST_ENABLED:
+                queue_length = await self.waitlist_repo.count({"event_id": event_id})
+                entry_ids = await self.waitlist_repo.create_many(
+                    [WaitlistEntryCreate(event_id=event_id, **attendee.model_dump()) for _, attendee in overflow],
+                    commit=False
+                )
+            if admitted:
+                invalidation_bus.record(self.db, EVENTS_CACHE, [event_id])
+                invalidation_bus.record(
+                    self.db, MEMBERSHIP_CACHE,
+                    [membership_key(event_id, attendee.email) for _, attendee in admitted]
+                )
+            await self.db.commit()
+        
+        except EventNotFoundError:
+            raise
         
         except Exception as e:
             await self.db.rollback()
-            logger.error(f"Failed to register attendee: {e}")
+            logger.error(f"Failed to register attendees in bulk: {e}")
             raise
+        
+        for (index, attendee), attendee_id in zip(admitted, attendee_ids):
+            results[index] = BulkRegistrationResult(
+                index=index, email=attendee.email, status="registered", attendee_id=attendee_id
+            )
+            membership_filters.add(event_id, attendee.email)
+        for offset, (index, attendee) in enumerate(overflow):
+            if entry_ids:
+                results[index] = BulkRegistrationResult(
+                    index=index, email=attendee.email, status="waitlisted",
+                    waitlist_entry_id=entry_ids[offset],
+                    waitlist_position=queue_length + offset + 1
+                )
+            else:
+                results[index] = BulkRegistrationResult(
+                    index=index, email=attendee.email, status="full",
+                    detail="Event is at full capacity"
+                )
+        event_catalog.adjust_attendees(event_id, len(admitted))
+        if entry_ids:
+            metrics.increment("waitlist.joined", len(entry_ids))
+        
+        logger.info(
+            f"Bulk registration for event {event_id}: {len(admitted)} registered, "
+            f"{len(entry_ids)} waitlisted, {len(attendees) - len(admitted) - len(entry_ids)} rejected"
+        )
+        return results
     
     async def is_attendee_registered(self, event_id: int, email: str) -> bool:
         """
@@ -276,3 +514,192 @@ class AttendeeService:
             bool: True if registered
         """
         return await self.attendee_repo.is_registered(email, event_id)
+    
+    async def hold_seat(self, event_id: int) -> SeatHold:
+        """
+        Hold a seat on an event while the attendee completes checkout.
+        
+        The hold takes a seat from ``max_capacity`` like a registration
+        does, in the same guarded update, and is released automatically
+        after ``SEAT_HOLD_TTL_SECONDS`` unless confirmed first.
+        
+        Args:
+            event_id: Event ID
+            
+        Returns:
+            SeatHold: Created hold
+            
+        Raises:
+            EventNotFoundError: If event not found
+            EventCapacityExceededError: If event is full
+        """
+        event = await self.event_repo.get(event_id)
+        if not event:
+            raise EventNotFoundError(f"Event with ID {event_id} not found")
+        
+        if event.is_full:
+            logger.warning(f"Event {event_id} is at full capacity")
+            raise EventCapacityExceededError(f"Event '{event.name}' is at full capacity")
+        
+        hold_data = SeatHoldCreate(
+            event_id=event_id,
+            token=secrets.token_urlsafe(HOLD_TOKEN_BYTES),
+            expires_at=datetime.utcnow() + timedelta(seconds=settings.SEAT_HOLD_TTL_SECONDS),
+        )
+        
+        try:
+            if not await self.event_repo.increment_attendee_count(event_id):
+                event_name = event.name
+                await self.db.rollback()
+                logger.warning(f"Event {event_id} is at full capacity")
+                raise EventCapacityExceededError(f"Event '{event_name}' is at full capacity")
+            
+            hold = await self.seat_hold_repo.create(hold_data, commit=False)
+            await self.db.refresh(hold)
+            invalidation_bus.record(self.db, EVENTS_CACHE, [event_id])
+            await self.db.commit()
+        
+        except EventCapacityExceededError:
+            raise
+        
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to hold seat: {e}")
+            raise
+        
+        event_catalog.adjust_attendees(event_id, 1)
+        seat_hold_reaper.schedule(hold.id, hold.expires_at)
+        logger.info(f"Seat held on event {event_id} until {hold.expires_at}")
+        return hold
+    
+    async def confirm_hold(
+        self,
+        event_id: int,
+        token: str,
+        attendee_data: AttendeeCreate
+    ) -> Attendee:
+        """
+        Turn a seat hold into a registered attendee.
+        
+        The hold is removed and the attendee inserted in one transaction, so
+        the seat passes straight from one to the other and the event's
+        attendee count does not change. If the registration fails the hold
+        is kept.
+        
+        Args:
+            event_id: Event ID
+            token: Hold token
+            attendee_data: Attendee registration data
+            
+        Returns:
+            Attendee: Registered attendee
+            
+        Raises:
+            EventNotFoundError: If event not found
+            SeatHoldNotFoundError: If the hold does not exist or has expired
+            AttendeeAlreadyRegisteredError: If attendee already registered
+        """
+        event = await self.event_repo.get(event_id)
+        if not event:
+            raise EventNotFoundError(f"Event with ID {event_id} not found")
+        
+        await self._ensure_not_registered(event, attendee_data.email)
+        
+        try:
+            if await self.seat_hold_repo.take(event_id, token, datetime.utcnow()) is None:
+                await self.db.rollback()
+                raise SeatHoldNotFoundError("Seat hold not found or expired")
+            # The registrant no longer needs their place in the queue
+            await self.waitlist_repo.delete_by_email(event_id, attendee_data.email)
+            
+            attendee = await self._create_attendee(event_id, attendee_data)
+            invalidation_bus.record(self.db, MEMBERSHIP_CACHE, [membership_key(event_id, attendee.email)])
+            await self.db.commit()
+            membership_filters.add(event_id, attendee.email)
+            
+            logger.info(f"Seat hold confirmed: {attendee.email} for event {event_id}")
+            return attendee
+        
+        except IntegrityError as e:
+            await self.db.rollback()
+            if "UNIQUE" not in str(e.orig):
+                logger.error(f"Failed to confirm seat hold: {e}")
+                raise
+            logger.warning(f"Attendee {attendee_data.email} already registered for event {event_id}")
+            raise AttendeeAlreadyRegisteredError(
+                f"Attendee with email '{attendee_data.email}' is already registered for this event"
+            )
+        
+        except SeatHoldNotFoundError:
+            raise
+        
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to confirm seat hold: {e}")
+            raise
+    
+    async def release_hold(self, event_id: int, token: str) -> None:
+        """
+        Release a seat hold before it expires.
+        
+        Args:
+            event_id: Event ID
+            token: Hold token
+            
+        Raises:
+            SeatHoldNotFoundError: If the hold does not exist
+        """
+        try:
+            if not await self.seat_hold_repo.delete_by_token(event_id, token):
+                await self.db.rollback()
+                raise SeatHoldNotFoundError("Seat hold not found or expired")
+            promoted = await self.waitlist.release_seats(event_id, 1)
+            await self.db.commit()
+        
+        except SeatHoldNotFoundError:
+            raise
+        
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to release seat hold: {e}")
+            raise
+        
+        WaitlistService.seats_released(event_id, 1, promoted)
+        logger.info(f"Seat hold released on event {event_id}")
+    
+    async def cancel_registration(self, event_id: int, attendee_id: int) -> List[str]:
+        """
+        Cancel an attendee's registration.
+        
+        The freed seat goes to the head of the event's waitlist in the same
+        transaction, or back to the event's capacity if nobody is waiting.
+        
+        Args:
+            event_id: Event ID
+            attendee_id: Attendee ID
+            
+        Returns:
+            List[str]: Email of the waitlisted attendee promoted into the seat, if any
+            
+        Raises:
+            AttendeeNotFoundError: If the attendee is not registered for the event
+        """
+        try:
+            email = await self.attendee_repo.delete_from_event(event_id, attendee_id)
+            if email is None:
+                await self.db.rollback()
+                raise AttendeeNotFoundError(f"Attendee with ID {attendee_id} not found for this event")
+            promoted = await self.waitlist.release_seats(event_id, 1)
+            await self.db.commit()
+        
+        except AttendeeNotFoundError:
+            raise
+        
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Failed to cancel registration: {e}")
+            raise
+        
+        WaitlistService.seats_released(event_id, 1, promoted)
+        logger.info(f"Registration cancelled: {email} for event {event_id}")
+        return promoted
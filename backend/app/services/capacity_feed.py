@@ -0,0 +1,255 @@
+"""
+Live event capacity feed fanned out to Server-Sent Events subscribers.
+"""
+
+import asyncio
+import json
+import secrets
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, List, Optional, Set
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.services.catalog import EventCatalog, EventRecord, event_catalog
+
+logger = get_logger(__name__)
+
+# Reconnect delay suggested to EventSource clients
+RETRY_MS = 3000
+
+
+def capacity_payload(record: EventRecord) -> Dict[str, Any]:
+    """Capacity fields of an event as sent to subscribers."""
+    return {
+        "id": record.id,
+        "current_attendees": record.current_attendees,
+        "max_capacity": record.max_capacity,
+        "available_spots": record.available_spots,
+        "capacity_percentage": record.capacity_percentage,
+        "is_full": record.is_full,
+    }
+
+
+def sse_frame(event: str, message_id: str, data: Dict[str, Any]) -> str:
+    """Encode one Server-Sent Events message."""
+    return f"event: {event}\nid: {message_id}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+class CapacityTick:
+    """Capacity changes coalesced over one broadcast interval."""
+
+    __slots__ = ("generation", "message_id", "changes", "_frame")
+
+    def __init__(self, generation: int, message_id: str, changes: Dict[int, Dict[str, Any]]):
+        self.generation = generation
+        self.message_id = message_id
+        self.changes = changes
+        self._frame: Optional[str] = None
+
+    @property
+    def frame(self) -> str:
+        """The tick's changes for unfiltered subscribers, encoded once for all of them."""
+        if self._frame is None:
+            self._frame = sse_frame("capacity", self.message_id, {"events": list(self.changes.values())})
+        return self._frame
+
+
+class CapacityBroadcaster:
+    """
+    Fans event capacity changes out to any number of subscribers.
+
+    The event catalog is the only watcher: its watermark refreshes pick up
+    other workers' writes and local registrations reach it immediately,
+    and every capacity change it sees is handed to ``publish``. Changes
+    are coalesced per event and released once per ``interval`` as a
+    tick, so an event registering hundreds of attendees a second costs a
+    subscriber at most one update per interval.
+
+    Subscribers share the ticks instead of owning a queue: each one only
+    keeps a cursor into the last ``history`` ticks, and an unfiltered
+    stream sends the tick's pre-encoded frame. A subscriber that falls
+    further behind than the history is sent a fresh snapshot instead, so
+    a slow client never makes the broadcaster buffer more.
+
+    Generations are counted per worker, so message IDs carry a random
+    origin of this broadcaster as well (``<origin>-<generation>``). A
+    client reconnecting with an ID another worker, or an earlier process,
+    issued cannot be placed in this worker's history and gets a snapshot.
+    """
+
+    def __init__(
+        self,
+        catalog: EventCatalog,
+        interval: float,
+        history: int,
+        keepalive: float,
+        max_subscribers: int
+    ):
+        self.catalog = catalog
+        self.interval = interval
+        self.keepalive = keepalive
+        self.max_subscribers = max_subscribers
+        self.origin = secrets.token_hex(4)
+        self.generation = 0
+        self.subscribers = 0
+        self.closed = False
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._ticks: Deque[CapacityTick] = deque(maxlen=history)
+        self._changed = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        metrics.register_gauge("capacity_feed.subscribers", lambda: self.subscribers)
+        metrics.register_gauge("capacity_feed.pending", lambda: len(self._pending))
+
+    def publish(self, record: EventRecord) -> None:
+        """
+        Queue an event's new capacity for the next tick.
+
+        Args:
+            record: Changed catalog record
+        """
+        self._pending[record.id] = capacity_payload(record)
+        self._changed.set()
+
+    def message_id(self, generation: int) -> str:
+        """ID of the message sent for a generation."""
+        return f"{self.origin}-{generation}"
+
+    def _resume_cursor(self, last_event_id: Optional[str]) -> Optional[int]:
+        """Generation a ``Last-Event-ID`` stands for, if this broadcaster issued it."""
+        if not last_event_id:
+            return None
+        origin, _, generation = last_event_id.rpartition("-")
+        if origin != self.origin or not generation.isdigit():
+            return None
+        return int(generation)
+
+    def _release(self) -> None:
+        self.generation += 1
+        self._ticks.append(CapacityTick(self.generation, self.message_id(self.generation), self._pending))
+        self._pending = {}
+        metrics.increment("capacity_feed.ticks")
+        # Swap before waking so subscribers re-arm on a fresh event
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._changed.wait()
+            self._changed.clear()
+            self._release()
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """Start releasing ticks on the running event loop."""
+        self.closed = False
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop releasing ticks and end every open stream."""
+        self.closed = True
+        self._wakeup.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _snapshot(self, event_ids: Optional[Set[int]]) -> str:
+        records = self.catalog.get_upcoming_events()
+        return sse_frame("snapshot", self.message_id(self.generation), {
+            "events": [
+                capacity_payload(record) for record in records
+                if event_ids is None or record.id in event_ids
+            ]
+        })
+
+    def _since(self, cursor: int) -> Optional[List[CapacityTick]]:
+        """Ticks after a cursor, or None if some of them were already dropped."""
+        if cursor >= self.generation:
+            return []
+        if not self._ticks or cursor + 1 < self._ticks[0].generation:
+            return None
+        return list(self._ticks)[cursor + 1 - self._ticks[0].generation:]
+
+    def is_full(self) -> bool:
+        """Whether the subscriber limit has been reached."""
+        return self.subscribers >= self.max_subscribers
+
+    async def stream(
+        self,
+        event_ids: Optional[Iterable[int]] = None,
+        last_event_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream capacity updates as Server-Sent Events.
+
+        The stream opens with a ``snapshot`` of every upcoming event (or
+        only ``event_ids``), followed by ``capacity`` messages listing the
+        events that changed. Message IDs name this worker's tick
+        generations, so a client reconnecting to the same worker with
+        ``Last-Event-ID`` only receives what it missed while that is still
+        in the history; any other ID gets a snapshot.
+
+        Args:
+            event_ids: Only report these events
+            last_event_id: ID of the last message the client has seen
+
+        Yields:
+            str: Encoded messages and keepalive comments
+        """
+        wanted = set(event_ids) if event_ids else None
+        self.subscribers += 1
+        metrics.increment("capacity_feed.connections")
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            cursor = self.generation
+            resume_from = self._resume_cursor(last_event_id)
+            if resume_from is not None and resume_from <= self.generation and self._since(resume_from) is not None:
+                cursor = resume_from
+            else:
+                yield self._snapshot(wanted)
+
+            while not self.closed:
+                ticks = self._since(cursor)
+                if ticks is None:
+                    # Fell behind the history; start over from the current state
+                    metrics.increment("capacity_feed.resyncs")
+                    cursor = self.generation
+                    yield self._snapshot(wanted)
+                    continue
+                if ticks:
+                    cursor = ticks[-1].generation
+                    if wanted is None and len(ticks) == 1:
+                        yield ticks[0].frame
+                        continue
+                    changes: Dict[int, Dict[str, Any]] = {}
+                    for tick in ticks:
+                        for event_id, payload in tick.changes.items():
+                            if wanted is None or event_id in wanted:
+                                changes[event_id] = payload
+                    if changes:
+                        yield sse_frame("capacity", self.message_id(cursor), {"events": list(changes.values())})
+                    continue
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.keepalive)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            self.subscribers -= 1
+
+
+# Global capacity broadcaster
+capacity_broadcaster = CapacityBroadcaster(
+    event_catalog,
+    interval=settings.CAPACITY_FEED_INTERVAL,
+    history=settings.CAPACITY_FEED_HISTORY,
+    keepalive=settings.CAPACITY_FEED_KEEPALIVE,
+    max_subscribers=settings.CAPACITY_FEED_MAX_SUBSCRIBERS
+)
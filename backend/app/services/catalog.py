@@ -0,0 +1,330 @@
+"""
+In-memory catalog of upcoming events.
+"""
+
+import asyncio
+import sys
+import time
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.database import lane_session
+from app.db.lanes import read_lane
+from app.models.event import Event
+
+logger = get_logger(__name__)
+
+# Server-generated timestamps only have second precision, so every refresh
+# re-reads the last second before the watermark to catch same-second updates.
+WATERMARK_LOOKBACK = timedelta(seconds=1)
+
+EVENT_COLUMNS = (
+    Event.id,
+    Event.name,
+    Event.location,
+    Event.start_time,
+    Event.end_time,
+    Event.max_capacity,
+    Event.current_attendees,
+    Event.created_at,
+    Event.updated_at,
+)
+
+
+class EventRecord:
+    """
+    Compact, slotted copy of an event row.
+
+    Exposes the same attributes and computed properties as the ``Event``
+    model so it can be validated into ``EventResponse`` directly.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "location",
+        "start_time",
+        "end_time",
+        "max_capacity",
+        "current_attendees",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        location: str,
+        start_time: datetime,
+        end_time: datetime,
+        max_capacity: int,
+        current_attendees: int,
+        created_at: datetime,
+        updated_at: datetime,
+    ):
+        self.id = id
+        self.name = name
+        self.location = location
+        self.start_time = start_time
+        self.end_time = end_time
+        self.max_capacity = max_capacity
+        self.current_attendees = current_attendees
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_model(cls, event: Event) -> "EventRecord":
+        """Build a record from a loaded ``Event`` instance."""
+        return cls(*(getattr(event, column.key) for column in EVENT_COLUMNS))
+
+    @property
+    def is_full(self) -> bool:
+        """Check if the event is at full capacity."""
+        return self.current_attendees >= self.max_capacity
+
+    @property
+    def available_spots(self) -> int:
+        """Get the number of available spots."""
+        return max(0, self.max_capacity - self.current_attendees)
+
+    @property
+    def capacity_percentage(self) -> float:
+        """Get the capacity utilization as a percentage."""
+        if self.max_capacity == 0:
+            return 0.0
+        return (self.current_attendees / self.max_capacity) * 100
+
+    def size_in_bytes(self) -> int:
+        """Approximate memory held by the record and the values it owns."""
+        return sys.getsizeof(self) + sys.getsizeof(self.name) + sys.getsizeof(self.location)
+
+
+class EventCatalog:
+    """
+    Snapshot of upcoming events kept sorted by ``start_time``.
+
+    The catalog is loaded once and then refreshed incrementally: each
+    refresh only reads rows whose ``updated_at`` is at or after the last
+    seen watermark. Writes made by this process are applied immediately
+    through ``upsert`` and ``adjust_attendees`` so clients read their own
+    writes without waiting for the next refresh.
+    """
+
+    def __init__(self, refresh_interval: float):
+        self.refresh_interval = refresh_interval
+        self.watermark: Optional[datetime] = None
+        self.loaded = False
+        self._records: Dict[int, EventRecord] = {}
+        self._order: List[EventRecord] = []
+        self._start_times: List[datetime] = []
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[EventRecord], None]] = []
+
+        metrics.register_gauge("catalog.events", lambda: len(self._records))
+        metrics.register_gauge("catalog.bytes", self.size_in_bytes)
+        metrics.register_gauge("catalog.bytes_per_event", lambda: self.stats()["bytes_per_event"])
+
+    def _reindex(self) -> None:
+        self._order = sorted(self._records.values(), key=lambda record: (record.start_time, record.id))
+        self._start_times = [record.start_time for record in self._order]
+
+    def _prune(self, now: datetime) -> None:
+        expired = bisect_right(self._start_times, now)
+        if expired:
+            for record in self._order[:expired]:
+                del self._records[record.id]
+            del self._order[:expired]
+            del self._start_times[:expired]
+
+    def _apply(self, record: EventRecord, now: datetime) -> None:
+        if record.start_time > now:
+            previous = self._records.get(record.id)
+            self._records[record.id] = record
+            if previous is None or (
+                (previous.current_attendees, previous.max_capacity)
+                != (record.current_attendees, record.max_capacity)
+            ):
+                self._notify(record)
+        else:
+            self._records.pop(record.id, None)
+
+    def _notify(self, record: EventRecord) -> None:
+        for listener in self._listeners:
+            try:
+                listener(record)
+            except Exception as e:
+                logger.error(f"Event catalog listener failed: {e}")
+
+    def add_listener(self, listener: Callable[[EventRecord], None]) -> None:
+        """
+        Call a function whenever an upcoming event's capacity changes.
+
+        Listeners see changes read by refreshes (including other workers'
+        writes) as well as local writes applied through ``upsert`` and
+        ``adjust_attendees``. They run synchronously and must not block.
+
+        Args:
+            listener: Function taking the changed record
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    async def refresh(self) -> int:
+        """
+        Apply event rows changed since the last refresh.
+
+        Returns:
+            int: Number of rows read
+        """
+        async with self._lock:
+            started = time.perf_counter()
+            now = datetime.utcnow()
+
+            query = select(*EVENT_COLUMNS)
+            if self.watermark is None:
+                query = query.where(Event.start_time > now)
+            else:
+                query = query.where(Event.updated_at >= self.watermark - WATERMARK_LOOKBACK)
+
+            async with lane_session(read_lane) as session:
+                rows = (await session.execute(query)).all()
+
+            for row in rows:
+                self._apply(EventRecord(*row), now)
+                if self.watermark is None or row.updated_at > self.watermark:
+                    self.watermark = row.updated_at
+
+            if self.watermark is None:
+                self.watermark = now
+
+            if rows:
+                self._reindex()
+            self._prune(now)
+            self.loaded = True
+
+            metrics.increment("catalog.refreshes")
+            metrics.increment("catalog.rows_read", len(rows))
+            metrics.observe("catalog.refresh_ms", (time.perf_counter() - started) * 1000)
+            return len(rows)
+
+    async def reload(self, event_ids: List[int]) -> int:
+        """
+        Re-read specific events, e.g. after another worker changed them.
+
+        Events that no longer exist are dropped from the catalog.
+
+        Args:
+            event_ids: Event IDs to re-read
+
+        Returns:
+            int: Number of rows read
+        """
+        if not self.loaded or not event_ids:
+            return 0
+        async with self._lock:
+            now = datetime.utcnow()
+            async with lane_session(read_lane) as session:
+                rows = (await session.execute(
+                    select(*EVENT_COLUMNS).where(Event.id.in_(event_ids))
+                )).all()
+
+            for row in rows:
+                self._apply(EventRecord(*row), now)
+            for event_id in set(event_ids) - {row.id for row in rows}:
+                self._records.pop(event_id, None)
+            self._reindex()
+
+            metrics.increment("catalog.reloads")
+            metrics.increment("catalog.rows_read", len(rows))
+            return len(rows)
+
+    def upsert(self, event: Event) -> None:
+        """
+        Apply a locally written event without waiting for a refresh.
+
+        Args:
+            event: Fully loaded event instance
+        """
+        if not self.loaded:
+            return
+        self._apply(EventRecord.from_model(event), datetime.utcnow())
+        self._reindex()
+
+    def adjust_attendees(self, event_id: int, delta: int) -> None:
+        """
+        Apply a local change to an event's attendee count.
+
+        Args:
+            event_id: Event ID
+            delta: Change in attendee count
+        """
+        record = self._records.get(event_id)
+        if record is not None:
+            current_attendees = max(0, min(record.max_capacity, record.current_attendees + delta))
+            if current_attendees != record.current_attendees:
+                record.current_attendees = current_attendees
+                self._notify(record)
+
+    def get_upcoming_events(self) -> List[EventRecord]:
+        """
+        Get upcoming events ordered by start time.
+
+        Returns:
+            List[EventRecord]: Upcoming event records
+        """
+        return self._order[bisect_right(self._start_times, datetime.utcnow()):]
+
+    def size_in_bytes(self) -> int:
+        """Approximate memory held by the catalog records."""
+        return sum(record.size_in_bytes() for record in self._order)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get catalog size statistics.
+
+        Returns:
+            Dict[str, float]: Event count, total bytes and bytes per event
+        """
+        count = len(self._records)
+        total = self.size_in_bytes()
+        return {
+            "events": count,
+            "bytes": total,
+            "bytes_per_event": total / count if count else 0.0,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                metrics.increment("catalog.refresh_errors")
+                logger.error(f"Event catalog refresh failed: {e}")
+
+    def start(self) -> None:
+        """Start periodic refreshes on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic refreshes."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global event catalog
+event_catalog = EventCatalog(settings.CATALOG_REFRESH_INTERVAL)
@@ -3,13 +3,18 @@ Event service with business logic for event management.
 """
 
 from datetime import datetime
-from typing import List
+from typing import Any, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.models.event import Event
 from app.repositories.event import EventRepository
-from app.schemas.event import EventCreate
+from app.schemas.event import EVENT_COMPUTED_FIELDS, EventCreate
+from app.schemas.fields import required_columns
+from app.services.catalog import event_catalog
+from app.services.invalidation import EVENTS_CACHE, invalidation_bus
+from app.services.loaders import get_event_loader
+from app.services.single_flight import coalesced
 from app.services.exceptions import (
     EventNotFoundError,
     EventAlreadyExistsError,
@@ -37,14 +42,42 @@ class EventService:
         self.db = db
         self.event_repo = EventRepository(db)
     
-    async def get_upcoming_events(self) -> List[Event]:
+    @coalesced
+    async def get_upcoming_events(self, fields: Optional[Sequence[str]] = None) -> List[Any]:
         """
         Get upcoming events.
         
+        Identical concurrent requests share one query.
+        
+        Args:
+            fields: Response fields wanted; only the columns they need are
+                read and rows are returned instead of ``Event`` instances
+        
+        Returns:
+            List[Any]: List of upcoming events (or rows)
+        """
+        columns = required_columns(fields, EVENT_COMPUTED_FIELDS) if fields else None
+        return await self.event_repo.get_upcoming_events(columns)
+    
+    async def get_events(self, event_ids: List[int]) -> Tuple[List[Event], List[int]]:
+        """
+        Get several events by ID.
+        
+        Lookups are batched with those of concurrent requests into one
+        ``IN`` query by the event loader.
+        
+        Args:
+            event_ids: Event IDs; duplicates are returned once
+            
         Returns:
-            List[Event]: List of upcoming events
+            Tuple[List[Event], List[int]]: Events found in request order,
+            and the IDs that have no event
         """
-        return await self.event_repo.get_upcoming_events()
+        unique_ids = list(dict.fromkeys(event_ids))
+        loaded = await get_event_loader(self.db).load_many(unique_ids)
+        events = [event for event in loaded if event is not None]
+        missing = [event_id for event_id, event in zip(unique_ids, loaded) if event is None]
+        return events, missing
     
     async def create_event(self, event_data: EventCreate) -> Event:
         """
@@ -67,6 +100,10 @@ class EventService:
             raise EventAlreadyExistsError(f"Event with name '{event_data.name}' already exists")
         
         # Create event
-        event = await self.event_repo.create(event_data)
+        event = await self.event_repo.create(event_data, commit=False)
+        await self.db.refresh(event)
+        invalidation_bus.record(self.db, EVENTS_CACHE, [event.id])
+        await self.db.commit()
+        event_catalog.upsert(event)
         logger.info(f"Event created: {event.id} - {event.name}")
         return event
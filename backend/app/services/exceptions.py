@@ -2,6 +2,11 @@
 Custom exceptions for service layer.
 """
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.models.waitlist import WaitlistEntry
+
 
 class ServiceError(Exception):
     """Base exception for service layer errors."""
@@ -63,3 +68,59 @@ class AttendeeAlreadyRegisteredError(AlreadyExistsError):
 class AttendeeValidationError(ValidationError):
     """Exception raised when attendee validation fails."""
     pass
+
+
+# Waitlist exceptions
+class AttendeeWaitlistedError(EventCapacityExceededError):
+    """Exception raised when a registrant for a full event was queued on its waitlist."""
+    
+    def __init__(self, message: str, entry: "WaitlistEntry", position: int):
+        super().__init__(message)
+        self.entry = entry
+        self.position = position
+
+
+class AttendeeAlreadyWaitlistedError(AlreadyExistsError):
+    """Exception raised when a registrant is already on an event's waitlist."""
+    pass
+
+
+class WaitlistEntryNotFoundError(NotFoundError):
+    """Exception raised when a waitlist entry is not found."""
+    pass
+
+
+# Waiting room exceptions
+class WaitingRoomError(ServiceError):
+    """Base exception for waiting room errors."""
+    pass
+
+
+class WaitingRoomNotEnabledError(WaitingRoomError):
+    """Exception raised when an event has no active waiting room."""
+    pass
+
+
+class QueueTicketRequiredError(WaitingRoomError):
+    """Exception raised when registration needs a queue ticket and none was given."""
+    pass
+
+
+class InvalidQueueTicketError(WaitingRoomError):
+    """Exception raised when a queue ticket is forged, stale, expired or already used."""
+    pass
+
+
+class QueueTicketNotAdmittedError(WaitingRoomError):
+    """Exception raised when a queue ticket has not been admitted yet."""
+    
+    def __init__(self, message: str, position: int, retry_after: float):
+        super().__init__(message)
+        self.position = position
+        self.retry_after = retry_after
+
+
+# Seat hold exceptions
+class SeatHoldNotFoundError(NotFoundError):
+    """Exception raised when a seat hold does not exist or has expired."""
+    pass
@@ -0,0 +1,275 @@
+"""
+Cross-worker cache invalidation over a change-log table.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.database import lane_session, shard_engines, shard_router
+from app.db.lanes import write_lane
+from app.models.cache_invalidation import CacheInvalidation
+from app.services.catalog import event_catalog
+from app.services.membership import membership_filters
+
+logger = get_logger(__name__)
+
+# Cache names
+EVENTS_CACHE = "events"
+MEMBERSHIP_CACHE = "membership"
+SHARDS_CACHE = "shards"
+WAITING_ROOMS_CACHE = "waiting_rooms"
+
+# Session.info key holding invalidations recorded in the open transaction
+PENDING_KEY = "cache_invalidations"
+
+InvalidationHandler = Callable[[List[str]], Awaitable[None]]
+
+
+def membership_key(event_id: int, email: str) -> str:
+    """Key of one registration in the membership cache."""
+    return f"{event_id}:{email}"
+
+
+def parse_membership_key(key: str) -> Tuple[int, str]:
+    """Split a membership cache key into event ID and email."""
+    event_id, email = key.split(":", 1)
+    return int(event_id), email
+
+
+def key_shard(key: str) -> str:
+    """Shard of the event a cache key starts with."""
+    return shard_router.shard_for_event(int(key.split(":", 1)[0]))
+
+
+class InvalidationBus:
+    """
+    Tells every worker which cached keys another worker has changed.
+
+    Services ``record`` the keys a transaction changes; they are written
+    to the ``cache_invalidations`` table by the same commit, so other
+    workers hear about exactly the changes that were committed. Each
+    worker polls on one dedicated connection: ``PRAGMA data_version``
+    only changes when another connection has committed, so an idle
+    database costs a pragma per poll and the change log is only read
+    when something was written. New rows are handed to the handlers
+    subscribed to their cache, which evict or refresh just those keys.
+    Rows written by this worker are skipped, since it already applied
+    its own changes.
+
+    With several database shards each shard has its own change log,
+    written by the transactions committing there; every cache key starts
+    with its event's ID, which picks the shard. The bus polls each shard
+    on its own connection with its own high-water mark.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float,
+        retention: float,
+        engines: Optional[Dict[str, AsyncEngine]] = None
+    ):
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.engines = engines or shard_engines
+        self.origin = uuid.uuid4().hex
+        self.watermarks: Dict[str, int] = {}
+        self._data_versions: Dict[str, int] = {}
+        self._handlers: Dict[str, List[InvalidationHandler]] = {}
+        self._conns: Dict[str, AsyncConnection] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._next_prune = 0.0
+
+        metrics.register_gauge("invalidation.watermark", lambda: sum(self.watermarks.values()))
+
+    def subscribe(self, cache: str, handler: InvalidationHandler) -> None:
+        """
+        Call a handler with the keys other workers invalidate in a cache.
+
+        Args:
+            cache: Cache name
+            handler: Coroutine function taking the invalidated keys
+        """
+        handlers = self._handlers.setdefault(cache, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def record(self, db: AsyncSession, cache: str, keys: Iterable[object]) -> None:
+        """
+        Invalidate keys when the session's current transaction commits.
+
+        Nothing is written if the transaction rolls back.
+
+        Args:
+            db: Session whose transaction changes the keys
+            cache: Cache name
+            keys: Changed keys
+        """
+        if not settings.INVALIDATION_ENABLED:
+            return
+        pending = db.info.setdefault(PENDING_KEY, [])
+        pending.extend((cache, str(key)) for key in keys)
+
+    def _rows(self, pending: List[Tuple[str, str]]) -> Dict[str, List[Dict[str, str]]]:
+        rows_by_shard: Dict[str, List[Dict[str, str]]] = {}
+        for cache, key in dict.fromkeys(pending):
+            rows_by_shard.setdefault(key_shard(key), []).append(
+                {"origin": self.origin, "cache": cache, "key": key}
+            )
+        return rows_by_shard
+
+    async def load(self) -> None:
+        """Open the polling connections and start from the current end of each log."""
+        for shard_id, shard_engine in self.engines.items():
+            conn = self._conns.get(shard_id)
+            if conn is None:
+                conn = self._conns[shard_id] = await shard_engine.connect()
+            self._data_versions[shard_id] = (await conn.exec_driver_sql("PRAGMA data_version")).scalar()
+            self.watermarks[shard_id] = (
+                await conn.execute(select(func.max(CacheInvalidation.id)))
+            ).scalar() or 0
+            await conn.rollback()
+
+    async def _read_shard(self, shard_id: str) -> List[Any]:
+        conn = self._conns[shard_id]
+        data_version = (await conn.exec_driver_sql("PRAGMA data_version")).scalar()
+        if data_version == self._data_versions[shard_id]:
+            await conn.rollback()
+            return []
+        self._data_versions[shard_id] = data_version
+
+        rows = (await conn.execute(
+            select(CacheInvalidation.id, CacheInvalidation.origin, CacheInvalidation.cache, CacheInvalidation.key)
+            .where(CacheInvalidation.id > self.watermarks[shard_id])
+            .order_by(CacheInvalidation.id)
+        )).all()
+        await conn.rollback()
+        metrics.increment("invalidation.polls")
+        if rows:
+            self.watermarks[shard_id] = rows[-1].id
+        return rows
+
+    async def poll(self) -> int:
+        """
+        Deliver invalidations committed by other workers since the last poll.
+
+        Returns:
+            int: Number of invalidations delivered
+        """
+        if not self._conns:
+            await self.load()
+
+        rows = []
+        for shard_id in self.engines:
+            rows.extend(await self._read_shard(shard_id))
+        if not rows:
+            return 0
+
+        keys_by_cache: Dict[str, Dict[str, None]] = {}
+        for row in rows:
+            if row.origin != self.origin:
+                keys_by_cache.setdefault(row.cache, {})[row.key] = None
+
+        delivered = 0
+        for cache, keys in keys_by_cache.items():
+            for handler in self._handlers.get(cache, []):
+                try:
+                    await handler(list(keys))
+                except Exception as e:
+                    logger.error(f"Invalidation handler for {cache} failed: {e}")
+            delivered += len(keys)
+        metrics.increment("invalidation.received", delivered)
+        return delivered
+
+    async def prune(self) -> int:
+        """
+        Delete change-log rows older than the retention period.
+
+        Returns:
+            int: Number of rows deleted
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=self.retention)
+        async with lane_session(write_lane) as db:
+            result = await db.execute(delete(CacheInvalidation).where(CacheInvalidation.created_at < cutoff))
+            await db.commit()
+        return result.rowcount or 0
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                await self.poll()
+                if time.monotonic() >= self._next_prune:
+                    self._next_prune = time.monotonic() + self.retention / 10
+                    await self.prune()
+            except Exception as e:
+                metrics.increment("invalidation.poll_errors")
+                logger.error(f"Invalidation poll failed: {e}")
+
+    def start(self) -> None:
+        """Start polling on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and close the polling connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for conn in self._conns.values():
+            await conn.close()
+        self._conns = {}
+
+
+async def reload_events(keys: List[str]) -> None:
+    """Refresh events another worker changed in the event catalog."""
+    await event_catalog.reload([int(key) for key in keys])
+
+
+async def add_memberships(keys: List[str]) -> None:
+    """Add registrations made by another worker to the membership filters."""
+    for key in keys:
+        membership_filters.add(*parse_membership_key(key))
+
+
+async def reload_shards(keys: List[str]) -> None:
+    """Re-read the shards of events moved to another shard."""
+    await shard_router.reload([int(key) for key in keys])
+
+
+# Global invalidation bus
+invalidation_bus = InvalidationBus(
+    poll_interval=settings.INVALIDATION_POLL_INTERVAL,
+    retention=settings.INVALIDATION_RETENTION_SECONDS
+)
+
+
+@event.listens_for(Session, "before_commit")
+def _write_invalidations(session: Session) -> None:
+    """Write the invalidations recorded in a transaction as part of its commit."""
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending:
+        # Each event's rows go to its own shard, in that shard's transaction;
+        # a Core insert, as sharded sessions cannot route ORM bulk inserts
+        for shard_id, rows in invalidation_bus._rows(pending).items():
+            session.execute(insert(CacheInvalidation.__table__), rows, bind_arguments={"shard_id": shard_id})
+        metrics.increment("invalidation.published", len(pending))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_invalidations(session: Session, previous_transaction: object) -> None:
+    """Drop invalidations recorded in a transaction that rolled back."""
+    session.info.pop(PENDING_KEY, None)
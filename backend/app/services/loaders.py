@@ -0,0 +1,152 @@
+"""
+Batched loaders that merge concurrent lookups by ID into one query.
+"""
+
+import asyncio
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from weakref import WeakKeyDictionary
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.database import AsyncSessionLocal, shard_engines
+from app.db.interrupts import untracked_context
+from app.db.sharding import HOME_SHARD
+from app.models.event import Event
+from app.repositories.event import EventRepository
+
+logger = get_logger(__name__)
+
+
+class EventLoader:
+    """
+    DataLoader-style batching of event lookups.
+
+    Every ``load`` or ``load_many`` call made in the same event-loop tick,
+    from any number of concurrent requests, is answered by a single
+    ``WHERE id IN (...)`` query (split into chunks of ``max_batch``).
+    The query runs on a short read-only session the loader opens for the
+    batch and closes straight after, never on a caller's session: a
+    batch serves every caller, so it must not stretch one caller's write
+    transaction or fail with it when that request is cancelled. It takes
+    no lane slot, since its callers already hold theirs while they wait.
+
+    Loaded events are detached when the batch session closes, so they
+    can be handed to every caller. Results are not cached beyond the
+    batch. Write flows read their event through ``EventRepository`` in
+    their own transaction instead.
+    """
+
+    def __init__(self, max_batch: int, session_factory: Callable[[], AsyncSession]):
+        self.max_batch = max_batch
+        self.session_factory = session_factory
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._scheduled = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, event_id: int) -> Optional[Event]:
+        """
+        Load one event.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Optional[Event]: Event, or None if it does not exist
+        """
+        return (await self.load_many([event_id]))[0]
+
+    async def load_many(self, event_ids: Iterable[int]) -> List[Optional[Event]]:
+        """
+        Load several events.
+
+        Args:
+            event_ids: Event IDs
+
+        Returns:
+            List[Optional[Event]]: Events in the order of ``event_ids``,
+            None where an event does not exist
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        for event_id in event_ids:
+            future = self._pending.get(event_id)
+            if future is None:
+                future = loop.create_future()
+                self._pending[event_id] = future
+            futures.append(future)
+
+        if self._pending and not self._scheduled:
+            self._scheduled = True
+            loop.call_soon(self._dispatch)
+        return list(await asyncio.gather(*(asyncio.shield(future) for future in futures)))
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+        event_ids = list(pending)
+        metrics.increment("event_loader.batches")
+        metrics.observe("event_loader.batch_size", len(event_ids))
+        # The batch serves every caller, so cancelling the request that
+        # started it must not abort it
+        task = asyncio.get_running_loop().create_task(
+            self._fetch(event_ids, pending), context=untracked_context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, event_ids: List[int], pending: Dict[int, asyncio.Future]) -> None:
+        try:
+            found: Dict[int, Event] = {}
+            async with self.session_factory() as db:
+                event_repo = EventRepository(db)
+                for start in range(0, len(event_ids), self.max_batch):
+                    for event in await event_repo.get_many(event_ids[start:start + self.max_batch]):
+                        found[event.id] = event
+        except BaseException as e:
+            logger.warning(f"Event batch load failed: {e}")
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # Waiters re-raise it; don't warn about an unretrieved exception
+                    future.exception()
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for event_id, future in pending.items():
+            if not future.done():
+                future.set_result(found.get(event_id))
+
+
+_loaders: "WeakKeyDictionary[Engine, EventLoader]" = WeakKeyDictionary()
+
+
+def get_event_loader(db: AsyncSession) -> EventLoader:
+    """
+    Get the event loader for the database a session is bound to.
+
+    Sessions on the same engine share one loader, so their lookups batch
+    together; sessions on another engine (e.g. a tool's own database) get
+    their own, whose batches run on sessions of that engine.
+
+    Args:
+        db: Database session
+
+    Returns:
+        EventLoader: Loader for the session's engine
+    """
+    # A sharded session has no single bind; it is known by its home shard
+    engine = db.sync_session.get_bind(shard_id=HOME_SHARD)
+    loader = _loaders.get(engine)
+    if loader is None:
+        if engine is shard_engines[HOME_SHARD].sync_engine:
+            session_factory = AsyncSessionLocal
+        else:
+            session_factory = async_sessionmaker(db.bind, class_=AsyncSession, expire_on_commit=False)
+        loader = EventLoader(max_batch=settings.EVENT_LOADER_MAX_BATCH, session_factory=session_factory)
+        _loaders[engine] = loader
+    return loader
@@ -0,0 +1,184 @@
+"""
+Per-event probabilistic membership filters over attendee emails.
+"""
+
+import math
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Awaitable, Callable, Dict, Iterable, List, Set
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+RosterLoader = Callable[[int], Awaitable[List[str]]]
+
+
+def normalize_email(email: str) -> str:
+    """Normalize an email address for membership checks."""
+    return email.strip().lower()
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter using double hashing over a bytearray.
+
+    ``item in bloom`` returning False is definite; returning True means
+    the item is probably present and must be confirmed elsewhere.
+    """
+
+    __slots__ = ("size", "hash_count", "bits", "count")
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(1, capacity)
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def size_in_bytes(self) -> int:
+        """Memory held by the bit array."""
+        return len(self.bits)
+
+
+class EventMembershipFilters:
+    """
+    LRU-bounded set of Bloom filters, one per recently registered-to event.
+
+    A filter is built lazily from the event roster the first time a
+    registration for the event is checked, sized for the event's
+    ``max_capacity``, and updated on every registration. A definite miss
+    lets the caller skip the duplicate-email query; a possible hit falls
+    back to the real query. Filters are process-local; registrations made
+    by other workers arrive through the invalidation bus a poll interval
+    later, and until then the unique constraint on ``(person_id, event_id)``
+    remains the source of truth.
+    """
+
+    def __init__(self, max_events: int, error_rate: float):
+        self.max_events = max_events
+        self.error_rate = error_rate
+        self._filters: "OrderedDict[int, BloomFilter]" = OrderedDict()
+        self._building: Dict[int, Set[str]] = {}
+
+        metrics.register_gauge("membership.filters", lambda: len(self._filters))
+        metrics.register_gauge("membership.bytes", self.size_in_bytes)
+
+    async def _get_filter(self, event_id: int, capacity: int, load_roster: RosterLoader) -> BloomFilter:
+        bloom = self._filters.get(event_id)
+        if bloom is not None:
+            self._filters.move_to_end(event_id)
+            return bloom
+
+        # Registrations that complete while the roster is loading are
+        # collected and replayed into the new filter.
+        pending = self._building.setdefault(event_id, set())
+        try:
+            emails = await load_roster(event_id)
+        except BaseException:
+            self._building.pop(event_id, None)
+            raise
+
+        bloom = BloomFilter(max(capacity, len(emails)), self.error_rate)
+        for email in emails:
+            bloom.add(normalize_email(email))
+        for email in self._building.pop(event_id, pending):
+            bloom.add(email)
+
+        self._filters[event_id] = bloom
+        if len(self._filters) > self.max_events:
+            self._filters.popitem(last=False)
+
+        metrics.increment("membership.builds")
+        return bloom
+
+    async def might_contain(
+        self,
+        event_id: int,
+        capacity: int,
+        email: str,
+        load_roster: RosterLoader
+    ) -> bool:
+        """
+        Check whether an email may already be registered for an event.
+
+        Args:
+            event_id: Event ID
+            capacity: Event capacity used to size a new filter
+            email: Email to check
+            load_roster: Loader returning all registered emails for an event
+
+        Returns:
+            bool: False if the email is definitely not registered
+        """
+        if not settings.MEMBERSHIP_FILTER_ENABLED:
+            return True
+
+        bloom = await self._get_filter(event_id, capacity, load_roster)
+        metrics.increment("membership.lookups")
+        if normalize_email(email) in bloom:
+            metrics.increment("membership.maybe_present")
+            return True
+
+        metrics.increment("membership.definite_miss")
+        return False
+
+    async def warm(self, event_id: int, capacity: int, load_roster: RosterLoader) -> None:
+        """
+        Build an event's filter ahead of its first registration check.
+
+        Args:
+            event_id: Event ID
+            capacity: Event capacity used to size the filter
+            load_roster: Loader returning all registered emails for an event
+        """
+        if settings.MEMBERSHIP_FILTER_ENABLED:
+            await self._get_filter(event_id, capacity, load_roster)
+
+    def record_false_positive(self) -> None:
+        """Record that a possible hit turned out not to be registered."""
+        metrics.increment("membership.false_positive")
+
+    def add(self, event_id: int, email: str) -> None:
+        """
+        Record a registration in the event's filter, if it has one.
+
+        Args:
+            event_id: Event ID
+            email: Registered email
+        """
+        email = normalize_email(email)
+        bloom = self._filters.get(event_id)
+        if bloom is not None:
+            bloom.add(email)
+        elif event_id in self._building:
+            self._building[event_id].add(email)
+
+    def discard(self, event_id: int) -> None:
+        """Drop the filter for an event so it is rebuilt on next use."""
+        self._filters.pop(event_id, None)
+
+    def size_in_bytes(self) -> int:
+        """Total memory held by all filter bit arrays."""
+        return sum(bloom.size_in_bytes() for bloom in self._filters.values())
+
+
+# Global membership filters
+membership_filters = EventMembershipFilters(
+    max_events=settings.MEMBERSHIP_FILTER_MAX_EVENTS,
+    error_rate=settings.MEMBERSHIP_FILTER_ERROR_RATE,
+)
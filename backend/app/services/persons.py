@@ -0,0 +1,115 @@
+"""
+Person IDs by email, cached in front of the ``persons`` table.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.db.database import shard_router
+from app.repositories.person import PersonRepository
+from app.services.membership import normalize_email
+
+# Session.info key holding emails whose person was inserted in the open transaction
+CREATED_KEY = "created_persons"
+
+
+class PersonDirectory:
+    """
+    LRU-bounded map from normalized email to person ID, per shard.
+
+    A person's ID never changes once committed, so cached IDs are never
+    invalidated, only evicted. IDs of persons inserted by a transaction
+    that has not committed yet are not cached: were it rolled back,
+    SQLite could hand the same ID to somebody else.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._ids: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+
+        metrics.register_gauge("persons.cached", lambda: len(self._ids))
+
+    def _get(self, key: Tuple[str, str]) -> Optional[int]:
+        person_id = self._ids.get(key)
+        if person_id is not None:
+            self._ids.move_to_end(key)
+        return person_id
+
+    def _put(self, key: Tuple[str, str], person_id: int) -> None:
+        if self.max_size <= 0:
+            return
+        self._ids[key] = person_id
+        self._ids.move_to_end(key)
+        if len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
+
+    async def lookup(self, db: AsyncSession, event_id: int, emails: Iterable[str]) -> Dict[str, int]:
+        """
+        Get the IDs of the persons with the given emails.
+
+        Args:
+            db: Database session
+            event_id: Event the persons are looked up for
+            emails: Emails
+
+        Returns:
+            Dict[str, int]: Person ID by normalized email, for the persons found
+        """
+        shard_id = shard_router.shard_for_event(event_id)
+        ids: Dict[str, int] = {}
+        missing = []
+        for email in {normalize_email(email) for email in emails}:
+            person_id = self._get((shard_id, email))
+            if person_id is None:
+                missing.append(email)
+            else:
+                ids[email] = person_id
+        metrics.increment("persons.cache_hits", len(ids))
+        if not missing:
+            return ids
+
+        metrics.increment("persons.cache_misses", len(missing))
+        found = await PersonRepository(db).get_ids_by_email(event_id, missing)
+        created = db.info.get(CREATED_KEY, ())
+        for email, person_id in found.items():
+            if email not in created:
+                self._put((shard_id, email), person_id)
+        ids.update(found)
+        return ids
+
+    async def resolve(self, db: AsyncSession, event_id: int, people: Dict[str, str]) -> Dict[str, int]:
+        """
+        Get the IDs of persons, inserting the ones that do not exist yet.
+
+        New persons are inserted in the session's transaction without
+        committing; an existing person keeps their stored name.
+
+        Args:
+            db: Database session
+            event_id: Event the persons register for
+            people: Name by email
+
+        Returns:
+            Dict[str, int]: Person ID by normalized email, for every person
+        """
+        people = {normalize_email(email): name for email, name in people.items()}
+        ids = await self.lookup(db, event_id, people)
+        missing = {email: name for email, name in people.items() if email not in ids}
+        if missing:
+            created = await PersonRepository(db).create_missing(event_id, missing)
+            db.info.setdefault(CREATED_KEY, set()).update(created)
+            ids.update(created)
+            metrics.increment("persons.created", len(created))
+            # Inserted by another worker since the lookup
+            raced = [email for email in missing if email not in created]
+            if raced:
+                ids.update(await self.lookup(db, event_id, raced))
+        return ids
+
+
+# Global person directory
+person_directory = PersonDirectory(max_size=settings.PERSON_CACHE_SIZE)
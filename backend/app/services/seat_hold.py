@@ -0,0 +1,152 @@
+"""
+Expiry of seat holds driven by an in-memory timer heap.
+"""
+
+import asyncio
+import heapq
+from collections import Counter
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.database import lane_session
+from app.db.lanes import read_lane, write_lane
+from app.repositories.seat_hold import SeatHoldRepository
+from app.services.waitlist import WaitlistService
+
+logger = get_logger(__name__)
+
+# Delay before retrying after a failed reap (e.g. the write lane was busy)
+REAP_RETRY_SECONDS = 1.0
+
+
+class SeatHoldReaper:
+    """
+    Min-heap of hold expiries served by a single timer task.
+
+    Every hold created by this process is pushed with its expiry. The
+    task sleeps until the earliest expiry (or until an earlier one is
+    scheduled), then deletes the due holds and releases their seats in one
+    transaction, promoting waitlisted registrants into them first. The
+    table is never scanned for expired rows; it is read once at startup to
+    pick up holds left by a previous run.
+
+    Holds that were confirmed or released stay in the heap until they come
+    due and are then skipped, because the delete only matches rows that
+    still exist and have expired. The same makes it safe for several
+    processes to reap overlapping holds.
+    """
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self._heap: List[Tuple[datetime, int]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        metrics.register_gauge("seat_holds.scheduled", lambda: len(self._heap))
+
+    def schedule(self, hold_id: int, expires_at: datetime) -> None:
+        """
+        Schedule a hold for expiry.
+
+        Args:
+            hold_id: Hold ID
+            expires_at: Expiry time (naive UTC)
+        """
+        heapq.heappush(self._heap, (expires_at, hold_id))
+        if self._heap[0][1] == hold_id and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def load(self) -> int:
+        """
+        Schedule every outstanding hold found in the database.
+
+        Returns:
+            int: Number of holds scheduled
+        """
+        async with lane_session(read_lane) as db:
+            expiries = await SeatHoldRepository(db).get_expiries()
+        self._heap.extend((expires_at, hold_id) for hold_id, expires_at in expiries)
+        heapq.heapify(self._heap)
+        return len(expiries)
+
+    async def reap(self) -> int:
+        """
+        Delete due holds (up to one batch) and release their seats.
+
+        Returns:
+            int: Number of holds that expired
+        """
+        now = datetime.utcnow()
+        due = []
+        while self._heap and self._heap[0][0] <= now and len(due) < self.batch_size:
+            due.append(heapq.heappop(self._heap)[1])
+        if not due:
+            return 0
+
+        try:
+            async with lane_session(write_lane) as db:
+                released = Counter(await SeatHoldRepository(db).delete_expired(due, now))
+                waitlist = WaitlistService(db)
+                promoted = {
+                    event_id: await waitlist.release_seats(event_id, count)
+                    for event_id, count in released.items()
+                }
+                await db.commit()
+        except Exception:
+            for hold_id in due:
+                heapq.heappush(self._heap, (now, hold_id))
+            raise
+
+        for event_id, count in released.items():
+            WaitlistService.seats_released(event_id, count, promoted[event_id])
+        expired = sum(released.values())
+        metrics.increment("seat_holds.expired", expired)
+        if expired:
+            logger.info(f"Released {expired} expired seat holds")
+        return expired
+
+    def _next_delay(self) -> Optional[float]:
+        if not self._heap:
+            return None
+        return max(0.0, (self._heap[0][0] - datetime.utcnow()).total_seconds())
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_delay())
+            except asyncio.TimeoutError:
+                pass
+
+            try:
+                while self._next_delay() == 0.0:
+                    await self.reap()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Seat hold expiry failed: {e}")
+                await asyncio.sleep(REAP_RETRY_SECONDS)
+
+    def start(self) -> None:
+        """Start the expiry task."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the expiry task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wakeup = None
+
+
+# Global seat hold reaper
+seat_hold_reaper = SeatHoldReaper(batch_size=settings.SEAT_HOLD_REAP_BATCH_SIZE)
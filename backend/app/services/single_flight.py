@@ -0,0 +1,120 @@
+"""
+Single-flight coalescing of identical concurrent service reads.
+"""
+
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.interrupts import request_cancelled
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Result handed to waiters when the leading call was cancelled, telling
+# them to run the call themselves
+_RETRY = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn a call argument into a hashable part of a coalescing key."""
+    if isinstance(value, BaseModel):
+        return (type(value).__name__, _freeze(value.model_dump()))
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class SingleFlight:
+    """
+    Shares one in-flight call between identical concurrent callers.
+
+    The first caller for a key runs the call; callers arriving before it
+    finishes wait for it and receive the same result or exception.
+    Nothing is cached: once the call completes the next caller runs it
+    again, so results are never older than the request that asked.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+        metrics.register_gauge("single_flight.in_flight", lambda: len(self._calls))
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a call, or join an identical one already running.
+
+        Args:
+            key: Coalescing key; calls with equal keys must be interchangeable
+            call: Coroutine function performing the read
+
+        Returns:
+            T: Result of the call
+        """
+        while key in self._calls:
+            metrics.increment("single_flight.coalesced")
+            result = await asyncio.shield(self._calls[key])
+            if result is not _RETRY:
+                return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        metrics.increment("single_flight.calls")
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.set_result(_RETRY)
+            raise
+        except BaseException as e:
+            if request_cancelled():
+                # Aborted because the leading request was cancelled; the
+                # waiters still want the result
+                future.set_result(_RETRY)
+                raise
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn about an unretrieved exception
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+# Global single-flight group
+single_flight = SingleFlight()
+
+
+def coalesced(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Coalesce concurrent identical calls of a read-only service method.
+
+    The key is the method's qualified name plus its arguments (``self``
+    excluded), so two requests share a call only when they ask for the
+    same thing. The shared result belongs to the leading caller's
+    session, so only use this on methods returning fully loaded objects
+    that are not modified afterwards.
+
+    Args:
+        method: Async service method
+
+    Returns:
+        Callable: Wrapped method
+    """
+    @functools.wraps(method)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> T:
+        if not settings.SINGLE_FLIGHT_ENABLED:
+            return await method(self, *args, **kwargs)
+        key: Tuple[Hashable, ...] = (method.__qualname__, _freeze(args), _freeze(kwargs))
+        return await single_flight.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,488 @@
+"""
+Virtual waiting rooms that meter registrations for popular events.
+
+When an event's waiting room is active, clients first take a queue
+ticket and may only register once that ticket has been admitted. Tickets
+are HMAC-signed strings carrying the event, the room instance, a
+serial number and the ticket's admission time, so any worker can check
+one without looking it up. Tickets are admitted in order at a fixed rate
+per event, which turns a registration spike into a steady stream the
+database can absorb.
+
+Room settings are shared by every worker through the ``waiting_rooms``
+table and reach the others over the invalidation bus when a room is
+opened, retuned or closed. Tickets are issued from memory: each of the
+``SERVER_WORKERS`` workers admits its own tickets at its share of the
+room's rate, so taking a ticket never touches the database. A used
+ticket is recorded in ``queue_ticket_claims`` by the registration's own
+transaction. The signing key is derived from ``SECRET_KEY``, which all
+workers share.
+"""
+
+import hashlib
+import hmac
+import math
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.hot_events import REGISTRATIONS, hot_events
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.database import lane_session
+from app.db.lanes import read_lane, write_lane
+from app.models.waiting_room import WaitingRoom
+from app.repositories.waiting_room import WaitingRoomRepository
+from app.services.exceptions import (
+    InvalidQueueTicketError,
+    QueueTicketNotAdmittedError,
+    QueueTicketRequiredError,
+    WaitingRoomNotEnabledError,
+)
+from app.services.invalidation import WAITING_ROOMS_CACHE, invalidation_bus
+
+logger = get_logger(__name__)
+
+QUEUE_TICKET_HEADER = "X-Queue-Ticket"
+TICKET_SIGNATURE_BYTES = 16
+
+
+@dataclass
+class TicketStatus:
+    """Position of a queue ticket in its waiting room."""
+    ticket: str
+    event_id: int
+    position: int
+    admitted: bool
+    estimated_wait_seconds: float
+    expires_in_seconds: Optional[float]
+
+
+@dataclass
+class TicketClaim:
+    """An admitted ticket, to be used up by the registration it admits."""
+    claim: str
+    expires_at: float
+
+
+@dataclass
+class OpenRoom:
+    """
+    An open waiting room and this worker's share of its queue.
+
+    Tickets are admitted by the generic cell rate algorithm: each ticket
+    is due one admission interval after the previous one or now,
+    whichever is later, and tickets may be admitted up to ``burst /
+    admit_rate`` seconds ahead of their due time. An idle room therefore
+    admits new arrivals immediately while a crowd is let through at a
+    steady pace. Each of the ``workers`` workers runs the algorithm at
+    ``admit_rate / workers`` over the tickets it issued, so together they
+    admit ``admit_rate`` tickets per second; every worker may admit at
+    least one ticket at once. An admitted ticket must be used within
+    ``WAITING_ROOM_ADMISSION_TTL`` seconds and only once.
+    """
+    event_id: int
+    room_id: str
+    admit_rate: float
+    burst: int
+    auto_opened: bool
+    workers: int
+    issued: int = 0
+    next_admit_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_row(cls, row: WaitingRoom, workers: int) -> "OpenRoom":
+        """Build from a ``WaitingRoom`` with an empty queue."""
+        return cls(
+            event_id=row.event_id,
+            room_id=row.room_id,
+            admit_rate=row.admit_rate,
+            burst=row.burst,
+            auto_opened=row.auto_opened,
+            workers=workers,
+        )
+
+    @property
+    def interval(self) -> float:
+        """Seconds between this worker's admissions."""
+        return self.workers / self.admit_rate
+
+    @property
+    def window(self) -> float:
+        """Seconds a ticket can be admitted ahead of its due time."""
+        return max(self.burst, self.workers) / self.admit_rate
+
+    def issue(self, now: float) -> Tuple[int, float]:
+        """
+        Queue the next ticket.
+
+        Args:
+            now: Current time (Unix seconds)
+
+        Returns:
+            Tuple[int, float]: The ticket's serial number on this worker
+            and its admission time (Unix seconds)
+        """
+        self.next_admit_at = max(self.next_admit_at, now) + self.interval
+        self.issued += 1
+        return self.issued, self.admit_at()
+
+    def admit_at(self) -> float:
+        """Admission time of the last ticket issued (Unix seconds)."""
+        return self.next_admit_at - self.window
+
+    @property
+    def waiting(self) -> int:
+        """Tickets issued but not yet admitted."""
+        backlog = (self.admit_at() - time.time()) / self.interval
+        return min(self.issued, max(0, math.ceil(round(backlog, 6))))
+
+    @property
+    def admitted(self) -> int:
+        """Tickets admitted so far."""
+        return self.issued - self.waiting
+
+
+class WaitingRoomRegistry:
+    """
+    Open waiting rooms by event, plus ticket signing and checking.
+
+    Every worker keeps the open rooms in memory, so registrations for
+    events without one pass through without touching the database; it
+    loads them at startup and reloads a room when the invalidation bus
+    reports a change. A retuned room keeps its queue. Ticket serial
+    numbers are prefixed with a random tag of this worker, so tickets
+    issued by different workers never clash.
+
+    With ``WAITING_ROOM_AUTO_OPEN_RATE`` set, an event whose registrations
+    reach that rate on a worker gets a room opened automatically. The
+    room closes again once the rate has dropped below half of it and
+    nobody is queued on this worker; rooms opened by an operator are
+    left alone.
+    """
+
+    def __init__(self, secret: str, workers: int):
+        self._key = hashlib.sha256(f"waiting-room:{secret}".encode()).digest()
+        self.workers = workers
+        self.origin = secrets.token_hex(4)
+        self._rooms: Dict[int, OpenRoom] = {}
+
+        metrics.register_gauge("waiting_room.rooms", lambda: len(self._rooms))
+        metrics.register_gauge("waiting_room.waiting", lambda: sum(room.waiting for room in self._rooms.values()))
+
+    def get(self, event_id: int) -> Optional[OpenRoom]:
+        """Get an event's open waiting room, as last seen by this worker."""
+        return self._rooms.get(event_id)
+
+    def is_active(self, event_id: int) -> bool:
+        """Check whether registrations for an event go through a waiting room."""
+        return event_id in self._rooms
+
+    def _remember(self, event_id: int, row: Optional[WaitingRoom]) -> Optional[OpenRoom]:
+        if row is None:
+            self._rooms.pop(event_id, None)
+            return None
+        room = self._rooms.get(event_id)
+        if room is None or room.room_id != row.room_id:
+            room = self._rooms[event_id] = OpenRoom.from_row(row, self.workers)
+        else:
+            room.admit_rate = row.admit_rate
+            room.burst = row.burst
+            room.auto_opened = row.auto_opened
+        return room
+
+    async def load(self) -> None:
+        """Open the rooms of ``WAITING_ROOM_EVENT_IDS`` and read every open room."""
+        for event_id in settings.WAITING_ROOM_EVENT_IDS:
+            await self._open(event_id, retune=False)
+        async with lane_session(read_lane) as db:
+            rows = await WaitingRoomRepository(db).get_by_events()
+        self._rooms = {row.event_id: OpenRoom.from_row(row, self.workers) for row in rows}
+
+    async def reload(self, event_ids: List[int]) -> None:
+        """
+        Re-read the rooms of events another worker opened, retuned or closed.
+
+        Args:
+            event_ids: Event IDs
+        """
+        async with lane_session(read_lane) as db:
+            rows = await WaitingRoomRepository(db).get_by_events(event_ids)
+        found = {row.event_id: row for row in rows}
+        for event_id in event_ids:
+            self._remember(event_id, found.get(event_id))
+
+    async def refresh(self, event_id: int) -> Optional[OpenRoom]:
+        """
+        Read an event's waiting room settings from the database.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            Optional[OpenRoom]: The room with up-to-date settings, or None
+        """
+        async with lane_session(read_lane) as db:
+            row = await WaitingRoomRepository(db).get_by_event(event_id)
+        return self._remember(event_id, row)
+
+    async def _open(
+        self,
+        event_id: int,
+        admit_rate: Optional[float] = None,
+        burst: Optional[int] = None,
+        retune: bool = True,
+        auto_opened: bool = False
+    ) -> Tuple[OpenRoom, bool]:
+        admit_rate = settings.WAITING_ROOM_ADMIT_RATE if admit_rate is None else admit_rate
+        burst = settings.WAITING_ROOM_ADMIT_BURST if burst is None else burst
+
+        async with lane_session(write_lane) as db:
+            room = await WaitingRoomRepository(db).get_by_event(event_id)
+            opened = room is None
+            if opened:
+                room = WaitingRoom(
+                    event_id=event_id,
+                    room_id=secrets.token_hex(4),
+                    admit_rate=admit_rate,
+                    burst=burst,
+                    auto_opened=auto_opened,
+                )
+                db.add(room)
+            elif retune:
+                room.admit_rate = admit_rate
+                room.burst = burst
+                room.auto_opened = False
+            if opened or retune:
+                invalidation_bus.record(db, WAITING_ROOMS_CACHE, [event_id])
+                await db.commit()
+        if opened:
+            logger.info(f"Waiting room opened for event {event_id} at {admit_rate}/s")
+        return self._remember(event_id, room), opened
+
+    async def enable(
+        self,
+        event_id: int,
+        admit_rate: Optional[float] = None,
+        burst: Optional[int] = None
+    ) -> OpenRoom:
+        """
+        Open a waiting room for an event, or retune an open one.
+
+        Retuning keeps the queue and outstanding tickets intact, and hands
+        an automatically opened room over to the operator.
+
+        Args:
+            event_id: Event ID
+            admit_rate: Tickets admitted per second
+            burst: Tickets that can be admitted at once after an idle period
+
+        Returns:
+            OpenRoom: The event's waiting room
+        """
+        room, _ = await self._open(event_id, admit_rate, burst)
+        return room
+
+    async def _close(self, event_id: int, auto_opened_only: bool = False) -> bool:
+        async with lane_session(write_lane) as db:
+            repository = WaitingRoomRepository(db)
+            closed = await repository.close(event_id, auto_opened_only)
+            if closed:
+                invalidation_bus.record(db, WAITING_ROOMS_CACHE, [event_id])
+                await db.commit()
+                row = None
+            else:
+                row = await repository.get_by_event(event_id)
+        waiting = self._rooms[event_id].waiting if event_id in self._rooms else 0
+        self._remember(event_id, row)
+        if closed:
+            logger.info(f"Waiting room closed for event {event_id} with {waiting} waiting")
+        return closed
+
+    async def disable(self, event_id: int) -> bool:
+        """
+        Close an event's waiting room; registrations no longer need a ticket.
+
+        Returns:
+            bool: True if a room was open
+        """
+        return await self._close(event_id)
+
+    async def _follow_traffic(self, event_id: int) -> None:
+        """Open or close an event's room automatically as its registrations rise and fall."""
+        threshold = settings.WAITING_ROOM_AUTO_OPEN_RATE
+        if threshold <= 0:
+            return
+        room = self._rooms.get(event_id)
+        if room is not None and not room.auto_opened:
+            return
+        rate = hot_events.rate(REGISTRATIONS, event_id)
+        if room is None and rate >= threshold:
+            _, opened = await self._open(event_id, retune=False, auto_opened=True)
+            if opened:
+                metrics.increment("waiting_room.auto_opened")
+        elif room is not None and rate < threshold / 2 and room.waiting == 0:
+            # Tickets still queued on other workers stop mattering once
+            # the room is gone: their holders can register directly
+            if await self._close(event_id, auto_opened_only=True):
+                metrics.increment("waiting_room.auto_closed")
+
+    def _sign(self, payload: str) -> str:
+        return hmac.new(self._key, payload.encode(), hashlib.sha256).hexdigest()[:TICKET_SIGNATURE_BYTES * 2]
+
+    def _check_ticket(self, event_id: int, ticket: Optional[str]) -> Tuple[OpenRoom, str, float]:
+        room = self._rooms.get(event_id)
+        if room is None:
+            raise WaitingRoomNotEnabledError(f"Event {event_id} has no active waiting room")
+        if not ticket:
+            raise QueueTicketRequiredError(
+                f"Registration for event {event_id} is queued; join the waiting room for a ticket"
+            )
+
+        payload, _, signature = ticket.rpartition(".")
+        if not hmac.compare_digest(self._sign(payload), signature):
+            metrics.increment("waiting_room.rejected.invalid")
+            raise InvalidQueueTicketError("Queue ticket is not valid")
+        try:
+            ticket_event, room_id, serial, admit_at_ms = payload.split(".")
+            ticket_event_id, admit_at = int(ticket_event), int(admit_at_ms) / 1000
+        except ValueError:
+            raise InvalidQueueTicketError("Queue ticket is not valid")
+        if ticket_event_id != event_id or room_id != room.room_id:
+            metrics.increment("waiting_room.rejected.stale")
+            raise InvalidQueueTicketError("Queue ticket is not valid for this waiting room; join again")
+        return room, serial, admit_at
+
+    def _status(self, room: OpenRoom, ticket: str, admit_at: float) -> TicketStatus:
+        """Position of a ticket due at ``admit_at``; raises once its admission has expired."""
+        wait = admit_at - time.time()
+        if wait > 0:
+            position = max(1, math.ceil(round(wait * room.admit_rate, 6)))
+            expires_in = None
+        else:
+            position = 0
+            expires_in = wait + settings.WAITING_ROOM_ADMISSION_TTL
+            if expires_in <= 0:
+                raise InvalidQueueTicketError("Queue ticket admission has expired; join the waiting room again")
+        return TicketStatus(
+            ticket=ticket,
+            event_id=room.event_id,
+            position=position,
+            admitted=position == 0,
+            estimated_wait_seconds=round(max(0.0, wait), 3),
+            expires_in_seconds=round(expires_in, 3) if expires_in is not None else None,
+        )
+
+    def join(self, event_id: int) -> TicketStatus:
+        """
+        Take a queue ticket for an event from this worker's share of its room.
+
+        Args:
+            event_id: Event ID
+
+        Returns:
+            TicketStatus: New ticket and its position
+
+        Raises:
+            WaitingRoomNotEnabledError: If the event has no active waiting room
+        """
+        room = self._rooms.get(event_id)
+        if room is None:
+            raise WaitingRoomNotEnabledError(f"Event {event_id} has no active waiting room")
+
+        serial, admit_at = room.issue(time.time())
+        payload = f"{event_id}.{room.room_id}.{self.origin}-{serial}.{round(admit_at * 1000)}"
+        ticket = f"{payload}.{self._sign(payload)}"
+        metrics.increment("waiting_room.tickets_issued")
+        return self._status(room, ticket, admit_at)
+
+    def status(self, event_id: int, ticket: str) -> TicketStatus:
+        """
+        Get a ticket's current position.
+
+        Only the ticket itself is checked, so a used ticket is reported
+        as admitted until its admission expires.
+
+        Raises:
+            WaitingRoomNotEnabledError: If the event has no active waiting room
+            InvalidQueueTicketError: If the ticket is not valid or expired
+        """
+        room, _, admit_at = self._check_ticket(event_id, ticket)
+        return self._status(room, ticket, admit_at)
+
+    async def admit(self, event_id: int, ticket: Optional[str]) -> Optional[TicketClaim]:
+        """
+        Check that a registration may go ahead under the event's waiting room.
+
+        Events without an active room pass straight through. Otherwise the
+        ticket must be valid and admitted; whether it was used before is
+        only known once ``claim`` records it.
+
+        Args:
+            event_id: Event ID
+            ticket: Queue ticket sent by the client
+
+        Returns:
+            Optional[TicketClaim]: Ticket to use up with ``claim``, or None
+            if the event has no active room
+
+        Raises:
+            QueueTicketRequiredError: If the room is active and no ticket was sent
+            QueueTicketNotAdmittedError: If the ticket is still waiting
+            InvalidQueueTicketError: If the ticket is not valid or expired
+        """
+        await self._follow_traffic(event_id)
+        if event_id not in self._rooms:
+            return None
+
+        room, serial, admit_at = self._check_ticket(event_id, ticket)
+        ticket_status = self._status(room, ticket, admit_at)
+        if not ticket_status.admitted:
+            metrics.increment("waiting_room.rejected.not_admitted")
+            raise QueueTicketNotAdmittedError(
+                f"Queue ticket is not admitted yet; {ticket_status.position} ahead in the waiting room",
+                position=ticket_status.position,
+                retry_after=ticket_status.estimated_wait_seconds,
+            )
+        return TicketClaim(
+            claim=f"{room.room_id}.{serial}",
+            expires_at=admit_at + settings.WAITING_ROOM_ADMISSION_TTL,
+        )
+
+    async def claim(self, db: AsyncSession, event_id: int, ticket: Optional[TicketClaim]) -> None:
+        """
+        Use up an admitted ticket in the registration's transaction.
+
+        Call before the registration's writes: the claim commits with
+        them, so a ticket is used up by a registration or waitlisting
+        and stays usable until its admission expires if the transaction
+        rolls back.
+
+        Args:
+            db: Session of the registration, on the write lane
+            event_id: Event ID
+            ticket: What ``admit`` returned
+
+        Raises:
+            InvalidQueueTicketError: If the ticket has already been used
+        """
+        if ticket is None:
+            return
+        repository = WaitingRoomRepository(db)
+        if not await repository.claim(event_id, ticket.claim, ticket.expires_at, time.time()):
+            metrics.increment("waiting_room.rejected.used")
+            raise InvalidQueueTicketError("Queue ticket has already been used")
+        metrics.increment("waiting_room.registrations")
+
+
+async def reload_waiting_rooms(keys: List[str]) -> None:
+    """Re-read waiting rooms another worker opened, retuned or closed."""
+    await waiting_rooms.reload([int(key) for key in keys])
+
+
+# Global waiting room registry
+waiting_rooms = WaitingRoomRegistry(settings.SECRET_KEY, settings.SERVER_WORKERS or 1)
@@ -0,0 +1,181 @@
+"""
+Waitlist service for queueing and promoting registrants of full events.
+"""
+
+from typing import Dict, List, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.models.attendee import Attendee
+from app.models.waitlist import WaitlistEntry
+from app.repositories.attendee import AttendeeRepository
+from app.repositories.event import EventRepository
+from app.repositories.waitlist import WaitlistRepository
+from app.schemas.attendee import AttendeeBase
+from app.schemas.waitlist import WaitlistEntryCreate
+from app.services.catalog import event_catalog
+from app.services.invalidation import EVENTS_CACHE, MEMBERSHIP_CACHE, invalidation_bus, membership_key
+from app.services.membership import membership_filters, normalize_email
+from app.services.persons import person_directory
+from app.services.exceptions import (
+    AttendeeAlreadyWaitlistedError,
+    WaitlistEntryNotFoundError
+)
+
+logger = get_logger(__name__)
+
+
+class WaitlistService:
+    """
+    Service class for event waitlists.
+
+    A full event queues registrants in arrival order. Whenever seats are
+    given back (a cancellation, a released or expired seat hold), the
+    caller passes them to ``release_seats`` inside its own transaction, so
+    the seat goes to the head of the queue atomically with whatever freed
+    it and is never visible as free while someone is waiting.
+    """
+
+    def __init__(self, db: AsyncSession):
+        """
+        Initialize waitlist service.
+
+        Args:
+            db: Database session
+        """
+        self.db = db
+        self.waitlist_repo = WaitlistRepository(db)
+        self.attendee_repo = AttendeeRepository(db)
+        self.event_repo = EventRepository(db)
+
+    async def join(self, event_id: int, attendee_data: AttendeeBase) -> Tuple[WaitlistEntry, int]:
+        """
+        Queue a registrant on an event's waitlist without committing.
+
+        Args:
+            event_id: Event ID
+            attendee_data: Registrant data
+
+        Returns:
+            Tuple[WaitlistEntry, int]: Entry and its queue position
+
+        Raises:
+            AttendeeAlreadyWaitlistedError: If the registrant is already queued
+        """
+        try:
+            entry = await self.waitlist_repo.create(
+                WaitlistEntryCreate(event_id=event_id, **attendee_data.model_dump(include={"name", "email"})),
+                commit=False
+            )
+        except IntegrityError as e:
+            if "UNIQUE" not in str(e.orig):
+                raise
+            await self.db.rollback()
+            raise AttendeeAlreadyWaitlistedError(
+                f"Attendee with email '{attendee_data.email}' is already on the waitlist for this event"
+            )
+        await self.db.refresh(entry)
+        position = await self.waitlist_repo.get_position(event_id, entry.id)
+        metrics.increment("waitlist.joined")
+        return entry, position
+
+    async def get_entry(self, event_id: int, entry_id: int) -> Tuple[WaitlistEntry, int]:
+        """
+        Get a waitlist entry and its current queue position.
+
+        Args:
+            event_id: Event ID
+            entry_id: Waitlist entry ID
+
+        Returns:
+            Tuple[WaitlistEntry, int]: Entry and its queue position
+
+        Raises:
+            WaitlistEntryNotFoundError: If the entry does not exist (it may
+                have been promoted)
+        """
+        entry = await self.waitlist_repo.get_by_event(event_id, entry_id)
+        if not entry:
+            raise WaitlistEntryNotFoundError(f"Waitlist entry with ID {entry_id} not found")
+        return entry, await self.waitlist_repo.get_position(event_id, entry_id)
+
+    async def leave(self, event_id: int, entry_id: int) -> None:
+        """
+        Remove a registrant from an event's waitlist.
+
+        Args:
+            event_id: Event ID
+            entry_id: Waitlist entry ID
+
+        Raises:
+            WaitlistEntryNotFoundError: If the entry does not exist
+        """
+        entry = await self.waitlist_repo.get_by_event(event_id, entry_id)
+        if not entry:
+            raise WaitlistEntryNotFoundError(f"Waitlist entry with ID {entry_id} not found")
+        await self.waitlist_repo.delete_ids(event_id, [entry_id])
+        await self.db.commit()
+        logger.info(f"Waitlist entry {entry_id} left event {event_id}")
+
+    async def release_seats(self, event_id: int, seats: int) -> List[str]:
+        """
+        Hand freed seats to the head of the waitlist without committing.
+
+        Up to ``seats`` entries are promoted to attendees; entries whose
+        email got registered some other way meanwhile are dropped. Seats
+        nobody was waiting for are returned to the event's capacity.
+
+        Args:
+            event_id: Event ID
+            seats: Number of seats freed
+
+        Returns:
+            List[str]: Emails of the promoted attendees
+        """
+        promoted: List[str] = []
+        while len(promoted) < seats:
+            head = await self.waitlist_repo.get_head(event_id, seats - len(promoted))
+            if not head:
+                break
+            people: Dict[str, str] = {}
+            for entry in head:
+                people.setdefault(normalize_email(entry.email), entry.name)
+            registered = await self.attendee_repo.get_registered_emails(event_id, people)
+            await self.waitlist_repo.delete_ids(event_id, [entry.id for entry in head])
+            people = {email: name for email, name in people.items() if email not in registered}
+            person_ids = await person_directory.resolve(self.db, event_id, people)
+            for entry in head:
+                email = normalize_email(entry.email)
+                if email not in people or email in promoted:
+                    continue
+                self.db.add(Attendee(person_id=person_ids[email], event_id=event_id))
+                promoted.append(email)
+
+        if promoted:
+            await self.db.flush()
+        if seats > len(promoted):
+            await self.event_repo.decrement_attendee_count(event_id, seats - len(promoted))
+            invalidation_bus.record(self.db, EVENTS_CACHE, [event_id])
+        invalidation_bus.record(
+            self.db, MEMBERSHIP_CACHE, [membership_key(event_id, email) for email in promoted]
+        )
+        return promoted
+
+    @staticmethod
+    def seats_released(event_id: int, seats: int, promoted: List[str]) -> None:
+        """
+        Update in-process caches once a ``release_seats`` transaction commits.
+
+        Args:
+            event_id: Event ID
+            seats: Number of seats freed
+            promoted: Emails returned by ``release_seats``
+        """
+        event_catalog.adjust_attendees(event_id, len(promoted) - seats)
+        for email in promoted:
+            membership_filters.add(event_id, email)
+        if promoted:
+            metrics.increment("waitlist.promoted", len(promoted))
+            logger.info(f"Promoted {len(promoted)} waitlisted attendees for event {event_id}")
@@ -0,0 +1,220 @@
+"""
+Startup warm-up and readiness state.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.database import lane_session, shard_engines
+from app.db.lanes import read_lane
+from app.models.event import Event
+from app.repositories.attendee import AttendeeRepository
+from app.services.catalog import event_catalog
+from app.services.membership import membership_filters
+from app.services.single_flight import single_flight
+
+logger = get_logger(__name__)
+
+# Warm-up status values
+PENDING = "pending"
+WARMING = "warming"
+READY = "ready"
+
+
+class WarmupState:
+    """
+    Warms the worker after boot and tracks whether it is ready for traffic.
+
+    The first requests after a restart would otherwise pay for opening
+    pool connections, compiling SQL, building Pydantic serializers and
+    filling caches. ``run`` does that work up front:
+
+    * opens every pooled connection
+    * builds the membership filters of the busiest upcoming events
+    * sends a few read requests through the whole application in-process,
+      which compiles and caches their statements and builds the response
+      serializers of the hottest routes
+
+    A failing step is logged and skipped: a cold worker is slower, not
+    broken. The worker reports ready once every step has run.
+
+    Database health is probed with ``SELECT 1`` outside the concurrency
+    lanes, so a busy worker is not reported as broken, and the result is
+    reused for ``HEALTH_DB_CACHE_SECONDS``: frequent probes from several
+    load balancers cost at most one query per period.
+    """
+
+    def __init__(self, engines: Optional[Dict[str, AsyncEngine]] = None):
+        self.engines = engines or shard_engines
+        self.status = PENDING
+        self.steps: Dict[str, float] = {}
+        self.failures: Dict[str, str] = {}
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._database: Optional[Tuple[float, str]] = None
+
+        metrics.register_gauge("warmup.ready", lambda: int(self.is_ready))
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether warm-up has finished."""
+        return self._ready.is_set()
+
+    async def _prime_pool(self, app: Any) -> None:
+        async def touch(engine: AsyncEngine) -> None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        for engine in self.engines.values():
+            size = getattr(engine.pool, "size", None)
+            if size is None:
+                # NullPool (SQLite) keeps no connections to prime
+                continue
+            await asyncio.gather(*(touch(engine) for _ in range(size())))
+
+    async def _hot_events(self) -> List[Tuple[int, int]]:
+        async with lane_session(read_lane) as db:
+            rows = (await db.execute(
+                select(Event.id, Event.max_capacity, Event.current_attendees)
+                .where(Event.start_time > datetime.utcnow())
+                .order_by(Event.current_attendees.desc())
+                .limit(settings.WARMUP_MEMBERSHIP_EVENTS)
+            )).all()
+        # Sharded, each shard returns its own busiest events
+        rows = sorted(rows, key=lambda row: row.current_attendees, reverse=True)
+        return [(row.id, row.max_capacity) for row in rows[:settings.WARMUP_MEMBERSHIP_EVENTS]]
+
+    async def _fill_caches(self, app: Any) -> None:
+        if not settings.WARMUP_MEMBERSHIP_EVENTS:
+            return
+
+        async def load_roster(event_id: int) -> List[str]:
+            async with lane_session(read_lane) as db:
+                return await AttendeeRepository(db).get_emails_by_event(event_id)
+
+        for event_id, capacity in await self._hot_events():
+            await membership_filters.warm(event_id, capacity, load_roster)
+
+    async def _warm_routes(self, app: Any) -> None:
+        prefix = f"{settings.API_PREFIX}/{settings.API_VERSION}"
+        paths = [f"{prefix}/events/"]
+        records = event_catalog.get_upcoming_events()
+        if records:
+            paths += [f"{prefix}/events/batch?ids={records[0].id}", f"{prefix}/events/{records[0].id}/attendees/"]
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+            for path in paths:
+                response = await client.get(path)
+                if response.status_code >= 500:
+                    raise RuntimeError(f"GET {path} answered {response.status_code}")
+
+    async def run(self, app: Any) -> None:
+        """
+        Run every warm-up step, then mark the worker ready.
+
+        Args:
+            app: ASGI application to send warm-up requests through
+        """
+        self.status = WARMING
+        started = time.perf_counter()
+        steps = (
+            ("pool", self._prime_pool),
+            ("caches", self._fill_caches),
+            ("routes", self._warm_routes),
+        )
+        for name, step in steps:
+            step_started = time.perf_counter()
+            try:
+                await step(app)
+            except Exception as e:
+                metrics.increment("warmup.failures")
+                self.failures[name] = str(e)
+                logger.warning(f"Warm-up step {name} failed: {e}")
+            self.steps[name] = round((time.perf_counter() - step_started) * 1000, 1)
+
+        self.mark_ready()
+        elapsed = (time.perf_counter() - started) * 1000
+        metrics.observe("warmup.ms", elapsed)
+        logger.info(f"Warm-up finished in {elapsed:.0f} ms ({self.steps})")
+
+    def mark_ready(self) -> None:
+        """Report ready without (further) warming up."""
+        self.status = READY
+        self._ready.set()
+
+    def start(self, app: Any) -> None:
+        """Warm up in the background on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run(app))
+
+    async def stop(self) -> None:
+        """Cancel an unfinished warm-up."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until warm-up has finished.
+
+        Args:
+            timeout: Seconds to wait at most, or None to wait indefinitely
+
+        Returns:
+            bool: Whether the worker is ready
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.is_ready
+
+    async def _check_database(self) -> str:
+        async def ping(engine: AsyncEngine) -> None:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        try:
+            # Every shard has to answer
+            await asyncio.wait_for(
+                asyncio.gather(*(ping(engine) for engine in self.engines.values())),
+                settings.HEALTH_DB_TIMEOUT
+            )
+            status = "ok"
+        except Exception as e:
+            metrics.increment("health.database_errors")
+            logger.warning(f"Database health check failed: {e}")
+            status = "unavailable"
+        self._database = (time.monotonic(), status)
+        return status
+
+    async def database_status(self) -> str:
+        """
+        Get the database status, reusing a recent check.
+
+        Returns:
+            str: ``ok`` or ``unavailable``
+        """
+        if self._database is not None:
+            checked, status = self._database
+            if time.monotonic() - checked < settings.HEALTH_DB_CACHE_SECONDS:
+                return status
+        return await single_flight.do(("health.database",), self._check_database)
+
+
+# Global warm-up state
+warmup = WarmupState()
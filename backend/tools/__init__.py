@@ -0,0 +1,7 @@
+"""
+Developer tools for benchmarking and verifying the backend.
+
+Modules in this package are run from the ``backend`` directory, e.g.
+``python -m tools.bench``. They configure the environment before the
+``app`` package is imported, so import ``tools.common`` first.
+"""
@@ -0,0 +1,346 @@
+"""
+Service-layer benchmark suite at multiple data scales.
+
+Seeds a SQLite database per scale, times the service methods and the
+repository primitives they are built on, and writes p50/p95/p99 latency
+and allocation figures as JSON. With ``--compare`` the results are
+checked against a stored baseline and regressions fail the run.
+
+Usage (from ``backend``)::
+
+    python -m tools.bench --scales 1k,100k --output bench.json
+    python -m tools.bench --scales 1k,100k --compare bench.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from tools.common import database_url, parse_scale, seed_database, summarize
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.logging import configure_logging
+from app.repositories.attendee import AttendeeRepository
+from app.repositories.event import EventRepository
+from app.schemas.attendee import AttendeeBase
+from app.schemas.base import PaginationParams
+from app.services.attendee import AttendeeService
+from app.services.event import EventService
+from app.services.persons import person_directory
+
+BENCH_EMAIL_PREFIX = "bench-"
+
+Case = Callable[[AsyncSession], Awaitable[Any]]
+
+
+def build_cases(seeded: Dict[str, int], page_size: int) -> Dict[str, Case]:
+    """
+    Build the benchmark cases for a seeded database.
+
+    Args:
+        seeded: Seeding summary returned by ``seed_database``
+        page_size: Attendee page size
+
+    Returns:
+        Dict[str, Case]: Case name to coroutine function taking a session
+    """
+    hot_event_id = seeded["hot_event_id"]
+    cold_event_id = seeded["events"]
+    shallow = PaginationParams(page=1, size=page_size)
+    deep = PaginationParams(
+        page=max(1, seeded["hot_event_attendees"] // page_size),
+        size=page_size,
+    )
+    counter = itertools.count()
+
+    async def register(db: AsyncSession) -> Any:
+        n = next(counter)
+        return await AttendeeService(db).register_attendee(
+            cold_event_id,
+            AttendeeBase(name=f"Bench {n}", email=f"{BENCH_EMAIL_PREFIX}{os.getpid()}-{n}@example.com"),
+        )
+
+    return {
+        "service.get_upcoming_events": lambda db: EventService(db).get_upcoming_events(),
+        "service.get_event_attendees.shallow": lambda db: AttendeeService(db).get_event_attendees(hot_event_id, shallow),
+        "service.get_event_attendees.deep": lambda db: AttendeeService(db).get_event_attendees(hot_event_id, deep),
+        "service.register_attendee": register,
+        "repo.event.get": lambda db: EventRepository(db).get(hot_event_id),
+        "repo.event.get_by_name": lambda db: EventRepository(db).get_by_name(f"Benchmark Event {cold_event_id}"),
+        "repo.event.exists": lambda db: EventRepository(db).exists(hot_event_id),
+        "repo.attendee.get_by_person_and_event": lambda db: AttendeeRepository(db).get_by_person_and_event(
+            1, hot_event_id
+        ),
+        "service.person_lookup": lambda db: person_directory.lookup(db, hot_event_id, ["attendee1@example.com"]),
+        "repo.attendee.count_by_event": lambda db: AttendeeRepository(db).count({"event_id": hot_event_id}),
+        "repo.attendee.get_attendees_by_event_with_count": lambda db: AttendeeRepository(
+            db
+        ).get_attendees_by_event_with_count(hot_event_id, shallow),
+    }
+
+
+async def run_case(
+    sessionmaker: async_sessionmaker,
+    case: Case,
+    iterations: int,
+    warmup: int,
+    alloc_iterations: int
+) -> Dict[str, float]:
+    """
+    Time a case and measure its allocations.
+
+    Each call gets a fresh session, as a request would. Allocations are
+    measured in a separate pass under ``tracemalloc`` so tracing does not
+    distort the latency figures.
+
+    Args:
+        sessionmaker: Session factory bound to the seeded database
+        case: Case to run
+        iterations: Timed calls
+        warmup: Untimed calls before timing
+        alloc_iterations: Calls traced for allocations
+
+    Returns:
+        Dict[str, float]: Latency summary plus allocation figures
+    """
+    async def call() -> None:
+        async with sessionmaker() as db:
+            await case(db)
+
+    for _ in range(warmup):
+        await call()
+
+    timings: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    peak_bytes: List[int] = []
+    blocks: List[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_iterations):
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await call()
+            _, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            peak_bytes.append(peak - baseline)
+            blocks.append(sum(
+                stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0
+            ))
+    finally:
+        tracemalloc.stop()
+
+    result = summarize(timings)
+    if alloc_iterations:
+        result["alloc_peak_bytes_per_call"] = sum(peak_bytes) // alloc_iterations
+        result["alloc_blocks_per_call"] = sum(blocks) // alloc_iterations
+    return result
+
+
+async def bench_scale(
+    path: str,
+    seeded: Dict[str, int],
+    args: argparse.Namespace
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run every selected case against one seeded database.
+
+    Args:
+        path: Database file path
+        seeded: Seeding summary
+        args: Parsed command line arguments
+
+    Returns:
+        Dict[str, Dict[str, float]]: Results keyed by case name
+    """
+    reserve_capacity(path, seeded["events"], args.warmup + args.iterations + args.alloc_iterations)
+    engine = create_async_engine(database_url(path))
+    sessionmaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    results: Dict[str, Dict[str, float]] = {}
+
+    try:
+        for name, case in build_cases(seeded, args.page_size).items():
+            if args.cases and not any(pattern in name for pattern in args.cases):
+                continue
+            results[name] = await run_case(sessionmaker, case, args.iterations, args.warmup, args.alloc_iterations)
+            print(
+                f"  {name:<52} p50={results[name]['p50_ms']:>9.3f}ms "
+                f"p95={results[name]['p95_ms']:>9.3f}ms p99={results[name]['p99_ms']:>9.3f}ms",
+                file=sys.stderr,
+            )
+    finally:
+        await engine.dispose()
+        cleanup_registrations(path, seeded["events"])
+
+    return results
+
+
+def reserve_capacity(path: str, event_id: int, registrations: int) -> None:
+    """Make room for the benchmark registrations on an event."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "UPDATE events SET max_capacity = current_attendees + ? WHERE id = ?",
+        (registrations, event_id),
+    )
+    conn.commit()
+    conn.close()
+
+
+def cleanup_registrations(path: str, event_id: int) -> None:
+    """Remove benchmark registrations so a cached database can be reused."""
+    conn = sqlite3.connect(path)
+    removed = conn.execute(
+        "DELETE FROM attendees WHERE event_id = ? AND person_id IN "
+        "(SELECT id FROM persons WHERE email LIKE ?)",
+        (event_id, f"{BENCH_EMAIL_PREFIX}%"),
+    ).rowcount
+    conn.execute(
+        "UPDATE events SET current_attendees = current_attendees - ? WHERE id = ?",
+        (removed, event_id),
+    )
+    conn.commit()
+    conn.close()
+
+
+def prepare_database(data_dir: str, scale: str, reuse: bool) -> Dict[str, Any]:
+    """
+    Seed (or reuse) the database for a scale.
+
+    Args:
+        data_dir: Directory holding seeded databases
+        scale: Scale name
+        reuse: Reuse an existing seeded database if present
+
+    Returns:
+        Dict[str, Any]: Database path, seeding summary and seed duration
+    """
+    path = os.path.join(data_dir, f"bench-{scale}.db")
+    meta_path = f"{path}.json"
+
+    if reuse and os.path.exists(path) and os.path.exists(meta_path):
+        with open(meta_path) as f:
+            return {"path": path, "seeded": json.load(f), "seed_seconds": 0.0}
+
+    print(f"Seeding {scale} attendees into {path}", file=sys.stderr)
+    started = time.perf_counter()
+    seeded = seed_database(path, parse_scale(scale))
+    seed_seconds = time.perf_counter() - started
+    with open(meta_path, "w") as f:
+        json.dump(seeded, f)
+    return {"path": path, "seeded": seeded, "seed_seconds": round(seed_seconds, 2)}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Compare results against a baseline.
+
+    A case regresses when its p50 or p95 latency grows by more than
+    ``threshold`` (as a fraction) over the baseline.
+
+    Args:
+        results: Current results
+        baseline: Baseline results
+        threshold: Allowed relative slowdown
+
+    Returns:
+        List[str]: Human-readable regression descriptions
+    """
+    regressions = []
+    for scale, scale_results in results["scales"].items():
+        baseline_cases = baseline.get("scales", {}).get(scale, {}).get("cases", {})
+        for name, current in scale_results["cases"].items():
+            previous = baseline_cases.get(name)
+            if previous is None:
+                continue
+            for metric in ("p50_ms", "p95_ms"):
+                if previous[metric] > 0 and current[metric] > previous[metric] * (1 + threshold):
+                    change = (current[metric] / previous[metric] - 1) * 100
+                    regressions.append(
+                        f"{scale} {name} {metric}: {previous[metric]:.3f}ms -> {current[metric]:.3f}ms (+{change:.0f}%)"
+                    )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="1k,100k,10M", help="Comma separated scales (1k, 100k, 10M or a number)")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per case")
+    parser.add_argument("--warmup", type=int, default=20, help="Untimed calls per case")
+    parser.add_argument("--alloc-iterations", type=int, default=20, help="Calls traced for allocations per case")
+    parser.add_argument("--page-size", type=int, default=10, help="Attendee page size")
+    parser.add_argument("--cases", nargs="*", default=[], help="Only run cases containing one of these strings")
+    parser.add_argument("--data-dir", help="Keep seeded databases here and reuse them between runs")
+    parser.add_argument("--output", help="Write results JSON to this file")
+    parser.add_argument("--compare", help="Baseline results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative slowdown (0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    configure_logging()
+
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="bench-")
+    os.makedirs(data_dir, exist_ok=True)
+
+    results: Dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+        },
+        "scales": {},
+    }
+
+    try:
+        for scale in args.scales.split(","):
+            database = prepare_database(data_dir, scale, reuse=bool(args.data_dir))
+            print(f"Benchmarking {scale}", file=sys.stderr)
+            results["scales"][scale] = {
+                "seeded": database["seeded"],
+                "seed_seconds": database["seed_seconds"],
+                "cases": await bench_scale(database["path"], database["seeded"], args),
+            }
+    finally:
+        if not args.data_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against baseline", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,209 @@
+"""
+Shared helpers for the developer tools: environment, seeding and statistics.
+"""
+
+import math
+import os
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, List, Sequence
+
+# Tools never want SQL echo or per-request log lines; set this before any
+# ``app`` module reads the settings.
+os.environ.setdefault("DEBUG", "False")
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+SCALES: Dict[str, int] = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "10M": 10_000_000,
+}
+
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+SEED_BATCH_SIZE = 50_000
+
+
+def parse_scale(value: str) -> int:
+    """
+    Parse a scale name such as ``100k`` or a plain integer.
+
+    Args:
+        value: Scale name or number of attendees
+
+    Returns:
+        int: Number of attendees
+    """
+    if value in SCALES:
+        return SCALES[value]
+    suffixes = {"k": 1_000, "M": 1_000_000}
+    if value[-1:] in suffixes:
+        return int(float(value[:-1]) * suffixes[value[-1]])
+    return int(value)
+
+
+def database_url(path: str) -> str:
+    """Build an async SQLAlchemy URL for a SQLite file."""
+    return f"sqlite+aiosqlite:///{os.path.abspath(path)}"
+
+
+def create_schema(path: str) -> None:
+    """
+    Create the application schema in a SQLite file.
+
+    Args:
+        path: Database file path
+    """
+    from sqlalchemy import create_engine
+
+    from app.models import BaseModel
+
+    engine = create_engine(f"sqlite:///{os.path.abspath(path)}")
+    BaseModel.metadata.create_all(engine)
+    engine.dispose()
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime(SQLITE_DATETIME_FORMAT)
+
+
+def seed_database(
+    path: str,
+    attendees: int,
+    events: int = 0,
+    hot_share: float = 0.5,
+    headroom: float = 0.1,
+    seed: int = 42,
+) -> Dict[str, int]:
+    """
+    Create and fill a SQLite database with events and attendees.
+
+    One "hot" event receives ``hot_share`` of all attendees so deep
+    pagination can be exercised; the rest are spread evenly. Every event
+    gets ``headroom`` spare capacity so registrations can still succeed.
+
+    Args:
+        path: Database file path (overwritten if it exists)
+        attendees: Total number of attendees
+        events: Number of events (defaults to one per thousand attendees)
+        hot_share: Share of attendees registered for the hot event
+        headroom: Spare capacity per event as a fraction of its attendees
+        seed: Random seed for reproducible data
+
+    Returns:
+        Dict[str, int]: Seeded counts and the hot event ID
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    create_schema(path)
+
+    rng = random.Random(seed)
+    events = events or max(10, attendees // 1_000)
+    hot_count = int(attendees * hot_share) if events > 1 else attendees
+    per_event = [hot_count] + [0] * (events - 1)
+    for index in range(attendees - hot_count):
+        per_event[1 + index % (events - 1)] += 1
+
+    now = datetime.utcnow()
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")
+
+    event_rows = []
+    for event_id, count in enumerate(per_event, start=1):
+        start = now + timedelta(days=rng.randint(1, 365), minutes=rng.randint(0, 1440))
+        event_rows.append((
+            event_id,
+            f"Benchmark Event {event_id}",
+            f"Hall {rng.randint(1, 50)}",
+            _timestamp(start),
+            _timestamp(start + timedelta(hours=rng.randint(1, 48))),
+            max(1, count + max(10, int(count * headroom))),
+            count,
+            _timestamp(now),
+            _timestamp(now),
+        ))
+    conn.executemany(
+        "INSERT INTO events (id, name, location, start_time, end_time, max_capacity, "
+        "current_attendees, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        event_rows,
+    )
+
+    registered = _timestamp(now - timedelta(days=1))
+    batch: List[tuple] = []
+    attendee_id = 0
+    for event_id, count in enumerate(per_event, start=1):
+        for _ in range(count):
+            attendee_id += 1
+            batch.append((
+                attendee_id,
+                f"Attendee {attendee_id}",
+                f"attendee{attendee_id}@example.com",
+                event_id,
+                registered,
+                registered,
+                registered,
+            ))
+            if len(batch) >= SEED_BATCH_SIZE:
+                _insert_attendees(conn, batch)
+                batch = []
+    if batch:
+        _insert_attendees(conn, batch)
+
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+    return {"events": events, "attendees": attendees, "hot_event_id": 1, "hot_event_attendees": hot_count}
+
+
+def _insert_attendees(conn: sqlite3.Connection, rows: List[tuple]) -> None:
+    # Every seeded attendee is a different person, sharing the attendee's ID
+    conn.executemany(
+        "INSERT INTO persons (id, name, email, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+        [(row_id, name, email, created, updated) for row_id, name, email, _, _, created, updated in rows],
+    )
+    conn.executemany(
+        "INSERT INTO attendees (id, person_id, event_id, registered_at, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [(row_id, row_id, *rest) for row_id, _, _, *rest in rows],
+    )
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a sequence.
+
+    Args:
+        values: Observed values
+        pct: Percentile between 0 and 100
+
+    Returns:
+        float: Percentile value, or 0.0 for an empty sequence
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), math.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def summarize(values_ms: Sequence[float]) -> Dict[str, float]:
+    """
+    Summarize latencies in milliseconds.
+
+    Args:
+        values_ms: Latencies in milliseconds
+
+    Returns:
+        Dict[str, float]: Count, mean, p50, p95, p99 and max
+    """
+    count = len(values_ms)
+    return {
+        "count": count,
+        "mean_ms": round(sum(values_ms) / count, 4) if count else 0.0,
+        "p50_ms": round(percentile(values_ms, 50), 4),
+        "p95_ms": round(percentile(values_ms, 95), 4),
+        "p99_ms": round(percentile(values_ms, 99), 4),
+        "max_ms": round(max(values_ms), 4) if count else 0.0,
+    }
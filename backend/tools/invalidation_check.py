@@ -0,0 +1,237 @@
+"""
+Multi-process check of cross-worker cache invalidation.
+
+Several worker processes share one SQLite file, each with its own event
+catalog and membership filters loaded up front and the catalog's own
+periodic refresh switched off, so the invalidation bus is the only way
+a worker can learn about the others' writes. Every worker registers
+attendees and creates an event through the services, then waits until
+its caches reflect what all workers committed:
+
+* every upcoming event is in its catalog with the committed attendee count
+* every registration made by another worker is in its membership filter
+
+The run fails (exit code 1) if a worker has not converged within the
+timeout, and reports how long each worker took to converge after the
+last write.
+
+Usage (from ``backend``)::
+
+    python -m tools.invalidation_check --workers 4 --registrations 200
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.common import database_url, seed_database
+
+EXPECTED_EVENTS_SQL = (
+    "SELECT id, current_attendees FROM events WHERE start_time > ? ORDER BY id"
+)
+
+
+def worker(index: int, path: str, args: argparse.Namespace, barrier: Any, results: Any) -> None:
+    """
+    Worker process entry point: write, then wait for the caches to converge.
+
+    Args:
+        index: Worker number, used to keep emails and event names unique
+        path: Shared database file
+        args: Parsed command line arguments
+        barrier: Barrier shared by all workers
+        results: Queue receiving this worker's report
+    """
+    os.environ["DATABASE_URL"] = database_url(path)
+    os.environ["INVALIDATION_ENABLED"] = "True"
+    os.environ["INVALIDATION_POLL_INTERVAL"] = str(args.poll_interval)
+
+    from app.core.logging import configure_logging
+    from app.db.database import engine, lane_session
+    from app.db.lanes import DatabaseBusyError, write_lane
+    from app.schemas.attendee import AttendeeBase
+    from app.schemas.event import EventCreate
+    from app.services.attendee import AttendeeService
+    from app.services.catalog import event_catalog
+    from app.services.event import EventService
+    from app.services.exceptions import EventCapacityExceededError
+    from app.services.invalidation import (
+        EVENTS_CACHE,
+        MEMBERSHIP_CACHE,
+        add_memberships,
+        invalidation_bus,
+        reload_events,
+    )
+    from app.services.membership import membership_filters
+
+    configure_logging()
+
+    async def no_roster(event_id: int) -> List[str]:
+        raise RuntimeError(f"Membership filter for event {event_id} was evicted")
+
+    async def warm_filters(event_ids: List[int]) -> None:
+        for event_id in event_ids:
+            async with lane_session(write_lane) as db:
+                service = AttendeeService(db)
+                event = await service.event_loader.load(event_id)
+                await membership_filters.might_contain(
+                    event_id, event.max_capacity, "warmup@example.com", service.attendee_repo.get_emails_by_event
+                )
+
+    def expected_state() -> Tuple[Dict[int, int], List[Tuple[int, str]]]:
+        conn = sqlite3.connect(path)
+        now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S.%f")
+        events = dict(conn.execute(EXPECTED_EVENTS_SQL, (now,)).fetchall())
+        registrations = conn.execute(
+            "SELECT a.event_id, p.email FROM attendees a JOIN persons p ON p.id = a.person_id "
+            "WHERE p.email LIKE 'invalidation%'"
+        ).fetchall()
+        conn.close()
+        return events, registrations
+
+    async def stale_entries() -> Dict[str, int]:
+        events, registrations = expected_state()
+        records = {record.id: record for record in event_catalog.get_upcoming_events()}
+        stale_events = sum(
+            1 for event_id, count in events.items()
+            if event_id not in records or records[event_id].current_attendees != count
+        )
+        missing_memberships = 0
+        for event_id, email in registrations:
+            if not await membership_filters.might_contain(event_id, 0, email, no_roster):
+                missing_memberships += 1
+        return {"stale_events": stale_events, "missing_memberships": missing_memberships}
+
+    async def run() -> Dict[str, Any]:
+        outcomes: Counter = Counter()
+        await event_catalog.refresh()
+        await warm_filters(list(range(1, args.events + 1)))
+        invalidation_bus.subscribe(EVENTS_CACHE, reload_events)
+        invalidation_bus.subscribe(MEMBERSHIP_CACHE, add_memberships)
+        await invalidation_bus.load()
+        invalidation_bus.start()
+
+        await asyncio.to_thread(barrier.wait, args.timeout + 60)
+        for number in range(args.registrations):
+            event_id = 1 + (index + number) % args.events
+            email = f"invalidation{index}-{number}@example.com"
+            try:
+                async with lane_session(write_lane) as db:
+                    await AttendeeService(db).register_attendee(
+                        event_id, AttendeeBase(name="Invalidation Check", email=email)
+                    )
+                outcomes["registered"] += 1
+            except EventCapacityExceededError:
+                outcomes["full"] += 1
+            except DatabaseBusyError:
+                outcomes["busy"] += 1
+        start_time = datetime.now(timezone.utc) + timedelta(days=30)
+        async with lane_session(write_lane) as db:
+            await EventService(db).create_event(EventCreate(
+                name=f"Invalidation Check {index}",
+                location="Hall 1",
+                start_time=start_time,
+                end_time=start_time + timedelta(hours=2),
+                max_capacity=100,
+            ))
+        outcomes["events_created"] += 1
+
+        # Converge only against writes every worker has finished
+        await asyncio.to_thread(barrier.wait, args.timeout + 60)
+        written = time.perf_counter()
+        stale = await stale_entries()
+        while any(stale.values()) and time.perf_counter() - written < args.timeout:
+            await asyncio.sleep(args.poll_interval / 4)
+            stale = await stale_entries()
+        converged = time.perf_counter() - written
+
+        await invalidation_bus.stop()
+        await engine.dispose()
+        return {
+            "worker": index,
+            "outcomes": dict(outcomes),
+            "converged": not any(stale.values()),
+            "convergence_seconds": round(converged, 3),
+            "stale": stale,
+        }
+
+    results.put(asyncio.run(run()))
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    path = os.path.join(args.data_dir, "invalidation.db")
+    seed_database(path, args.seed_attendees, events=args.events, hot_share=0.0)
+
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(args.workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(index, path, args, barrier, results))
+        for index in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    worker_results = sorted(
+        (results.get(timeout=args.timeout + 120) for _ in processes),
+        key=lambda result: result["worker"]
+    )
+    for process in processes:
+        process.join()
+
+    conn = sqlite3.connect(path)
+    changes = conn.execute("SELECT COUNT(*) FROM cache_invalidations").fetchone()[0]
+    conn.close()
+
+    outcomes: Counter = Counter()
+    for result in worker_results:
+        outcomes.update(result["outcomes"])
+    convergence = [result["convergence_seconds"] for result in worker_results]
+    return {
+        "workers": args.workers,
+        "poll_interval": args.poll_interval,
+        "outcomes": dict(outcomes),
+        "change_log_rows": changes,
+        "max_convergence_seconds": max(convergence),
+        "worker_results": worker_results,
+        "passed": all(result["converged"] for result in worker_results),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes sharing the database")
+    parser.add_argument("--registrations", type=int, default=200, help="Registrations per worker")
+    parser.add_argument("--events", type=int, default=10, help="Seeded events")
+    parser.add_argument("--seed-attendees", type=int, default=1_000, help="Attendees seeded before the run")
+    parser.add_argument("--poll-interval", type=float, default=0.2, help="Invalidation poll interval in seconds")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Seconds a worker may take to converge")
+    parser.add_argument("--data-dir", help="Directory for the database (default: temporary)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="invalidation-") as tmp:
+        args.data_dir = args.data_dir or tmp
+        report = run(args)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+"""
+Open-loop HTTP load generator for the full application stack.
+
+Requests are issued at a fixed arrival rate no matter how many are still
+outstanding, so a slow server cannot slow the generator down and hide its
+own latency (coordinated omission). Latency is measured from each
+request's *intended* send time; the uncorrected service time is reported
+alongside for comparison.
+
+The app is built with ``create_app()`` on a freshly seeded SQLite
+database and driven either in-process through the ASGI interface or
+over a local TCP socket served by uvicorn.
+
+Usage (from ``backend``)::
+
+    python -m tools.loadgen --rate 200 --duration 30
+    python -m tools.loadgen --mode socket --rate 500 --mix browse=60,page=30,register=10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.common import database_url, parse_scale, seed_database, summarize
+
+import httpx
+
+DEFAULT_MIX = "browse=50,page=30,register=10,duplicate=5,full=5"
+
+# Statuses that count as a correct answer for each scenario
+EXPECTED_STATUSES: Dict[str, Tuple[int, ...]] = {
+    "browse": (200,),
+    "page": (200,),
+    "register": (201,),
+    "duplicate": (409,),
+    "full": (202, 409),
+}
+
+
+class Scenarios:
+    """
+    Weighted request scenarios against a seeded database.
+
+    Args:
+        seeded: Seeding summary returned by ``seed_database``
+        full_event_id: Event seeded at full capacity
+        api: API path prefix
+        mix: Scenario weights
+        clients: Number of distinct simulated clients
+    """
+
+    def __init__(self, seeded: Dict[str, int], full_event_id: int, api: str, mix: Dict[str, float], clients: int):
+        self.seeded = seeded
+        self.full_event_id = full_event_id
+        self.api = api
+        self.names = list(mix)
+        self.weights = [mix[name] for name in self.names]
+        self.clients = [f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}" for i in range(clients)]
+        self.rng = random.Random(7)
+        self.sequence = 0
+
+    def _open_event(self) -> int:
+        # Every event except the one seeded full has spare capacity
+        return self.rng.randint(1, self.seeded["events"] - 1)
+
+    def next(self) -> Tuple[str, str, str, Optional[Dict[str, str]], Dict[str, str]]:
+        """
+        Pick the next request.
+
+        Returns:
+            Tuple: Scenario name, method, path, JSON body and headers
+        """
+        name = self.rng.choices(self.names, self.weights)[0]
+        headers = {"X-Forwarded-For": self.rng.choice(self.clients)}
+        self.sequence += 1
+
+        if name == "browse":
+            return name, "GET", f"{self.api}/events/", None, headers
+
+        if name == "page":
+            total = self.seeded["hot_event_attendees"]
+            page = self.rng.randint(1, max(1, total // 10))
+            return name, "GET", f"{self.api}/events/{self.seeded['hot_event_id']}/attendees/?page={page}&size=10", None, headers
+
+        if name == "register":
+            body = {"name": f"Load {self.sequence}", "email": f"load-{os.getpid()}-{self.sequence}@example.com"}
+            return name, "POST", f"{self.api}/events/{self._open_event()}/attendees/", body, headers
+
+        if name == "duplicate":
+            attendee = self.rng.randint(1, self.seeded["hot_event_attendees"])
+            body = {"name": f"Attendee {attendee}", "email": f"attendee{attendee}@example.com"}
+            return name, "POST", f"{self.api}/events/{self.seeded['hot_event_id']}/attendees/", body, headers
+
+        body = {"name": f"Late {self.sequence}", "email": f"late-{os.getpid()}-{self.sequence}@example.com"}
+        return name, "POST", f"{self.api}/events/{self.full_event_id}/attendees/", body, headers
+
+
+class Recorder:
+    """Collects per-request outcomes, overall and per reporting interval."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.started = 0.0
+        self.response_ms: Dict[str, List[float]] = defaultdict(list)
+        self.service_ms: Dict[str, List[float]] = defaultdict(list)
+        self.outcomes: Dict[str, Counter] = defaultdict(Counter)
+        self.errors: Counter = Counter()
+        self.timeline: Dict[int, Dict[str, Any]] = defaultdict(lambda: {"completed": 0, "errors": 0, "response_ms": []})
+
+    def record(self, scenario: str, intended: float, sent: float, finished: float, outcome: str, ok: bool) -> None:
+        response = (finished - intended) * 1000
+        self.response_ms[scenario].append(response)
+        self.service_ms[scenario].append((finished - sent) * 1000)
+        self.outcomes[scenario][outcome] += 1
+
+        bucket = self.timeline[int((finished - self.started) // self.interval)]
+        bucket["completed"] += 1
+        bucket["response_ms"].append(response)
+        if not ok:
+            self.errors[f"{scenario}:{outcome}"] += 1
+            bucket["errors"] += 1
+
+    def report(self, elapsed: float, scheduled: int, dropped: int) -> Dict[str, Any]:
+        all_response = [value for values in self.response_ms.values() for value in values]
+        all_service = [value for values in self.service_ms.values() for value in values]
+        completed = len(all_response)
+
+        timeline = []
+        for index in sorted(self.timeline):
+            bucket = self.timeline[index]
+            latencies = summarize(bucket["response_ms"])
+            timeline.append({
+                "t": round(index * self.interval, 3),
+                "throughput_rps": round(bucket["completed"] / self.interval, 2),
+                "errors": bucket["errors"],
+                "p50_ms": latencies["p50_ms"],
+                "p99_ms": latencies["p99_ms"],
+            })
+
+        return {
+            "elapsed_seconds": round(elapsed, 3),
+            "scheduled": scheduled,
+            "completed": completed,
+            "dropped": dropped,
+            "throughput_rps": round(completed / elapsed, 2) if elapsed else 0.0,
+            "error_count": sum(self.errors.values()),
+            "latency": {
+                "response": summarize(all_response),
+                "service": summarize(all_service),
+            },
+            "scenarios": {
+                name: {
+                    "response": summarize(self.response_ms[name]),
+                    "service": summarize(self.service_ms[name]),
+                    "outcomes": dict(self.outcomes[name]),
+                }
+                for name in sorted(self.response_ms)
+            },
+            "errors": dict(self.errors.most_common()),
+            "timeline": timeline,
+        }
+
+
+async def send(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    request: Tuple[str, str, str, Optional[Dict[str, str]], Dict[str, str]],
+    intended: float,
+    timeout: float
+) -> None:
+    scenario, method, path, body, headers = request
+    sent = time.perf_counter()
+    try:
+        response = await client.request(method, path, json=body, headers=headers, timeout=timeout)
+        outcome = str(response.status_code)
+        ok = response.status_code in EXPECTED_STATUSES[scenario]
+    except Exception as e:
+        outcome = e.__class__.__name__
+        ok = False
+    recorder.record(scenario, intended, sent, time.perf_counter(), outcome, ok)
+
+
+async def generate(
+    client: httpx.AsyncClient,
+    scenarios: Scenarios,
+    args: argparse.Namespace
+) -> Dict[str, Any]:
+    """
+    Issue requests at the target arrival rate and collect the results.
+
+    Args:
+        client: HTTP client bound to the app
+        scenarios: Request scenarios
+        args: Parsed command line arguments
+
+    Returns:
+        Dict[str, Any]: Load test report
+    """
+    recorder = Recorder(args.interval)
+    rng = random.Random(11)
+    tasks = set()
+    scheduled = dropped = 0
+
+    started = time.perf_counter()
+    recorder.started = started
+    intended = started
+    deadline = started + args.duration
+
+    while intended < deadline:
+        # Always yield so in-process requests make progress even when the
+        # generator is behind schedule.
+        await asyncio.sleep(max(0.0, intended - time.perf_counter()))
+
+        scheduled += 1
+        if len(tasks) >= args.max_in_flight:
+            # The generator itself is saturated; count the request as lost
+            # rather than silently delaying the schedule.
+            dropped += 1
+        else:
+            task = asyncio.create_task(send(client, recorder, scenarios.next(), intended, args.timeout))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        gap = rng.expovariate(args.rate) if args.poisson else 1 / args.rate
+        intended += gap
+
+    if tasks:
+        await asyncio.wait(tasks)
+
+    return recorder.report(time.perf_counter() - started, scheduled, dropped)
+
+
+def prepare_database(args: argparse.Namespace) -> Tuple[str, Dict[str, int], int]:
+    """
+    Seed the database, give open events room to register and mark the last one full.
+
+    Returns:
+        Tuple[str, Dict[str, int], int]: Database path, seeding summary and full event ID
+    """
+    import sqlite3
+
+    path = os.path.join(args.data_dir, "loadgen.db")
+    seeded = seed_database(path, parse_scale(args.attendees))
+    full_event_id = seeded["events"]
+
+    conn = sqlite3.connect(path)
+    conn.execute("UPDATE events SET max_capacity = current_attendees + 1000000 WHERE id != ?", (full_event_id,))
+    conn.execute("UPDATE events SET max_capacity = current_attendees WHERE id = ?", (full_event_id,))
+    conn.commit()
+    conn.close()
+    return path, seeded, full_event_id
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    path, seeded, full_event_id = prepare_database(args)
+
+    # Configure the app for this database and for many simulated clients
+    # before it is imported.
+    os.environ["DATABASE_URL"] = database_url(path)
+    os.environ.setdefault("RATE_LIMIT_CLIENT_HEADER", "X-Forwarded-For")
+
+    from app.core.config import settings
+    from app.core.logging import configure_logging
+    from app.main import create_app
+
+    configure_logging()
+    app = create_app()
+    api = f"{settings.API_PREFIX}/{settings.API_VERSION}"
+    mix = {name: float(weight) for name, weight in (item.split("=") for item in args.mix.split(","))}
+    scenarios = Scenarios(seeded, full_event_id, api, mix, args.clients)
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+
+    if args.mode == "inprocess":
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://localhost", limits=limits) as client:
+                report = await generate(client, scenarios, args)
+    else:
+        import uvicorn
+
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning"))
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            if serving.done():
+                serving.result()
+            await asyncio.sleep(0.05)
+        port = server.servers[0].sockets[0].getsockname()[1]
+        try:
+            # Present as localhost so TrustedHostMiddleware admits the requests
+            async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{port}", headers={"Host": "localhost"}, limits=limits
+            ) as client:
+                report = await generate(client, scenarios, args)
+        finally:
+            server.should_exit = True
+            await serving
+
+    report["config"] = {
+        "mode": args.mode,
+        "rate": args.rate,
+        "duration": args.duration,
+        "poisson": args.poisson,
+        "mix": mix,
+        "attendees": seeded["attendees"],
+        "events": seeded["events"],
+    }
+    return report
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    out = sys.stderr
+    print(f"\n{'t(s)':>6} {'rps':>9} {'errors':>7} {'p50(ms)':>10} {'p99(ms)':>10}", file=out)
+    for row in report["timeline"]:
+        print(f"{row['t']:>6.1f} {row['throughput_rps']:>9.1f} {row['errors']:>7} {row['p50_ms']:>10.2f} {row['p99_ms']:>10.2f}", file=out)
+
+    response = report["latency"]["response"]
+    service = report["latency"]["service"]
+    print(
+        f"\nthroughput {report['throughput_rps']} req/s  completed {report['completed']}/{report['scheduled']}"
+        f"  dropped {report['dropped']}  errors {report['error_count']}",
+        file=out,
+    )
+    print(f"response (corrected) p50={response['p50_ms']}ms p95={response['p95_ms']}ms p99={response['p99_ms']}ms", file=out)
+    print(f"service (uncorrected) p50={service['p50_ms']}ms p95={service['p95_ms']}ms p99={service['p99_ms']}ms", file=out)
+    for name, scenario in report["scenarios"].items():
+        print(f"  {name:<10} p99={scenario['response']['p99_ms']:>9.2f}ms outcomes={scenario['outcomes']}", file=out)
+    if report["errors"]:
+        print(f"errors: {report['errors']}", file=out)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["inprocess", "socket"], default="inprocess", help="How to drive the app")
+    parser.add_argument("--rate", type=float, default=100.0, help="Target arrival rate in requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to generate load for")
+    parser.add_argument("--poisson", action="store_true", help="Use exponential inter-arrival times")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Scenario weights, e.g. browse=50,page=30,register=20")
+    parser.add_argument("--attendees", default="100k", help="Attendees to seed (1k, 100k, 10M or a number)")
+    parser.add_argument("--clients", type=int, default=1000, help="Distinct simulated client addresses")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="Outstanding requests before dropping")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--interval", type=float, default=1.0, help="Reporting interval in seconds")
+    parser.add_argument("--port", type=int, default=0, help="Port for socket mode (0 picks a free port)")
+    parser.add_argument("--data-dir", help="Directory for the seeded database (default: temporary)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="loadgen-") as tmp:
+        args.data_dir = args.data_dir or tmp
+        report = asyncio.run(run(args))
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["error_count"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
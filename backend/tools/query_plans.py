@@ -0,0 +1,410 @@
+"""
+Query-plan regression checks for the repository layer.
+
+Runs every repository method against a seeded SQLite database, captures
+each SQL statement it emits and records SQLite's ``EXPLAIN QUERY PLAN``
+for it. Each case then has to pass these checks:
+
+* every expected index appears in the case's plans
+* hot-path cases never scan a whole table or build a temporary B-tree
+* plans match the stored baseline (a unified diff is printed otherwise)
+
+Usage (from ``backend``)::
+
+    python -m tools.query_plans
+    python -m tools.query_plans --update    # accept the current plans
+"""
+
+import argparse
+import asyncio
+import difflib
+import json
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from tools.common import database_url, seed_database
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.logging import configure_logging
+from app.repositories.attendee import AttendeeRepository
+from app.repositories.event import EventRepository
+from app.repositories.person import PersonRepository
+from app.repositories.seat_hold import SeatHoldRepository
+from app.repositories.waitlist import WaitlistRepository
+from app.schemas.attendee import AttendeeRecordCreate
+from app.schemas.base import PaginationParams
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "query_plans.json")
+
+# Plan details that mean SQLite reads a whole table or sorts/deduplicates
+# through a temporary structure. "SCAN CONSTANT ROW" is a single-row
+# placeholder and harmless.
+FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW)")
+TEMP_BTREE = re.compile(r"USE TEMP B-TREE")
+
+# For a full scan through a covering index SQLite picks the smallest
+# index, and ties between equally sized ones go either way from run to
+# run. Only cold cases can scan, so the index name is masked for diffing.
+COVERING_SCAN = re.compile(r"^(\s*SCAN \w+ USING COVERING INDEX) \S+$")
+
+PRIMARY_KEY = "INTEGER PRIMARY KEY"
+
+Case = Callable[[AsyncSession], Awaitable[Any]]
+
+
+@dataclass
+class PlanCase:
+    """
+    A repository call whose query plans are checked.
+
+    Attributes:
+        run: Coroutine function calling the repository
+        hot: Whether the call serves a request hot path
+        indexes: Index names (or ``INTEGER PRIMARY KEY``) the plans must use
+    """
+    run: Case
+    hot: bool = True
+    indexes: List[str] = field(default_factory=list)
+
+
+def build_cases(seeded: Dict[str, int]) -> Dict[str, PlanCase]:
+    """
+    Build a case for every query the repositories can produce.
+
+    Args:
+        seeded: Seeding summary returned by ``seed_database``
+
+    Returns:
+        Dict[str, PlanCase]: Case name to case
+    """
+    hot_event_id = seeded["hot_event_id"]
+    cold_event_id = seeded["events"]
+    page = PaginationParams(page=1, size=10)
+    deep = PaginationParams(page=max(1, seeded["hot_event_attendees"] // 10), size=10)
+    attendee = AttendeeRecordCreate(event_id=cold_event_id, person_id=1)
+
+    return {
+        # BaseRepository
+        "base.get": PlanCase(lambda db: EventRepository(db).get(hot_event_id), indexes=[PRIMARY_KEY]),
+        "base.exists": PlanCase(lambda db: EventRepository(db).exists(hot_event_id), indexes=[PRIMARY_KEY]),
+        "base.count.filtered": PlanCase(
+            lambda db: AttendeeRepository(db).count({"event_id": hot_event_id}),
+            indexes=["ix_attendees_event_id"],
+        ),
+        "base.get_many": PlanCase(
+            lambda db: EventRepository(db).get_many([hot_event_id, cold_event_id]), indexes=[PRIMARY_KEY]
+        ),
+        "base.count.unfiltered": PlanCase(lambda db: EventRepository(db).count(), hot=False),
+        "base.get_multi.filtered": PlanCase(
+            lambda db: AttendeeRepository(db).get_multi(page, {"event_id": hot_event_id}),
+            indexes=["ix_attendees_event_id"],
+        ),
+        "base.get_multi.ordered": PlanCase(
+            lambda db: EventRepository(db).get_multi(page, order_by="start_time"),
+            hot=False,
+            indexes=["ix_events_start_time"],
+        ),
+        "base.get_multi.unfiltered": PlanCase(lambda db: EventRepository(db).get_multi(page), hot=False),
+        "base.create": PlanCase(lambda db: AttendeeRepository(db).create(attendee, commit=False)),
+        "base.create_many": PlanCase(lambda db: AttendeeRepository(db).create_many([attendee], commit=False)),
+        # EventRepository
+        "event.get_by_name": PlanCase(
+            lambda db: EventRepository(db).get_by_name(f"Benchmark Event {cold_event_id}"),
+            indexes=["ix_events_name"],
+        ),
+        "event.get_upcoming_events": PlanCase(
+            lambda db: EventRepository(db).get_upcoming_events(),
+            indexes=["ix_events_start_time"],
+        ),
+        "event.get_upcoming_events.projected": PlanCase(
+            lambda db: EventRepository(db).get_upcoming_events(["id", "name"]),
+            indexes=["ix_events_start_time"],
+        ),
+        "event.lock_available_spots": PlanCase(
+            lambda db: EventRepository(db).lock_available_spots(cold_event_id),
+            indexes=[PRIMARY_KEY],
+        ),
+        "event.increment_attendee_count": PlanCase(
+            lambda db: EventRepository(db).increment_attendee_count(cold_event_id),
+            indexes=[PRIMARY_KEY],
+        ),
+        "event.decrement_attendee_count": PlanCase(
+            lambda db: EventRepository(db).decrement_attendee_count(cold_event_id),
+            indexes=[PRIMARY_KEY],
+        ),
+        # AttendeeRepository
+        "attendee.get_by_person_and_event": PlanCase(
+            lambda db: AttendeeRepository(db).get_by_person_and_event(1, hot_event_id),
+            indexes=["sqlite_autoindex_attendees_1"],
+        ),
+        "attendee.get_emails_by_event": PlanCase(
+            lambda db: AttendeeRepository(db).get_emails_by_event(cold_event_id),
+            indexes=["ix_attendees_event_id"],
+        ),
+        "attendee.get_attendees_by_event": PlanCase(
+            lambda db: AttendeeRepository(db).get_attendees_by_event(hot_event_id, page),
+            indexes=["ix_attendees_event_id"],
+        ),
+        "attendee.get_attendees_by_event_with_count.shallow": PlanCase(
+            lambda db: AttendeeRepository(db).get_attendees_by_event_with_count(hot_event_id, page),
+            indexes=["ix_attendees_event_id"],
+        ),
+        "attendee.get_attendees_by_event_with_count.deep": PlanCase(
+            lambda db: AttendeeRepository(db).get_attendees_by_event_with_count(hot_event_id, deep),
+            indexes=["ix_attendees_event_id"],
+        ),
+        "attendee.get_attendees_by_event_with_count.projected": PlanCase(
+            lambda db: AttendeeRepository(db).get_attendees_by_event_with_count(hot_event_id, page, ["id", "name"]),
+            indexes=["ix_attendees_event_id"],
+        ),
+        "attendee.get_registered_emails": PlanCase(
+            lambda db: AttendeeRepository(db).get_registered_emails(
+                hot_event_id, ["attendee1@example.com", "attendee2@example.com"]
+            ),
+            indexes=["sqlite_autoindex_attendees_1"],
+        ),
+        "attendee.delete_from_event": PlanCase(
+            lambda db: AttendeeRepository(db).delete_from_event(hot_event_id, 1),
+            indexes=[PRIMARY_KEY],
+        ),
+        # PersonRepository
+        "person.get_ids_by_email": PlanCase(
+            lambda db: PersonRepository(db).get_ids_by_email(
+                hot_event_id, ["attendee1@example.com", "attendee2@example.com"]
+            ),
+            indexes=["sqlite_autoindex_persons_1"],
+        ),
+        "person.create_missing": PlanCase(
+            lambda db: PersonRepository(db).create_missing(hot_event_id, {"plan-check@example.com": "Plan Check"}),
+        ),
+        # SeatHoldRepository
+        "seat_hold.take": PlanCase(
+            lambda db: SeatHoldRepository(db).take(hot_event_id, "plan-check", datetime.utcnow()),
+            indexes=["sqlite_autoindex_seat_holds_1"],
+        ),
+        "seat_hold.delete_by_token": PlanCase(
+            lambda db: SeatHoldRepository(db).delete_by_token(hot_event_id, "plan-check"),
+            indexes=["sqlite_autoindex_seat_holds_1"],
+        ),
+        "seat_hold.delete_expired": PlanCase(
+            lambda db: SeatHoldRepository(db).delete_expired([1, 2, 3], datetime.utcnow()),
+            indexes=[PRIMARY_KEY],
+        ),
+        "seat_hold.get_expiries": PlanCase(lambda db: SeatHoldRepository(db).get_expiries(), hot=False),
+        # WaitlistRepository
+        "waitlist.get_by_event": PlanCase(
+            lambda db: WaitlistRepository(db).get_by_event(hot_event_id, 1),
+            indexes=[PRIMARY_KEY],
+        ),
+        "waitlist.get_position": PlanCase(
+            lambda db: WaitlistRepository(db).get_position(hot_event_id, 1000),
+            indexes=["ix_waitlist_entries_event_order"],
+        ),
+        "waitlist.get_waitlisted_emails": PlanCase(
+            lambda db: WaitlistRepository(db).get_waitlisted_emails(
+                hot_event_id, ["attendee1@example.com", "attendee2@example.com"]
+            ),
+            indexes=["sqlite_autoindex_waitlist_entries_1"],
+        ),
+        "waitlist.get_head": PlanCase(
+            lambda db: WaitlistRepository(db).get_head(hot_event_id, 10),
+            indexes=["ix_waitlist_entries_event_order"],
+        ),
+        "waitlist.delete_ids": PlanCase(
+            lambda db: WaitlistRepository(db).delete_ids(hot_event_id, [1, 2, 3]),
+            indexes=["ix_waitlist_entries_event_order"],
+        ),
+        "waitlist.delete_by_email": PlanCase(
+            lambda db: WaitlistRepository(db).delete_by_email(hot_event_id, "attendee1@example.com"),
+            indexes=["sqlite_autoindex_waitlist_entries_1"],
+        ),
+    }
+
+
+def explain(conn: sqlite3.Connection, statement: str, parameters: Any) -> List[str]:
+    """
+    Render ``EXPLAIN QUERY PLAN`` for a statement as indented lines.
+
+    Args:
+        conn: Connection to the seeded database
+        statement: SQL statement with placeholders
+        parameters: Bound parameters
+
+    Returns:
+        List[str]: One line per plan node, children indented under parents
+    """
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+    depth: Dict[int, int] = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return lines
+
+
+async def capture_plans(path: str, cases: Dict[str, PlanCase]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Run each case and collect the plans of the statements it executed.
+
+    Every case runs in its own session and is rolled back, so cases see
+    the same data regardless of order.
+
+    Args:
+        path: Seeded database file
+        cases: Cases to run
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: Case name to its statements and plans
+    """
+    engine = create_async_engine(database_url(path))
+    sessionmaker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    captured: List[Tuple[str, Any]] = []
+
+    @sa_event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    explain_conn = sqlite3.connect(path)
+    plans: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        for name, case in cases.items():
+            captured.clear()
+            async with sessionmaker() as db:
+                await case.run(db)
+                await db.rollback()
+            plans[name] = [
+                {"sql": " ".join(statement.split()), "plan": explain(explain_conn, statement, parameters)}
+                for statement, parameters in captured
+            ]
+    finally:
+        explain_conn.close()
+        await engine.dispose()
+    return plans
+
+
+def check_case(name: str, case: PlanCase, statements: List[Dict[str, Any]]) -> List[str]:
+    """
+    Check one case's plans against its expectations.
+
+    Args:
+        name: Case name
+        case: Case definition
+        statements: Captured statements and plans
+
+    Returns:
+        List[str]: Human-readable failures
+    """
+    failures = []
+    details = [line.strip() for statement in statements for line in statement["plan"]]
+
+    if not statements:
+        failures.append(f"{name}: no SQL was captured")
+
+    for index in case.indexes:
+        if not any(index in detail for detail in details):
+            failures.append(f"{name}: expected index {index} is not used")
+
+    if case.hot:
+        for statement in statements:
+            for detail in (line.strip() for line in statement["plan"]):
+                if FULL_SCAN.search(detail):
+                    failures.append(f"{name}: full scan on a hot path: {detail}\n    {statement['sql']}")
+                if TEMP_BTREE.search(detail):
+                    failures.append(f"{name}: temporary B-tree on a hot path: {detail}\n    {statement['sql']}")
+
+    return failures
+
+
+def render(statements: List[Dict[str, Any]]) -> List[str]:
+    """Render a case's statements and plans as diffable lines."""
+    lines = []
+    for statement in statements:
+        lines.append(statement["sql"])
+        lines.extend(COVERING_SCAN.sub(r"\1 <smallest>", f"  {line}") for line in statement["plan"])
+    return lines
+
+
+def diff_plans(name: str, previous: List[Dict[str, Any]], current: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Diff a case's plans against the baseline.
+
+    Returns:
+        Optional[str]: Unified diff, or None if the plans are unchanged
+    """
+    before, after = render(previous), render(current)
+    if before == after:
+        return None
+    return "\n".join(difflib.unified_diff(
+        before, after, fromfile=f"baseline/{name}", tofile=f"current/{name}", lineterm=""
+    ))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attendees", type=int, default=100_000, help="Attendees to seed")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Stored plans to diff against")
+    parser.add_argument("--update", action="store_true", help="Write the current plans as the new baseline")
+    parser.add_argument("--cases", nargs="*", default=[], help="Only run cases containing one of these strings")
+    parser.add_argument("--verbose", action="store_true", help="Print every captured plan")
+    return parser.parse_args(argv)
+
+
+async def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    configure_logging()
+
+    with tempfile.TemporaryDirectory(prefix="plans-") as tmp:
+        path = os.path.join(tmp, "plans.db")
+        seeded = seed_database(path, args.attendees)
+        cases = {
+            name: case for name, case in build_cases(seeded).items()
+            if not args.cases or any(pattern in name for pattern in args.cases)
+        }
+        plans = await capture_plans(path, cases)
+
+    failures: List[str] = []
+    for name, case in cases.items():
+        failures.extend(check_case(name, case, plans[name]))
+        if args.verbose:
+            print(f"== {name}", file=sys.stderr)
+            print("\n".join(render(plans[name])), file=sys.stderr)
+
+    if args.update:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(plans)
+        with open(args.baseline, "w") as f:
+            json.dump(dict(sorted(baseline.items())), f, indent=2)
+            f.write("\n")
+        print(f"Wrote {len(plans)} plans to {args.baseline}", file=sys.stderr)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for name, statements in plans.items():
+            if name not in baseline:
+                failures.append(f"{name}: no baseline plan (run with --update)")
+                continue
+            diff = diff_plans(name, baseline[name], statements)
+            if diff:
+                failures.append(f"{name}: plan changed\n{diff}")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    if failures:
+        return 1
+    print(f"{len(plans)} query plan checks passed (SQLite {sqlite3.sqlite_version})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,359 @@
+"""
+Rebalancing of events between database shards.
+
+Reads the shards configured by ``DATABASE_URL`` and ``DATABASE_SHARD_URLS``
+(environment or ``.env``) and reports how many events and attendee and
+waitlist rows each one holds. Without ``--apply`` it only proposes moves
+that even the rows out; with it, the moves are made. ``--event`` and
+``--to`` move one event to a given shard.
+
+An event is moved with its attendees, waitlist entries, seat holds and
+waiting room:
+
+* the event is locked on its shard, so nothing can change it meanwhile
+* its rows are copied to the target shard, keeping their IDs unless
+  they are taken there; then they are renumbered in the same order above
+  every old ID, so an ID a client still holds never names someone else
+* its attendees' persons are added to the target shard unless their
+  email is already there, and the copied attendees point at them; the
+  persons stay on the old shard too
+* the shard directory is updated and the move is announced on the
+  invalidation bus, so running workers route the event to its new shard
+* the rows are deleted from the old shard, which releases the lock
+
+Registrations for the event wait for the lock during the move; workers
+that have not polled the bus yet answer 404 for the event for up to
+``INVALIDATION_POLL_INTERVAL``. Seat hold IDs are never renumbered,
+since the expiry reapers track holds by ID: a move that would have to is
+refused and can be retried once the holds have expired.
+
+The run fails (exit code 1) if a move failed.
+
+Usage (from ``backend``)::
+
+    python -m tools.rebalance
+    python -m tools.rebalance --apply --max-moves 5
+    python -m tools.rebalance --event 12 --to 2
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import tools.common  # noqa: F401  (tool environment defaults)
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.database import shard_engines, shard_router
+from app.db.dialects import conflict_insert
+from app.db.sharding import HOME_SHARD
+from app.models import (
+    Attendee,
+    CacheInvalidation,
+    Event,
+    Person,
+    QueueTicketClaim,
+    SeatHold,
+    WaitingRoom,
+    WaitlistEntry,
+)
+from app.services.invalidation import SHARDS_CACHE
+
+EVENTS = Event.__table__
+INVALIDATIONS = CacheInvalidation.__table__
+ATTENDEES = Attendee.__table__
+PERSONS = Person.__table__
+
+# Rows that belong to an event, copied in this order after it
+EVENT_ROWS = (
+    ATTENDEES,
+    WaitlistEntry.__table__,
+    SeatHold.__table__,
+    WaitingRoom.__table__,
+    QueueTicketClaim.__table__,
+)
+
+# Emails looked up per query when matching persons on the target shard
+PERSON_BATCH_SIZE = 500
+
+# Origin of the invalidations written by this tool
+ORIGIN = "rebalance"
+
+
+class MoveError(Exception):
+    """Exception raised when an event cannot be moved."""
+    pass
+
+
+async def shard_loads() -> Tuple[Dict[str, Dict[int, int]], List[Dict[str, Any]]]:
+    """
+    Read the rows of every event on every shard.
+
+    Returns:
+        Tuple[Dict[str, Dict[int, int]], List[Dict[str, Any]]]: Attendee and
+        waitlist rows per event per shard, and the events found on a shard
+        the directory does not place them on (left over by a failed move)
+    """
+    loads: Dict[str, Dict[int, int]] = {}
+    strays = []
+    for shard_id, engine in shard_engines.items():
+        async with engine.connect() as conn:
+            event_ids = (await conn.execute(select(EVENTS.c.id))).scalars().all()
+            rows = dict.fromkeys(event_ids, 0)
+            for table in (ATTENDEES, WaitlistEntry.__table__):
+                counts = await conn.execute(
+                    select(table.c.event_id, func.count()).group_by(table.c.event_id)
+                )
+                for event_id, count in counts:
+                    if event_id in rows:
+                        rows[event_id] += count
+        loads[shard_id] = {}
+        for event_id, count in rows.items():
+            if shard_router.shard_for_event(event_id) == shard_id:
+                loads[shard_id][event_id] = count
+            else:
+                strays.append({"event_id": event_id, "shard": shard_id})
+    return loads, strays
+
+
+def summarize(loads: Dict[str, Dict[int, int]]) -> Dict[str, Dict[str, int]]:
+    """Events and rows per shard."""
+    return {
+        shard_id: {"events": len(events), "rows": sum(events.values())}
+        for shard_id, events in loads.items()
+    }
+
+
+def plan_moves(loads: Dict[str, Dict[int, int]], max_moves: int) -> List[Tuple[int, str, str]]:
+    """
+    Pick moves that even out the rows per shard.
+
+    Each move takes the event from the fullest shard whose size is closest
+    to half the gap to the emptiest shard; events at least as large as the
+    gap are never moved, since that would not narrow it.
+
+    Args:
+        loads: Rows per event per shard
+        max_moves: Most moves to plan
+
+    Returns:
+        List[Tuple[int, str, str]]: Event ID, source and target shard per move
+    """
+    loads = {shard_id: dict(events) for shard_id, events in loads.items()}
+    totals = {shard_id: sum(events.values()) for shard_id, events in loads.items()}
+    moves = []
+    while len(moves) < max_moves:
+        source = max(totals, key=totals.get)
+        target = min(totals, key=totals.get)
+        gap = totals[source] - totals[target]
+        candidates = [(event_id, rows) for event_id, rows in loads[source].items() if 0 < rows < gap]
+        if not candidates:
+            break
+        event_id, rows = min(candidates, key=lambda candidate: abs(gap / 2 - candidate[1]))
+        loads[target][event_id] = loads[source].pop(event_id)
+        totals[source] -= rows
+        totals[target] += rows
+        moves.append((event_id, source, target))
+    return moves
+
+
+async def _copy_persons(source: AsyncConnection, target: AsyncConnection, event_id: int) -> Dict[int, int]:
+    """
+    Add the persons registered for an event to the target shard.
+
+    Returns:
+        Dict[int, int]: Person ID on the target shard by person ID on the source
+    """
+    persons = (await source.execute(
+        select(PERSONS.c.id, PERSONS.c.email, PERSONS.c.name).where(
+            PERSONS.c.id.in_(select(ATTENDEES.c.person_id).where(ATTENDEES.c.event_id == event_id))
+        )
+    )).all()
+    person_ids = {}
+    for start in range(0, len(persons), PERSON_BATCH_SIZE):
+        batch = persons[start:start + PERSON_BATCH_SIZE]
+        await target.execute(
+            conflict_insert(target.dialect.name)(PERSONS).on_conflict_do_nothing(index_elements=[PERSONS.c.email]),
+            [{"email": person.email, "name": person.name} for person in batch]
+        )
+        target_ids = dict((await target.execute(
+            select(PERSONS.c.email, PERSONS.c.id).where(PERSONS.c.email.in_([person.email for person in batch]))
+        )).all())
+        person_ids.update({person.id: target_ids[person.email] for person in batch})
+    return person_ids
+
+
+async def _copy_rows(target: AsyncConnection, table: Any, rows: List[Dict[str, Any]]) -> bool:
+    """
+    Insert an event's rows on the target shard, renumbering them if needed.
+
+    Returns:
+        bool: Whether the rows were renumbered
+    """
+    ids = [row["id"] for row in rows]
+    taken = (await target.execute(
+        select(func.count()).select_from(table).where(table.c.id.in_(ids))
+    )).scalar()
+    if taken:
+        if table is SeatHold.__table__:
+            raise MoveError("Seat hold IDs are taken on the target shard; retry once the holds have expired")
+        highest = (await target.execute(select(func.max(table.c.id)))).scalar() or 0
+        start = max(highest, max(ids)) + 1
+        rows = [{**row, "id": start + offset} for offset, row in enumerate(rows)]
+    await target.execute(insert(table), rows)
+    return bool(taken)
+
+
+async def move_event(event_id: int, target_id: str) -> Dict[str, Any]:
+    """
+    Move an event and its rows to another shard.
+
+    Args:
+        event_id: Event ID
+        target_id: Shard to move the event to
+
+    Returns:
+        Dict[str, Any]: Rows moved and tables whose rows were renumbered
+
+    Raises:
+        MoveError: If the event cannot be moved
+    """
+    source_id = shard_router.shard_for_event(event_id)
+    if target_id not in shard_engines:
+        raise MoveError(f"Unknown shard {target_id}")
+    if source_id == target_id:
+        raise MoveError(f"Event {event_id} is already on shard {target_id}")
+
+    async with shard_engines[source_id].connect() as source, shard_engines[target_id].connect() as target:
+        # The no-op UPDATE takes the source shard's write lock until the
+        # rows are deleted there, so no registration can slip in between
+        locked = await source.execute(
+            update(EVENTS).where(EVENTS.c.id == event_id).values(current_attendees=EVENTS.c.current_attendees)
+        )
+        if locked.rowcount != 1:
+            raise MoveError(f"Event {event_id} is not on shard {source_id}")
+        if (await target.execute(select(EVENTS.c.id).where(EVENTS.c.id == event_id))).first():
+            raise MoveError(f"Event {event_id} is already present on shard {target_id}; remove the stray copy first")
+
+        event_row = (await source.execute(select(EVENTS).where(EVENTS.c.id == event_id))).mappings().one()
+        await target.execute(insert(EVENTS), [dict(event_row)])
+        person_ids = await _copy_persons(source, target, event_id)
+        moved = {}
+        renumbered = []
+        for table in EVENT_ROWS:
+            rows = (await source.execute(
+                select(table).where(table.c.event_id == event_id).order_by(table.c.id)
+            )).mappings().all()
+            moved[table.name] = len(rows)
+            rows = [dict(row) for row in rows]
+            if table is ATTENDEES:
+                rows = [{**row, "person_id": person_ids[row["person_id"]]} for row in rows]
+            if rows and await _copy_rows(target, table, rows):
+                renumbered.append(table.name)
+
+        # The directory lives on the home shard, which may be either end
+        home = {source_id: source, target_id: target}.get(HOME_SHARD)
+        home_conn = home or await shard_engines[HOME_SHARD].connect()
+        try:
+            await shard_router.move(event_id, target_id, home_conn)
+            await home_conn.execute(
+                insert(INVALIDATIONS),
+                [{"origin": ORIGIN, "cache": SHARDS_CACHE, "key": str(event_id)}]
+            )
+            await target.commit()
+            if home is None:
+                try:
+                    await home_conn.commit()
+                except Exception:
+                    # Take the copy back, or it would show up twice
+                    await _delete_event(target, event_id)
+                    await target.commit()
+                    raise
+        finally:
+            if home is None:
+                await home_conn.close()
+
+        await _delete_event(source, event_id)
+        await source.commit()
+    await shard_router.reload([event_id])
+    return {"rows": moved, "renumbered": renumbered}
+
+
+async def _delete_event(conn: AsyncConnection, event_id: int) -> None:
+    for table in EVENT_ROWS:
+        await conn.execute(table.delete().where(table.c.event_id == event_id))
+    await conn.execute(EVENTS.delete().where(EVENTS.c.id == event_id))
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    await shard_router.load()
+    loads, strays = await shard_loads()
+
+    if args.event is not None:
+        moves = [(args.event, shard_router.shard_for_event(args.event), args.to)]
+    else:
+        moves = plan_moves(loads, args.max_moves)
+    apply = args.apply or args.event is not None
+
+    results = []
+    for event_id, source_id, target_id in moves:
+        result: Dict[str, Any] = {"event_id": event_id, "from": source_id, "to": target_id}
+        if apply:
+            try:
+                result.update(await move_event(event_id, target_id))
+                result["status"] = "moved"
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = str(e)
+        else:
+            result["status"] = "planned"
+        results.append(result)
+
+    report = {
+        "shards": summarize(loads),
+        "strays": strays,
+        "moves": results,
+        "applied": apply,
+    }
+    if apply:
+        report["shards_after"] = summarize((await shard_loads())[0])
+    report["passed"] = all(result["status"] != "failed" for result in results)
+
+    for engine in shard_engines.values():
+        await engine.dispose()
+    return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apply", action="store_true", help="Make the planned moves instead of only reporting them")
+    parser.add_argument("--max-moves", type=int, default=10, help="Most events to move")
+    parser.add_argument("--event", type=int, help="Move only this event")
+    parser.add_argument("--to", help="Shard to move --event to")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+    if (args.event is None) != (args.to is None):
+        parser.error("--event and --to go together")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if not shard_router.enabled:
+        print("Only one database shard is configured; set DATABASE_SHARD_URLS", file=sys.stderr)
+        return 1
+    report = asyncio.run(run(args))
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""
+Concurrency stress harness for attendee registration.
+
+Several worker processes share one SQLite file and fire thousands of
+concurrent registrations through ``AttendeeService.register_attendee``
+at events that are nearly full, reusing emails so duplicates race each
+other across processes. Afterwards the database is checked directly:
+
+* ``current_attendees`` matches the attendee rows plus outstanding seat holds
+* no event holds more attendees than its ``max_capacity``
+* no email is registered twice for the same event
+* every registration a worker saw succeed is in the database
+* nobody waits on the waitlist of an event with free seats
+
+The run fails (exit code 1) if any invariant is violated or any
+registration raised an unexpected error, and reports the sustained
+registrations per second reached.
+
+Usage (from ``backend``)::
+
+    python -m tools.stress --workers 4 --registrations 5000
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from tools.common import database_url, seed_database
+
+Work = List[Tuple[int, str]]
+
+
+def build_workload(args: argparse.Namespace, event_ids: List[int]) -> List[Work]:
+    """
+    Build each worker's list of (event_id, email) registrations.
+
+    Attempts are drawn from a pool of (event, email) pairs smaller than
+    the number of registrations, so the same email is attempted for the
+    same event several times, usually by different workers at about the
+    same moment.
+
+    Returns:
+        List[Work]: One work list per worker
+    """
+    rng = random.Random(args.seed)
+    pool_size = max(1, int(args.registrations * (1 - args.duplicate_ratio)))
+    pool = [(rng.choice(event_ids), f"stress{index}@example.com") for index in range(pool_size)]
+    work = [rng.choice(pool) for _ in range(args.registrations)]
+    return [work[index::args.workers] for index in range(args.workers)]
+
+
+def worker(path: str, work: Work, concurrency: int, start: Any, results: Any) -> None:
+    """
+    Worker process entry point: register everything in ``work``.
+
+    Args:
+        path: Shared database file
+        work: Registrations to attempt
+        concurrency: Registrations in flight at once in this process
+        start: Event set by the parent when all workers should begin
+        results: Queue receiving this worker's outcome counts
+    """
+    os.environ["DATABASE_URL"] = database_url(path)
+
+    from app.core.logging import configure_logging
+    from app.db.database import engine, lane_session
+    from app.db.lanes import DatabaseBusyError, write_lane
+    from app.schemas.attendee import AttendeeBase
+    from app.services.attendee import AttendeeService
+    from app.services.exceptions import (
+        AttendeeAlreadyRegisteredError,
+        AttendeeAlreadyWaitlistedError,
+        EventCapacityExceededError,
+    )
+
+    configure_logging()
+
+    async def run() -> Dict[str, Any]:
+        outcomes: Counter = Counter()
+        registered: List[Tuple[int, str]] = []
+        queue: "asyncio.Queue[Tuple[int, str]]" = asyncio.Queue()
+        for item in work:
+            queue.put_nowait(item)
+
+        async def register_loop() -> None:
+            while not queue.empty():
+                event_id, email = queue.get_nowait()
+                try:
+                    async with lane_session(write_lane) as db:
+                        await AttendeeService(db).register_attendee(
+                            event_id, AttendeeBase(name="Stress Attendee", email=email)
+                        )
+                    outcomes["registered"] += 1
+                    registered.append((event_id, email))
+                except (AttendeeAlreadyRegisteredError, AttendeeAlreadyWaitlistedError):
+                    outcomes["duplicate"] += 1
+                except EventCapacityExceededError:
+                    outcomes["full"] += 1
+                except DatabaseBusyError:
+                    outcomes["busy"] += 1
+                except Exception as e:
+                    outcomes[f"error:{e.__class__.__name__}"] += 1
+
+        start.wait()
+        started = time.perf_counter()
+        await asyncio.gather(*(register_loop() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        await engine.dispose()
+        return {"outcomes": dict(outcomes), "registered": registered, "elapsed": elapsed}
+
+    results.put(asyncio.run(run()))
+
+
+def prepare_database(path: str, args: argparse.Namespace) -> List[int]:
+    """
+    Seed the database and leave a handful of events nearly full.
+
+    Returns:
+        List[int]: IDs of the events under test
+    """
+    seed_database(path, args.seed_attendees, events=args.events, hot_share=0.0)
+
+    conn = sqlite3.connect(path)
+    event_ids = [row[0] for row in conn.execute("SELECT id FROM events ORDER BY id")]
+    conn.execute("UPDATE events SET max_capacity = current_attendees + ?", (args.free_spots,))
+    conn.commit()
+    conn.close()
+    return event_ids
+
+
+def verify(path: str, registered: List[Tuple[int, str]]) -> Dict[str, Any]:
+    """
+    Check the database invariants after the run.
+
+    Args:
+        path: Database file
+        registered: Registrations the workers saw succeed
+
+    Returns:
+        Dict[str, Any]: Violations by invariant
+    """
+    conn = sqlite3.connect(path)
+
+    count_mismatches = conn.execute(
+        """
+        SELECT e.id, e.current_attendees, COUNT(a.id),
+               (SELECT COUNT(*) FROM seat_holds h WHERE h.event_id = e.id) AS held
+        FROM events e LEFT JOIN attendees a ON a.event_id = e.id
+        GROUP BY e.id
+        HAVING e.current_attendees != COUNT(a.id) + held
+        """
+    ).fetchall()
+
+    over_capacity = conn.execute(
+        """
+        SELECT e.id, e.max_capacity, e.current_attendees, COUNT(a.id)
+        FROM events e LEFT JOIN attendees a ON a.event_id = e.id
+        GROUP BY e.id
+        HAVING COUNT(a.id) > e.max_capacity OR e.current_attendees > e.max_capacity
+        """
+    ).fetchall()
+
+    duplicates = conn.execute(
+        """
+        SELECT a.event_id, lower(p.email), COUNT(*)
+        FROM attendees a JOIN persons p ON p.id = a.person_id
+        GROUP BY a.event_id, lower(p.email)
+        HAVING COUNT(*) > 1
+        """
+    ).fetchall()
+
+    idle_seats = conn.execute(
+        """
+        SELECT e.id, e.max_capacity, e.current_attendees, COUNT(w.id)
+        FROM events e JOIN waitlist_entries w ON w.event_id = e.id
+        GROUP BY e.id
+        HAVING e.current_attendees < e.max_capacity
+        """
+    ).fetchall()
+
+    missing = [
+        (event_id, email) for event_id, email in registered
+        if conn.execute(
+            "SELECT 1 FROM attendees a JOIN persons p ON p.id = a.person_id "
+            "WHERE a.event_id = ? AND p.email = ?", (event_id, email)
+        ).fetchone() is None
+    ]
+    conn.close()
+
+    return {
+        "count_mismatches": count_mismatches,
+        "over_capacity": over_capacity,
+        "duplicates": duplicates,
+        "missing_registrations": missing,
+        "waitlisted_with_free_seats": idle_seats,
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    path = os.path.join(args.data_dir, "stress.db")
+    event_ids = prepare_database(path, args)
+    workloads = build_workload(args, event_ids)
+
+    context = multiprocessing.get_context("spawn")
+    start = context.Event()
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(path, work, args.concurrency, start, results))
+        for work in workloads
+    ]
+    for process in processes:
+        process.start()
+
+    # Give the workers time to import the app before releasing them together
+    time.sleep(args.startup_delay)
+    started = time.perf_counter()
+    start.set()
+
+    worker_results = [results.get(timeout=args.timeout) for _ in processes]
+    elapsed = time.perf_counter() - started
+    for process in processes:
+        process.join()
+
+    outcomes: Counter = Counter()
+    registered: List[Tuple[int, str]] = []
+    for result in worker_results:
+        outcomes.update(result["outcomes"])
+        registered.extend(result["registered"])
+
+    violations = verify(path, registered)
+    errors = sum(count for outcome, count in outcomes.items() if outcome.startswith("error:"))
+    return {
+        "workers": args.workers,
+        "concurrency_per_worker": args.concurrency,
+        "events": len(event_ids),
+        "free_spots_per_event": args.free_spots,
+        "attempted": args.registrations,
+        "outcomes": dict(outcomes),
+        "elapsed_seconds": round(elapsed, 3),
+        "registrations_per_second": round(outcomes["registered"] / elapsed, 2) if elapsed else 0.0,
+        "attempts_per_second": round(args.registrations / elapsed, 2) if elapsed else 0.0,
+        "violations": {name: len(rows) for name, rows in violations.items()},
+        "violation_samples": {name: rows[:5] for name, rows in violations.items() if rows},
+        "passed": not errors and not any(violations.values()),
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes sharing the database")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent registrations per worker")
+    parser.add_argument("--registrations", type=int, default=5000, help="Total registrations to attempt")
+    parser.add_argument("--events", type=int, default=10, help="Events under test")
+    parser.add_argument("--seed-attendees", type=int, default=10_000, help="Attendees seeded before the run")
+    parser.add_argument("--free-spots", type=int, default=100, help="Spare capacity left on each event")
+    parser.add_argument("--duplicate-ratio", type=float, default=0.3, help="Share of attempts reusing an email")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the workload")
+    parser.add_argument("--startup-delay", type=float, default=3.0, help="Seconds to let workers start")
+    parser.add_argument("--timeout", type=float, default=600.0, help="Seconds to wait for each worker")
+    parser.add_argument("--data-dir", help="Directory for the database (default: temporary)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="stress-") as tmp:
+        args.data_dir = args.data_dir or tmp
+        report = run(args)
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())